@@ -15,7 +15,7 @@ def define_parser() -> dict:
     parser = ArgumentParser(
         prog="main.py",
         description="Propeller Optimization input and output arguments",
-        usage="%(prog)s [-f] <file> [-o]",
+        usage="%(prog)s [-f] <file> [-o] [-r] <checkpoint>",
     )
 
     parser.add_argument(
@@ -33,6 +33,14 @@ def define_parser() -> dict:
         required=False,
         default=os.path.join(os.getcwd(), "processing", "outputs"),
     )
+    parser.add_argument(
+        "-r",
+        "--resume",
+        type=str,
+        help="checkpoint '.npz' file of an interrupted optimization, which will continue at its next iteration",
+        required=False,
+        default=None,
+    )
 
     return parser.parse_args()
 
@@ -50,12 +58,15 @@ def main(arguments_parsed: argparse.Namespace) -> None:
     try:
         pipeline.read_data()
         pipeline.create_xfoil_instances()
+        pipeline.create_worker_pool()
         pipeline.optimize()
         pipeline.obtain_results()
     except Exception as e:
         logger.exception(e, stack_info=True)
 
         raise e
+    finally:
+        pipeline.close_worker_pool()
 
     print("-- Optimization Ended Successfully --")
 
@@ -1,8 +1,25 @@
 import time
 import numpy as np
-from multiprocessing.pool import Pool
-
-from .utilities.xfoil_management import XfoilManagement
+from collections import deque
+from contextlib import nullcontext
+from queue import Queue
+
+from .utilities.bet_kernel import (
+    FLIGHT_RESULTS,
+    blade_element_kernel,
+    flight_condition_terms,
+)
+from .utilities.constants import (
+    POLAR_COLUMNS,
+    SCALAR_RESULTS,
+    XFOIL_ITERATIONS,
+    XFOIL_PANELS,
+)
+from .utilities.polar_database import PolarDatabase
+from .utilities.xfoil_management import N_CRIT, XfoilManagement
+from .utilities.scratch_workspace import ScratchWorkspace
+from .utilities.timeout_policy import TimeoutPolicy
+from .utilities.worker_pool import WorkerPool
 
 
 class BladeElementTheory:
@@ -20,6 +37,19 @@ class BladeElementTheory:
         self.propeller_geometric_conditions = propeller_geometric_conditions
         self.AoA = propeller_geometric_conditions.get("AoAInMaximumEfficiency")
         self.q_xfoil_intances = kwargs.get("xfoil_instances", 1)
+        self.xfoil_instance = kwargs.get("xfoil_instance", None)
+        self.xfoil_instance_offset = kwargs.get("xfoil_instance_offset", 0)
+        self.scratch_workspace = kwargs.get("scratch_workspace", None)
+        self.xfoil_sessions = kwargs.get("xfoil_sessions", False)
+        self.timeout_policy = kwargs.get("timeout_policy", None)
+        self.section_coefficients = kwargs.get("section_coefficients", None)
+        self.section_results = kwargs.get("section_results", None)
+        self.polar_database = kwargs.get("polar_database", None)
+        self.worker_pool = kwargs.get("worker_pool", None)
+        self.terms = kwargs.get("terms", None)
+
+        if self.timeout_policy is None:
+            self.timeout_policy = TimeoutPolicy()
 
         self.results = dict()
 
@@ -31,251 +61,199 @@ class BladeElementTheory:
 
         :return: results of the propeller
         """
-        self.__calculate_tangencial_velocity()
-        self.__calculate_advance_rate()
-        self.__calculate_phi()
-        self.__calculate_resultant_velocity()
-        self.__calculate_reynolds_and_mach()
+        self.__calculate_flight_condition_terms()
         self.__calculate_Cl_and_Cd()
-        self.__calculate_gamma()
-        self.__calculate_dt_and_dq()
-        self.__calculate_efficiency()
+        self.__calculate_performance()
 
         return self.results
 
-    def __calculate_tangencial_velocity(self) -> None:
+    def operating_points(self) -> dict:
         """
-        Method responsible for calculating the tangencial
-        velocity of each part of the blade.
+        Method responsible for obtaining the operating point
+        of each section analysed by xfoil, as in the calcu-
+        lation of the propeller results. The mach number is
+        zero, as xfoil is executed without compressibility
+        correction.
+
+        :return: angle of attack, reynolds and mach numbers
+            per section
         """
-        self.tangencial_velocity = (
-            2.0
-            * np.pi
-            / 60.0
-            * np.array(self.flight_conditions.get("engineSpin"))
-            * np.array(self.propeller_geometric_conditions.get("radius"))
-        )
+        self.__calculate_flight_condition_terms()
 
-        self.results["tangencialVelocity"] = self.tangencial_velocity
+        return {section: (self.AoA, self.reynolds, 0.0) for section in self.airfoils}
 
-    def __calculate_advance_rate(self) -> None:
+    @staticmethod
+    def batch_results(terms: dict, cl: np.ndarray, cd: np.ndarray) -> list:
         """
-        Method responsible for calculating the advance rate
-        of the propeller.
+        Method responsible for calculating the results of a
+        batch of propellers in the same flight conditions,
+        as a whole swarm, with a single call of the blade
+        element kernel.
+
+        :param terms: flight condition quantities, of the
+            flight_condition_terms
+        :param cl: cl of shape (batch, sections)
+        :param cd: cd of shape (batch, sections)
+        ...
+        :return: results of each propeller of the batch
         """
-        self.advance_rate = (
-            60
-            * self.flight_conditions.get("speed")
-            * 1
-            / self.flight_conditions.get("engineSpin")
-            * 1
-            / self.propeller_geometric_conditions.get("bladeDiameter")
-        )
+        performance = blade_element_kernel(cl, cd, terms)
 
-        self.results["advanceRate"] = self.advance_rate
+        flight_results = {
+            name: (
+                float(terms.get(name))
+                if np.ndim(terms.get(name)) == 0
+                else terms.get(name)
+            )
+            for name in FLIGHT_RESULTS
+        }
+
+        return [
+            {
+                **flight_results,
+                "dt": performance.get("dt")[i],
+                "dq": performance.get("dq")[i],
+                **{name: float(performance.get(name)[i]) for name in SCALAR_RESULTS},
+            }
+            for i in range(len(performance.get("efficiency")))
+        ]
 
-    def __calculate_phi(self) -> None:
+    def __calculate_flight_condition_terms(self) -> None:
         """
-        Method responsible for calculating the phi values
-        along the blade section.
+        Method responsible for obtaining the quantities
+        which only depend on the flight conditions, as the
+        velocities, phi, reynolds and mach numbers along
+        the blade, unless they were given already.
         """
-        self.phi = np.arctan(
-            self.flight_conditions.get("speed") / self.tangencial_velocity
-        )
-        self.phi[-1] = 0.0
+        if self.terms is None:
+            self.terms = flight_condition_terms(
+                self.flight_conditions, self.propeller_geometric_conditions
+            )
 
-        self.results["phi"] = self.phi
+        self.phi = self.terms.get("phi")
+        self.reynolds = float(self.terms.get("reynolds"))
+        self.mach = self.terms.get("mach")
 
-    def __calculate_resultant_velocity(self) -> None:
+    def __calculate_performance(self) -> None:
         """
-        Method responsible for calculating the resultant
-        velocity along of the blade sections.
+        Method responsible for calculating the thrust, the
+        torque, their coefficients and the efficiency of the
+        propeller with the blade element kernel.
         """
-        self.resultant_velocity = self.tangencial_velocity / np.cos(self.phi)
-
-        self.results["resultantVelocity"] = self.resultant_velocity
+        cl_cd = np.array([sec[1:3] for sec in self.cl_cd_results], dtype=float)
 
-    def __calculate_reynolds_and_mach(self) -> None:
-        """
-        Method responsible for calculating the reynolds
-        number and the mach number along the blade sec-
-        tions.
-        """
-        self.reynolds = (
-            self.flight_conditions.get("airDensity")
-            * self.flight_conditions.get("speed")
-            * self.propeller_geometric_conditions.get("bladeDiameter")
-            / self.flight_conditions.get("viscosity")
-        )
-        self.mach = self.resultant_velocity / np.sqrt(
-            1.4 * 287 * self.flight_conditions.get("temperature")
-        )
-
-        self.results["reynolds"] = self.reynolds
-        self.results["mach"] = self.mach
+        self.results = self.batch_results(
+            self.terms, cl_cd[None, :, 0], cl_cd[None, :, 1]
+        )[0]
+        self.efficiency = self.results.get("efficiency")
 
     def __calculate_Cl_and_Cd(self) -> None:
         """
         Method responsible for calculating the cl and
-        cd coefficients of each blade section.
+        cd coefficients of each blade section. If a
+        single xfoil instance is reserved for this
+        propeller, the sections are executed one after
+        another in it, else they are scheduled among the
+        available xfoil instances of the worker pool of
+        the run (a temporary one, if not given). The ses-
+        sions of the xfoil instances live in this process,
+        so they are driven by threads instead of worker
+        processes. The deadline of the xfoil runs is given
+        by the timeout policy, which records each run. If
+        the coefficients of the sections are given, xfoil
+        is not executed, and if the results of their xfoil
+        runs are given, they are only recorded.
         """
+        if self.section_coefficients is not None:
+            self.cl_cd_results = [
+                (section, *self.section_coefficients.get(section), None)
+                for section in self.airfoils
+            ]
 
-        def split_instances_per_time() -> dict:
-            """
-            Method responsible for splitting the airfoils
-            to be executed in xfoil in a corresponding x-
-            foil instance per time of execution (upper li-
-            mit for xfoil instances available).
-
-            :return: airfoils splitted in a corresponding
-                xfoil instance to be executed per time.
-            """
-            splines_copy = list(self.airfoils.items())
-            t_inst_airf = dict()
-            t = 0
-
-            while True:
-                t_inst_airf[t] = list()
-                for inst in range(self.q_xfoil_intances):
-                    if not len(splines_copy):
-                        break
-
-                    t_inst_airf[t].append((inst, splines_copy[0]))
-                    splines_copy.pop(0)
-
-                if not len(splines_copy):
-                    break
-
-                t += 1
+            return
 
-            return t_inst_airf
-
-        time_instances = split_instances_per_time()
-
-        results = list()
-        for t in time_instances:
-            p_instances = Pool(processes=self.q_xfoil_intances)
-            results_t = p_instances.starmap(
-                execute_xfoil,
-                [
+        configuration = TimeoutPolicy.configuration(
+            XFOIL_PANELS, XFOIL_ITERATIONS, self.reynolds
+        )
+        timeout = self.timeout_policy.timeout(configuration)
+
+        if self.section_results is not None:
+            self.cl_cd_results = [
+                self.section_results.get(section) for section in self.airfoils
+            ]
+            self.__record_xfoil_runs(configuration)
+
+            return
+
+        if self.xfoil_instance is not None:
+            self.cl_cd_results = [
+                execute_xfoil(
+                    spline,
+                    self.xfoil_instance,
+                    section,
+                    self.AoA,
+                    self.reynolds,
+                    self.mach,
+                    self.scratch_workspace,
+                    self.xfoil_sessions,
+                    timeout,
+                    self.polar_database,
+                )
+                for section, spline in self.airfoils.items()
+            ]
+            self.__record_xfoil_runs(configuration)
+
+            return
+
+        with (
+            nullcontext(self.worker_pool)
+            if self.worker_pool is not None
+            else WorkerPool(self.q_xfoil_intances)
+        ) as worker_pool:
+            results = dict(
+                schedule_xfoil(
+                    worker_pool,
+                    [
+                        (section, spline, section)
+                        for section, spline in self.airfoils.items()
+                    ],
+                    [
+                        self.xfoil_instance_offset + inst
+                        for inst in range(self.q_xfoil_intances)
+                    ],
                     (
-                        section_caract[1],
-                        inst,
-                        section_caract[0],
                         self.AoA,
                         self.reynolds,
                         self.mach,
-                    )
-                    for inst, section_caract in time_instances.get(t)
-                ],
-            )
-
-            results += results_t
-
-        self.cl_cd_results = results
-
-    def __calculate_gamma(self) -> None:
-        """
-        Method responsible for calculating the gamma
-        results per section of the blade.
-        """
-        self.gamma = [
-            np.arctan(sec[2] / sec[1]) if sec[1] != 0 else None
-            for sec in self.cl_cd_results
-        ]
-
-    def __calculate_dt_and_dq(self) -> None:
-        """
-        Method responsible for calculating the Ct and
-        Cq coefficients.
-        """
-        q = (
-            0.5
-            * self.flight_conditions.get("airDensity")
-            * self.flight_conditions.get("speed") ** 2
-        )
-
-        den = lambda secao: np.cos(self.gamma[secao]) * np.sin(self.phi[secao]) ** 2
-
-        self.dt = [
-            (
-                (
-                    q
-                    * sec[1]
-                    * self.propeller_geometric_conditions.get("chord")[sec[0]]
-                    * np.cos(self.phi[sec[0]] + self.gamma[sec[0]])
-                    / den(sec[0])
+                        self.scratch_workspace,
+                        self.xfoil_sessions,
+                        timeout,
+                        self.polar_database,
+                    ),
+                    threads=self.xfoil_sessions,
                 )
-                if self.gamma[sec[0]] is not None
-                else 0
             )
-            for sec in self.cl_cd_results
-        ]
-        self.dt.append(0)
-
-        self.dq = [
-            (
-                (
-                    q
-                    * sec[1]
-                    * self.propeller_geometric_conditions.get("chord")[sec[0]]
-                    * self.propeller_geometric_conditions.get("radius")[sec[0]]
-                    * np.sin(self.phi[sec[0]] + self.gamma[sec[0]])
-                    / den(sec[0])
-                )
-                if self.gamma[sec[0]] is not None
-                else 0
-            )
-            for sec in self.cl_cd_results
-        ]
-        self.dq.append(0)
 
-        self.results["dt"] = self.dt
-        self.results["dq"] = self.dq
+        self.cl_cd_results = [results.get(section) for section in self.airfoils]
+        self.__record_xfoil_runs(configuration)
 
-    def __calculate_efficiency(self) -> None:
-        """
-        Method responsible for calculating the propeller
-        efficiency.
+    def __record_xfoil_runs(self, configuration: tuple) -> None:
         """
+        Method responsible for recording the xfoil runs of
+        the sections in the timeout policy, and the results
+        found in the polar database, which are not runs.
 
-        def integrate(y: list, x: list):
-            i = 0
-            for n in range(1, len(x)):
-                i += (x[n] - x[n - 1]) * (y[n] + y[n - 1]) / 2
-
-            return i
-
-        traction = integrate(self.dt, self.propeller_geometric_conditions.get("radius"))
-        torque = integrate(self.dq, self.propeller_geometric_conditions.get("radius"))
-
-        n = self.flight_conditions.get("engineSpin") / 60
-
-        t_coeffic = traction / (
-            self.flight_conditions.get("airDensity")
-            * n**2
-            * self.propeller_geometric_conditions.get("bladeDiameter") ** 4
-        )
-        q_coeffic = torque / (
-            self.flight_conditions.get("airDensity")
-            * n**2
-            * self.propeller_geometric_conditions.get("bladeDiameter") ** 5
-        )
-        p_coeffic = 2 * np.pi * q_coeffic
-
-        self.efficiency = (
-            self.advance_rate * t_coeffic / p_coeffic if p_coeffic != 0 else None
-        )
+        :param configuration: configuration key of the runs
+        """
+        for _, cl, cd, run in self.cl_cd_results:
+            if run is None:
+                continue
 
-        if self.efficiency is None:
-            self.efficiency = np.random.uniform(low=0, high=0.1)
+            if self.polar_database is not None:
+                self.polar_database.record(int(run["cached"]), int(not run["cached"]))
 
-        self.results["traction"] = traction
-        self.results["torque"] = torque
-        self.results["tCoefficient"] = t_coeffic
-        self.results["qCoefficient"] = q_coeffic
-        self.results["pCoefficient"] = p_coeffic
-        self.results["efficiency"] = self.efficiency
+            if not run["cached"]:
+                self.timeout_policy.record(configuration, run, (cl, cd) == (0, 1))
 
 
 def execute_xfoil(
@@ -285,11 +263,19 @@ def execute_xfoil(
     alpha: float,
     reynolds: float,
     mach: float,
+    scratch_workspace: ScratchWorkspace = None,
+    xfoil_session: bool = False,
+    timeout: float = 1.0,
+    polar_database: PolarDatabase = None,
 ) -> tuple:
     """
     Method responsible for executing an instance
     of xfoil, aiming the airfoil Cl and Cd
-    results.
+    results. If the polar database is given, it is
+    consulted before xfoil, and the converged results
+    are stored in it. As the viscous solution is exe-
+    cuted without compressibility correction, it is
+    stored with the mach number zero.
 
     :param spline: spline file to be entered in
         the xfoil.
@@ -300,23 +286,188 @@ def execute_xfoil(
     :param alpha: angle of attack used.
     :param reynolds: reynolds number
     :param mach: mach number
+    :param scratch_workspace: workspace of the xfoil
+        files, if None, the default one is used.
+    :param xfoil_session: if True, the long-lived ses-
+        sion of the xfoil instance is used.
+    :param timeout: deadline of the xfoil run, in seconds
+    :param polar_database: database of the xfoil results
     ...
-    :return: cl and cd results.
+    :return: cl and cd results, and the statistics of
+        the xfoil run, None if xfoil was not executed.
     """
     if spline is None:
-        return section, 0, 1
+        return section, 0, 1, None
+
+    if polar_database is not None:
+        airfoil = PolarDatabase.airfoil_hash(spline)
+        point = (alpha, reynolds, 0.0)
+        configuration = (N_CRIT, XFOIL_PANELS, XFOIL_ITERATIONS)
+
+        ((cl, cd),) = polar_database.lookup(airfoil, point, configuration)
+        if not np.isnan(cl):
+            return (
+                section,
+                cl,
+                cd,
+                {"runTime": 0.0, "timedOut": False, "killed": False, "cached": True},
+            )
 
-    xfoil_instance = XfoilManagement(reynolds, mach)
+    xfoil_instance = XfoilManagement(reynolds, mach, scratch_workspace)
     xfoil_instance.execute_xfoil(
         splines_file=spline,
         l_AoA=alpha,
         u_AoA=alpha,
         AoA_step=0,
-        iter=200,
+        iter=XFOIL_ITERATIONS,
         viscous=True,
         ch_pannels=True,
         xfoil_instance=xfoil_instance_numb,
+        session=xfoil_session,
+        timeout=timeout,
     )
     cl, cd = xfoil_instance.obtain_cl_cd()
 
-    return section, cl, cd
+    if polar_database is not None and (cl, cd) != (0, 1):
+        polar_database.store(airfoil, point, [(cl, cd)], configuration)
+
+    return section, cl, cd, xfoil_instance.run_statistics
+
+
+def schedule_xfoil(
+    worker_pool: WorkerPool,
+    tasks: list,
+    xfoil_instances: list,
+    arguments: tuple,
+    threads: bool = False,
+):
+    """
+    Method responsible for executing the sections of
+    many airfoils from a single queue, in which each
+    xfoil instance takes the next section as soon as
+    it is free, without waiting for the other instan-
+    ces. The results are given as each section ends.
+
+    :param worker_pool: worker pool which executes the
+        xfoil runs
+    :param tasks: list of (key, spline, section) of each
+        section to be executed
+    :param xfoil_instances: numbers of the xfoil instan-
+        ces, each one running a single section at a time
+    :param arguments: angle of attack, reynolds and mach
+        numbers, scratch workspace, xfoil session, timeout
+        and polar database of the sections, as in exe-
+        cute_xfoil
+    :param threads: if True, the sections are executed by
+        the threads of the worker pool
+    ...
+    :return: iterator of the key and the execute_xfoil re-
+        sult of each section, in the order they end
+    """
+    tasks = deque(tasks)
+    completed = Queue()
+
+    def submit(xfoil_instance: int) -> None:
+        """
+        Method responsible for submitting the next section
+        to an xfoil instance, which is given back with the
+        result of the section.
+
+        :param xfoil_instance: number of the free xfoil in-
+            stance
+        """
+        key, spline, section = tasks.popleft()
+        worker_pool.submit(
+            execute_xfoil,
+            (spline, xfoil_instance, section, *arguments),
+            lambda result: completed.put((xfoil_instance, key, result)),
+            threads,
+        )
+
+    running = 0
+    for xfoil_instance in xfoil_instances[: len(tasks)]:
+        submit(xfoil_instance)
+        running += 1
+
+    while running:
+        xfoil_instance, key, result = completed.get()
+        running -= 1
+
+        if isinstance(result, BaseException):
+            raise result
+
+        if tasks:
+            submit(xfoil_instance)
+            running += 1
+
+        yield key, result
+
+
+def execute_xfoil_polar(
+    spline: str,
+    xfoil_instance_numb: int,
+    section: int,
+    points: np.ndarray,
+    timeout: float = 1.0,
+    polar_database: PolarDatabase = None,
+    session: bool = True,
+    scratch_workspace: ScratchWorkspace = None,
+) -> tuple:
+    """
+    Method responsible for executing many operating
+    points of an airfoil in a single run of an xfoil
+    instance. If the polar database is given, only
+    the points not found in it are executed, and the
+    converged ones are stored in it.
+
+    :param spline: spline file to be entered in
+        the xfoil.
+    :param xfoil_instance_numb: the specific num-
+        ber of the xfoil instance.
+    :param section: the section number of the
+        blade.
+    :param points: array of shape (points, 3) with
+        the angle of attack, reynolds and mach numbers
+    :param timeout: deadline per operating point, in
+        seconds
+    :param polar_database: database of the xfoil results
+    :param session: if False, the points are executed by a
+        new xfoil process from a file of commands, instead
+        of the session of the xfoil instance
+    :param scratch_workspace: workspace of the xfoil files
+    ...
+    :return: section and its polar
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    missing = np.ones(len(points), dtype=bool)
+
+    if polar_database is not None and spline is not None:
+        airfoil = PolarDatabase.airfoil_hash(spline)
+        configuration = (N_CRIT, XFOIL_PANELS, XFOIL_ITERATIONS)
+
+        stored = polar_database.lookup(airfoil, points, configuration)
+        missing = np.isnan(stored[:, 0])
+
+    polar = np.zeros((len(points), len(POLAR_COLUMNS)))
+    polar[:, :3] = points
+    polar[missing] = XfoilManagement.execute_xfoil_polar(
+        splines_file=spline,
+        points=points[missing],
+        iter=XFOIL_ITERATIONS,
+        xfoil_instance=xfoil_instance_numb,
+        timeout=timeout,
+        session=session,
+        scratch_workspace=scratch_workspace,
+    )
+
+    if polar_database is not None and spline is not None:
+        polar[~missing, 3:5] = stored[~missing]
+        polar[~missing, 5] = 1
+
+        converged = missing & (polar[:, 5] == 1)
+        polar_database.store(
+            airfoil, points[converged], polar[converged, 3:5], configuration
+        )
+        polar_database.record(int(np.sum(~missing)), int(np.sum(missing)))
+
+    return section, polar
@@ -2,6 +2,7 @@ import json
 import argparse
 
 from ..utilities.exceptions import *
+from ..utilities.xfoil_sandbox import available_cpus
 from .data_validation import DataValidation
 
 
@@ -27,6 +28,8 @@ class DataReader:
         self.__instantiate_variables()
         self.__airfoil_shape_validation()
         self.__xfoil_instances_validation()
+        self.__islands_validation()
+        self.__optimizer_validation()
 
     def __pre_reading_validation(self):
         """
@@ -75,9 +78,34 @@ class DataReader:
     def __xfoil_instances_validation(self):
         """
         Method responsible for validating the
-        maximum number of xfoil instances for
-        optimization.
+        number of xfoil instances for optimiza-
+        tion. If not passed, the CPUs available
+        to the process are shared among the is-
+        lands.
         """
-        self.validator.check_maximum_xfoil_instances(
+        self.validator.check_xfoil_instances(
             self.optimization_data.get("xfoilInstances")
         )
+
+        if self.optimization_data.get("xfoilInstances") is None:
+            islands = self.optimization_data.get("islands", 1)
+            if (not isinstance(islands, int)) or islands < 1:
+                islands = 1
+
+            self.optimization_data["xfoilInstances"] = max(
+                available_cpus() // islands, 1
+            )
+
+    def __islands_validation(self):
+        """
+        Method responsible for validating the
+        island model parameters.
+        """
+        self.validator.check_islands(self.optimization_data)
+
+    def __optimizer_validation(self):
+        """
+        Method responsible for validating the
+        optimizer parameters.
+        """
+        self.validator.check_optimizer(self.optimization_data)
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 
-from typing import NamedTuple, List
+from typing import NamedTuple, List, Dict
 
 
 class Particle(NamedTuple):
@@ -12,3 +12,100 @@ class Particle(NamedTuple):
     points_a: np.ndarray
     splines: List[np.ndarray]
     results: pd.DataFrame
+
+
+class Swarm:
+    def __init__(self, quantity_of_particles: int, quantity_of_variables: int) -> None:
+        """
+        Structure of arrays holding the state of the swarm,
+        where each row corresponds to the particle with the
+        same id.
+
+        :param quantity_of_particles: number of particles
+        :param quantity_of_variables: number of variables of
+            each particle
+        """
+        self.positions = np.zeros((quantity_of_particles, quantity_of_variables))
+        self.velocities = np.zeros((quantity_of_particles, quantity_of_variables))
+        self.p_best = np.zeros((quantity_of_particles, quantity_of_variables))
+        self.p_best_obj = np.zeros(quantity_of_particles)
+        self.objective = np.zeros(quantity_of_particles)
+
+        self.g_best = np.zeros(quantity_of_variables)
+        self.g_best_obj = 0.0
+        self.g_best_id = 0
+
+    def load_particles(
+        self, particles: Dict[int, Particle], ids: np.ndarray = None
+    ) -> None:
+        """
+        Method responsible for gathering the variables and
+        the objective function values of the particles into
+        the swarm arrays.
+
+        :param particles: dict of particles
+        :param ids: ids of the particles to be gathered, if
+            None, all particles are gathered.
+        """
+        ids = np.arange(len(self.objective)) if ids is None else ids
+
+        self.positions[ids] = np.array([particles[id_part].variables for id_part in ids])
+        self.objective[ids] = np.fromiter(
+            (particles[id_part].objective_function for id_part in ids),
+            dtype=float,
+            count=len(ids),
+        )
+
+    def export_particles(
+        self, particles: Dict[int, Particle], ids: np.ndarray = None
+    ) -> None:
+        """
+        Method responsible for writing the swarm arrays back
+        into the per particle dict view.
+
+        :param particles: dict of particles to be updated
+        :param ids: ids of the particles to be written, if
+            None, all particles are written.
+        """
+        ids = np.arange(len(self.objective)) if ids is None else ids
+
+        for id_part in ids:
+            particles[id_part] = particles[id_part]._replace(
+                objective_function=float(self.objective[id_part]),
+                variables=self.positions[id_part].copy(),
+                velocity=self.velocities[id_part].copy(),
+            )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Method responsible for exporting the swarm state
+        as a dict of arrays.
+
+        :return: swarm arrays by name
+        """
+        return {
+            "positions": self.positions,
+            "velocities": self.velocities,
+            "p_best": self.p_best,
+            "p_best_obj": self.p_best_obj,
+            "objective": self.objective,
+            "g_best": self.g_best,
+            "g_best_obj": np.array(self.g_best_obj),
+            "g_best_id": np.array(self.g_best_id),
+        }
+
+    def from_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Method responsible for restoring the swarm state
+        from a dict of arrays, as exported by to_arrays.
+
+        :param arrays: swarm arrays by name
+        """
+        self.positions[:] = arrays["positions"]
+        self.velocities[:] = arrays["velocities"]
+        self.p_best[:] = arrays["p_best"]
+        self.p_best_obj[:] = arrays["p_best_obj"]
+        self.objective[:] = arrays["objective"]
+        self.g_best[:] = arrays["g_best"]
+        self.g_best_obj = float(arrays["g_best_obj"])
+        self.g_best_id = int(arrays["g_best_id"])
@@ -104,19 +104,133 @@ class DataValidation:
         if not "yPoints" in data:
             raise MissingKeysError("There is no key called 'yPoints'")
 
-        if (len(data.get("xPoints")) != 5) or (len(data.get("yPoints")) != 5):
-            raise ErrorAirfoilShape("The lenght of the airfoil shape is not 5!")
+        if len(data.get("xPoints")) != len(data.get("yPoints")):
+            raise ErrorAirfoilShape(
+                "The lenghts of 'xPoints' and 'yPoints' are not equal!"
+            )
+
+        if len(data.get("xPoints")) < 5:
+            raise ErrorAirfoilShape("The lenght of the airfoil shape is less than 5!")
 
-    def check_maximum_xfoil_instances(self, xfoil_instances: int):
+    def check_xfoil_instances(self, xfoil_instances: int):
         """
         Method responsible for validating the
-        maximum number of xfoil instances for
-        optimization.
+        number of xfoil instances for optimiza-
+        tion, if passed.
 
         :param xfoil_instances: numer of xfoil
             instances intended to use.
         """
-        if xfoil_instances > 10:
+        if xfoil_instances is None:
+            return
+
+        if (not isinstance(xfoil_instances, int)) or xfoil_instances < 1:
             raise ErrorMaximumXfoilInstances(
-                "The maximum number of airfoil instances is 10"
+                "The number of xfoil instances must be an integer greater than 0"
+            )
+
+    def check_islands(self, optimization_data: dict) -> None:
+        """
+        Method responsible for validating the island model
+        parameters of the optimization, if passed.
+
+        :param optimization_data: optimization input data
+        """
+        islands = optimization_data.get("islands", 1)
+        migration_interval = optimization_data.get("migrationInterval", 5)
+        topology = optimization_data.get("migrationTopology", "ring")
+
+        if (not isinstance(islands, int)) or islands < 1:
+            raise ErrorIslandsParameters(
+                "The number of islands must be an integer greater than 0"
+            )
+
+        if (not isinstance(migration_interval, int)) or migration_interval < 1:
+            raise ErrorIslandsParameters(
+                "The migration interval must be an integer greater than 0"
+            )
+
+        if topology not in MIGRATION_TOPOLOGIES:
+            raise ErrorIslandsParameters(
+                "The migration topology must be one of: "
+                + ", ".join(MIGRATION_TOPOLOGIES)
+            )
+
+    def check_optimizer(self, optimization_data: dict) -> None:
+        """
+        Method responsible for validating the optimizer
+        chosen for the optimization, if passed.
+
+        :param optimization_data: optimization input data
+        """
+        optimizer = optimization_data.get("optimizer", "pso")
+
+        if optimizer not in OPTIMIZER_NAMES:
+            raise ErrorOptimizerParameters(
+                "The optimizer must be one of: " + ", ".join(OPTIMIZER_NAMES)
+            )
+
+        if optimization_data.get("asynchronous", False) and optimizer != "pso":
+            raise ErrorOptimizerParameters(
+                "The asynchronous mode is only available for the pso optimizer"
+            )
+
+        if optimization_data.get("initialSampling", "uniform") not in INITIAL_SAMPLINGS:
+            raise ErrorOptimizerParameters(
+                "The initial sampling must be one of: " + ", ".join(INITIAL_SAMPLINGS)
+            )
+
+        if (
+            optimization_data.get("aerodynamicBackend", "xfoil")
+            not in AERODYNAMIC_BACKENDS
+        ):
+            raise ErrorOptimizerParameters(
+                "The aerodynamic backend must be one of: "
+                + ", ".join(AERODYNAMIC_BACKENDS)
+            )
+
+        if optimizer == "pso":
+            return
+
+        if optimization_data.get("islands", 1) > 1:
+            raise ErrorOptimizerParameters(
+                "The island model is only available for the pso optimizer"
+            )
+
+        if optimization_data.get("quantityOfParticles") < 4:
+            raise ErrorOptimizerParameters(
+                "The optimizer {optimizer} needs at least 4 particles".format(
+                    optimizer=optimizer
+                )
+            )
+
+        cmaes_sigma = optimization_data.get("cmaesSigma", None)
+        mutation_factor = optimization_data.get("deMutationFactor", 0.5)
+        crossover_rate = optimization_data.get("deCrossoverRate", 0.9)
+        candidates = optimization_data.get("surrogateCandidates", 2000)
+
+        if cmaes_sigma is not None and (
+            (not isinstance(cmaes_sigma, (int, float))) or cmaes_sigma <= 0
+        ):
+            raise ErrorOptimizerParameters(
+                "The cmaes sigma must be a number greater than 0"
+            )
+
+        if (not isinstance(mutation_factor, (int, float))) or not (
+            0 < mutation_factor <= 2
+        ):
+            raise ErrorOptimizerParameters(
+                "The differential evolution mutation factor must be in (0, 2]"
+            )
+
+        if (not isinstance(crossover_rate, (int, float))) or not (
+            0 <= crossover_rate <= 1
+        ):
+            raise ErrorOptimizerParameters(
+                "The differential evolution crossover rate must be in [0, 1]"
+            )
+
+        if (not isinstance(candidates, int)) or candidates < 1:
+            raise ErrorOptimizerParameters(
+                "The number of surrogate candidates must be an integer greater than 0"
             )
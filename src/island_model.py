@@ -0,0 +1,247 @@
+import os
+import numpy as np
+from queue import Empty
+from multiprocessing import Process, Queue
+from typing import List
+
+from .data_modules.data_reader import DataReader
+from .data_modules.data_structures import Particle
+from .optimizer import PSO
+from .utilities.constants import (
+    CHECKPOINT_FILENAME,
+    HISTORY_DIRNAME,
+    ISLAND_POLLING_INTERVAL,
+)
+from .utilities.exceptions import ErrorIslandsParameters
+from .utilities.worker_pool import WorkerPool
+
+
+class Migration:
+    def __init__(self, interval: int, inbox: Queue, neighbours: List[Queue]) -> None:
+        """
+        Channel used by one island for exchanging its best
+        particle with the neighbour islands.
+
+        :param interval: number of iterations between each
+            migration
+        :param inbox: queue where the immigrants arrive
+        :param neighbours: inboxes of the islands which
+            receive the emigrants of this island
+        """
+        self.interval = interval
+        self.inbox = inbox
+        self.neighbours = neighbours
+
+    def exchange(self, emigrant: Particle) -> List[Particle]:
+        """
+        Method responsible for sending the best particle to
+        the neighbour islands and collecting the particles
+        already received, without waiting for the islands
+        which are late or have already finished.
+
+        :param emigrant: best particle of the island, if
+            None, only the received particles are collected
+        ...
+        :return: particles received from other islands
+        """
+        if emigrant is not None:
+            for neighbour in self.neighbours:
+                neighbour.put(emigrant)
+
+        immigrants = list()
+        while True:
+            try:
+                immigrants.append(self.inbox.get_nowait())
+            except Empty:
+                break
+
+        return immigrants
+
+
+class IslandModel:
+    def __init__(self, data_reader: DataReader, uuid: str, results_dir: str) -> None:
+        self.data_reader = data_reader
+        self.uuid = uuid
+        self.results_dir = results_dir
+
+        self.quantity_of_islands = data_reader.optimization_data.get("islands", 1)
+        self.migration_interval = data_reader.optimization_data.get(
+            "migrationInterval", 5
+        )
+        self.topology = data_reader.optimization_data.get("migrationTopology", "ring")
+
+        self.g_best_per_island = dict()
+        self.evaluation_cache_per_island = dict()
+
+    def optimize(self) -> PSO:
+        """
+        Method responsible for running one PSO swarm per
+        island, each one in a separate process with its
+        own slice of xfoil instances, and returning the
+        swarm with the best result.
+
+        :return: PSO instance of the best island
+        """
+        inboxes = [Queue() for _ in range(self.quantity_of_islands)]
+        results = Queue()
+        seeds = np.random.SeedSequence().spawn(self.quantity_of_islands)
+
+        processes = [
+            Process(
+                target=run_island,
+                args=(
+                    island,
+                    self.data_reader,
+                    self.uuid,
+                    self.results_dir,
+                    Migration(
+                        self.migration_interval,
+                        inboxes[island],
+                        [inboxes[n] for n in self.__neighbours(island)],
+                    ),
+                    int(seeds[island].generate_state(1)[0]),
+                    results,
+                ),
+            )
+            for island in range(self.quantity_of_islands)
+        ]
+
+        for process in processes:
+            process.start()
+
+        states = self.__collect_states(processes, results)
+
+        for process in processes:
+            process.join()
+
+        self.g_best_per_island = {
+            island: state.get("swarm").g_best_obj for island, state in states.items()
+        }
+        self.evaluation_cache_per_island = {
+            island: state.get("evaluation_cache") for island, state in states.items()
+        }
+        best_island = max(self.g_best_per_island, key=self.g_best_per_island.get)
+
+        optimization_instance = PSO(
+            data_reader=self.data_reader,
+            uuid=self.uuid,
+            results_dir=self.results_dir,
+        )
+        optimization_instance.import_state(states.get(best_island))
+
+        return optimization_instance
+
+    @staticmethod
+    def __collect_states(processes: List[Process], results: Queue) -> dict:
+        """
+        Method responsible for waiting the states of all the
+        islands, checking their processes while waiting. If
+        an island exits without posting its state, as when
+        it raises or is killed, the other islands are termi-
+        nated.
+
+        :param processes: processes of the islands
+        :param results: queue where the islands put their
+            results
+        ...
+        :return: state of each island
+        """
+        states = dict()
+
+        while len(states) < len(processes):
+            try:
+                island, state = results.get(timeout=ISLAND_POLLING_INTERVAL)
+                states[island] = state
+                continue
+            except Empty:
+                pass
+
+            failed = [
+                island
+                for island, process in enumerate(processes)
+                if island not in states
+                and process.exitcode is not None
+                and process.exitcode != 0
+            ]
+            if not failed:
+                continue
+
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+            raise ErrorIslandsParameters(
+                f"The island {failed[0]} exited with code "
+                f"{processes[failed[0]].exitcode} without its results"
+            )
+
+        return states
+
+    def __neighbours(self, island: int) -> List[int]:
+        """
+        Method responsible for obtaining the islands which
+        receive the emigrants of an island, according to
+        the migration topology.
+
+        :param island: island number
+        ...
+        :return: neighbour islands numbers
+        """
+        if self.quantity_of_islands == 1:
+            return list()
+
+        if self.topology == "fullyConnected":
+            return [n for n in range(self.quantity_of_islands) if n != island]
+
+        return [(island + 1) % self.quantity_of_islands]
+
+
+def run_island(
+    island: int,
+    data_reader: DataReader,
+    uuid: str,
+    results_dir: str,
+    migration: Migration,
+    seed: int,
+    results: Queue,
+) -> None:
+    """
+    Method responsible for running the PSO swarm of one
+    island, in its own process, with its own worker pool.
+
+    :param island: island number
+    :param data_reader: data reader of the input
+    :param uuid: uuid of the execution
+    :param results_dir: output directory
+    :param migration: migration channel of the island
+    :param seed: seed of the random generator of the island
+    :param results: queue where the results of the island
+        are put when the optimization ends
+    """
+    np.random.seed(seed)
+
+    with WorkerPool.from_optimization_data(
+        data_reader.optimization_data, preload=(PSO.__module__,)
+    ) as worker_pool:
+        optimization_instance = PSO(
+            data_reader=data_reader,
+            uuid=uuid,
+            results_dir=results_dir,
+            checkpoint_file=os.path.join(
+                results_dir, f"island{island}_{CHECKPOINT_FILENAME}"
+            ),
+            history_dir=os.path.join(
+                results_dir, f"island{island}_{HISTORY_DIRNAME}"
+            ),
+            xfoil_instance_offset=island
+            * data_reader.optimization_data.get("xfoilInstances"),
+            migration=migration,
+            worker_pool=worker_pool,
+        )
+        optimization_instance.set_initial_conditions()
+        optimization_instance.iterate()
+
+    for neighbour in migration.neighbours:
+        neighbour.cancel_join_thread()
+
+    results.put((island, optimization_instance.export_state()))
@@ -1,14 +1,27 @@
+from contextlib import nullcontext
 from typing import Dict
 
 import numpy as np
+from scipy.stats import qmc
 
 from .utilities.geometry_management import GeometryManagement
 from .data_modules.data_structures import Particle
 from .utilities.constants import (
     LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE,
+    SCREENED_OBJECTIVE_FUNCTION,
+    SCREENING_MINIMUM_THICKNESS,
+    XFOIL_ITERATIONS,
+    XFOIL_PANELS,
 )
+from .utilities.geometry_kernel import airfoil_shape_metrics
+from .utilities.panel_method import panel_coefficients
 from .utilities.airfoil_creation import AirfoilCreation
-from .blade_element_theory import BladeElementTheory
+from .utilities.bet_kernel import flight_condition_terms
+from .utilities.exceptions import ErrorAirfoilShape
+from .utilities.scratch_workspace import ScratchWorkspace
+from .utilities.timeout_policy import TimeoutPolicy
+from .utilities.worker_pool import WorkerPool
+from .blade_element_theory import BladeElementTheory, schedule_xfoil
 
 
 class ObjectiveFunction:
@@ -28,6 +41,19 @@ class ObjectiveFunction:
         self.uuid = uuid
         self.airfoil_shape = kwargs.get("airfoil_shape", None)
         self.xfoil_instances = kwargs.get("xfoil_instances", 1)
+        self.xfoil_instance = kwargs.get("xfoil_instance", None)
+        self.xfoil_instance_offset = kwargs.get("xfoil_instance_offset", 0)
+        self.evaluation_cache = kwargs.get("evaluation_cache", None)
+        self.initial_sampling = kwargs.get("initial_sampling", "uniform")
+        self.scratch_workspace = kwargs.get("scratch_workspace", None)
+        self.xfoil_sessions = kwargs.get("xfoil_sessions", False)
+        self.timeout_policy = kwargs.get("timeout_policy", None)
+        self.aerodynamic_backend = kwargs.get("aerodynamic_backend", "xfoil")
+        self.polar_database = kwargs.get("polar_database", None)
+        self.worker_pool = kwargs.get("worker_pool", None)
+
+        if self.scratch_workspace is None:
+            self.scratch_workspace = ScratchWorkspace()
 
         self.geometry_management = GeometryManagement()
         self.p_points = None
@@ -40,15 +66,71 @@ class ObjectiveFunction:
         """
         self.__create_bezier_initial_points()
         self.__set_initial_variables()
-        self.__calculate_objective_function()
+        self.__calculate_objective_function(self.__screen_particles())
+        self.__write_evaluation_cache()
 
     def set_new_conditions(self) -> None:
         """
         Method responsible for setting a new condition to
-        update the objective function value.
+        update the objective function value. Particles
+        already evaluated with the same variables are ta-
+        ken from the evaluation cache, and the infeasible
+        ones are screened out before executing xfoil.
         """
-        self.__update_geometry()
-        self.__calculate_objective_function()
+        particles_ids = self.__read_evaluation_cache()
+
+        self.__update_geometry(particles_ids)
+        feasible_ids = self.__screen_particles(particles_ids)
+        self.__calculate_objective_function(feasible_ids)
+        self.__write_evaluation_cache(particles_ids)
+
+    def __read_evaluation_cache(self) -> list:
+        """
+        Method responsible for restoring the objective
+        function, the results and the splines of the
+        particles found in the evaluation cache.
+
+        :return: ids of the particles which were not
+            found and must be evaluated.
+        """
+        if self.evaluation_cache is None:
+            return list(self.particles.keys())
+
+        particles_ids = list()
+        for particle_id, particle in self.particles.items():
+            evaluation = self.evaluation_cache.get(particle.variables)
+
+            if evaluation is None:
+                particles_ids.append(particle_id)
+                continue
+
+            objective_function, results, splines = evaluation
+            self.particles[particle_id] = particle._replace(
+                objective_function=objective_function,
+                results=results,
+                splines=splines,
+            )
+
+        return particles_ids
+
+    def __write_evaluation_cache(self, particles_ids: list = None) -> None:
+        """
+        Method responsible for storing the evaluations of
+        the particles in the evaluation cache.
+
+        :param particles_ids: ids of the particles evalua-
+            ted, if None, all particles are stored.
+        """
+        if self.evaluation_cache is None:
+            return
+
+        particles_ids = self.particles.keys() if particles_ids is None else particles_ids
+        for particle_id in particles_ids:
+            particle = self.particles.get(particle_id)
+            self.evaluation_cache.put(
+                particle.variables,
+                (particle.objective_function, particle.results, particle.splines),
+            )
 
     def __create_bezier_initial_points(self) -> None:
         """
@@ -74,104 +156,227 @@ class ObjectiveFunction:
         """
         Method responsible for setting the initial variables,
         related to a number value added to one bezier point.
+        The feasible sub-intervals of each section are com-
+        puted once, and the variables of all the particles
+        are drawn from them at once, by the initial sampling
+        chosen. The sections whose airfoil is auto intersec-
+        ted are drawn again, alone.
         """
 
-        def choose_random_variable(section: int) -> float:
+        def draw_unit_samples(quantity: int, dimensions: int) -> np.ndarray:
             """
-            Method responsible for choosing a ramdom parameter,
-            according to the section blade, which is used as the
-            initial variable for the optimization.
+            Method responsible for drawing samples in the unit
+            hypercube, by the initial sampling chosen.
 
-            :param section: section of the blade
+            :param quantity: quantity of samples
+            :param dimensions: dimensions of each sample
             ...
-            :return: a random number used as the initial variable
-                for the optimization
+            :return: array of shape (quantity, dimensions)
             """
-            lb, ub = LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE.get(section)
+            if self.initial_sampling == "latinHypercube":
+                sampler = qmc.LatinHypercube(
+                    dimensions, seed=np.random.randint(2**31)
+                )
+                return sampler.random(quantity)
+
+            if self.initial_sampling == "sobol":
+                sampler = qmc.Sobol(dimensions, seed=np.random.randint(2**31))
+                return sampler.random_base2(int(np.ceil(np.log2(quantity))))[
+                    :quantity
+                ]
 
-            return np.random.uniform(low=lb, high=ub)
+            return np.random.uniform(size=(quantity, dimensions))
 
-        def create_initial_geometry(particle: Particle) -> Particle:
+        def map_to_intervals(samples: np.ndarray, intervals: np.ndarray):
             """
-            Method responsible for creating the initial blade
-            geometry of each particle, considering the control
-            variable choosed by an initial random process.
+            Method responsible for mapping samples of the unit
+            interval to the feasible sub-intervals of a section,
+            uniformly along their total length.
 
-            :param particle: the particle which will be created
-                the geometry.
+            :param samples: samples in the unit interval
+            :param intervals: array of shape (intervals, 2)
+            ...
+            :return: variables of the section
             """
-            propeller_splines = list()
-            parameters = list()
+            lengths = intervals[:, 1] - intervals[:, 0]
+            cumulative = np.cumsum(lengths)
+
+            position = samples * cumulative[-1]
+            interval = np.minimum(
+                np.searchsorted(cumulative, position, side="right"),
+                len(intervals) - 1,
+            )
 
-            for propeller_section in range(7):
-                a = self.a_points.copy()
+            return np.clip(
+                intervals[interval, 0] + position - (cumulative - lengths)[interval],
+                intervals[interval, 0],
+                intervals[interval, 1],
+            )
 
-                while True:
-                    parameter = choose_random_variable(propeller_section)
-                    a[1][3] = self.a_points[1][3] + parameter
+        limits = np.array(
+            [
+                LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE.get(section)
+                for section in range(7)
+            ]
+        )
+        intervals = self.geometry_management.feasible_intervals(
+            a_points=self.a_points, p_points=self.p_points, limits=limits
+        )
 
-                    geometry_management = GeometryManagement()
-                    splines = geometry_management.update_airfoil(
-                        a_points=a, p_points=self.p_points.copy()
-                    )
+        if any(not len(section_intervals) for section_intervals in intervals):
+            raise ErrorAirfoilShape(
+                "There are no variables without auto intersection of the "
+                "airfoil in some propeller section"
+            )
 
-                    if splines is not None:
-                        break
+        particles_ids = list(self.particles.keys())
+        samples = draw_unit_samples(len(particles_ids), len(intervals))
+        pending = np.ones(samples.shape, dtype=bool)
+        variables = np.zeros(samples.shape)
+        splines = [[None] * len(intervals) for _ in particles_ids]
+
+        while np.any(pending):
+            for section, section_intervals in enumerate(intervals):
+                rows = pending[:, section]
+                variables[rows, section] = map_to_intervals(
+                    samples[rows, section], section_intervals
+                )
 
-                propeller_splines.append(splines)
-                parameters.append(parameter)
+            rows, sections = np.nonzero(pending)
+            a_points = np.repeat(self.a_points[None, None], len(rows), axis=0)
+            a_points[:, 0, 1, 3] += variables[rows, sections]
 
-            return particle._replace(
-                variables=np.array(parameters), splines=propeller_splines
+            pending_splines, valid = self.geometry_management.update_airfoils(
+                a_points=a_points, p_points=self.p_points
             )
+            for row, section, (spline,) in zip(rows, sections, pending_splines):
+                splines[row][section] = spline
 
-        particles_ids = self.particles.keys()
-        for particle in particles_ids:
-            self.particles.update(
-                {particle: create_initial_geometry(self.particles.get(particle))}
+            pending[rows, sections] = ~valid[:, 0]
+            samples = draw_unit_samples(*samples.shape)
+
+        for particle_id, particle_variables, particle_splines in zip(
+            particles_ids, variables, splines
+        ):
+            self.particles[particle_id] = self.particles[particle_id]._replace(
+                variables=particle_variables, splines=particle_splines
             )
 
-    def __update_geometry(self) -> None:
+    def __update_geometry(self, particles_ids: list = None) -> None:
         """
         Method responsible for updating the geometry
         of each Particle, based on new variable
         values.
+
+        :param particles_ids: ids of the particles to
+            be updated, if None, all particles are.
         """
+        particle_ids = list(
+            self.particles.keys() if particles_ids is None else particles_ids
+        )
 
-        def change_splines(particle: Particle) -> Particle:
-            """
-            Method responsible for changing the
-            spline of the geometry of each
-            Particle.
+        if not particle_ids:
+            return
 
-            :param particle: the particle which
-                it splines will be updated.
-            """
-            prop_splines = list()
+        particles = [self.particles.get(particle_id) for particle_id in particle_ids]
+        variables = np.array([particle.variables for particle in particles])
+
+        a_points = np.repeat(
+            np.array([particle.points_a for particle in particles])[:, None],
+            variables.shape[1],
+            axis=1,
+        )
+        a_points[:, :, 1, 3] += variables
 
-            for section in range(7):
-                a_points = particle.points_a.copy()
-                a_points[1][3] = a_points[1][3] + particle.variables[section]
+        splines, _ = self.geometry_management.update_airfoils(
+            a_points=a_points,
+            p_points=np.array([particle.points_p for particle in particles])[:, None],
+        )
 
-                geometry_manag_instance = GeometryManagement()
-                splines = geometry_manag_instance.update_airfoil(
-                    a_points=a_points, p_points=particle.points_p
-                )
+        for particle_id, particle, prop_splines in zip(
+            particle_ids, particles, splines
+        ):
+            self.particles[particle_id] = particle._replace(splines=prop_splines)
+
+    def __screen_particles(self, particles_ids: list = None) -> list:
+        """
+        Method responsible for screening the particles before
+        executing xfoil, at once for all of them. A particle
+        is infeasible if its variables break the thickness
+        order of the sections, or if any of its airfoils is
+        auto intersected or too thin. The infeasible parti-
+        cles take an objective function out of the effici-
+        ency range, which is penalized by the optimizer
+        without executing xfoil.
+
+        :param particles_ids: ids of the particles to be
+            screened, if None, all particles are.
+        ...
+        :return: ids of the feasible particles
+        """
+        particles_ids = list(
+            self.particles.keys() if particles_ids is None else particles_ids
+        )
 
-                prop_splines.append(splines)
+        if not particles_ids:
+            return particles_ids
 
-            return particle._replace(splines=prop_splines)
+        particles = [self.particles.get(particle_id) for particle_id in particles_ids]
+        variables = np.array([particle.variables for particle in particles])
 
-        particle_ids = self.particles.keys()
-        for particle_id in particle_ids:
-            self.particles.update(
-                {particle_id: change_splines(self.particles.get(particle_id))}
+        intersected = np.array(
+            [[spline is None for spline in particle.splines] for particle in particles]
+        )
+        feasible = np.all(variables[:, [0]] <= variables, axis=1) & ~np.any(
+            intersected, axis=1
+        )
+
+        if not np.all(intersected):
+            thickness = airfoil_shape_metrics(
+                [
+                    spline
+                    for particle in particles
+                    for spline in particle.splines
+                    if spline is not None
+                ]
             )
 
-    def __calculate_objective_function(self) -> None:
+            proper_shape = np.zeros(intersected.shape, dtype=bool)
+            proper_shape[~intersected] = thickness >= SCREENING_MINIMUM_THICKNESS
+
+            feasible &= np.all(proper_shape, axis=1)
+
+        for particle_id, particle, particle_feasible in zip(
+            particles_ids, particles, feasible
+        ):
+            if not particle_feasible:
+                self.particles[particle_id] = particle._replace(
+                    objective_function=SCREENED_OBJECTIVE_FUNCTION, results=dict()
+                )
+
+        return [
+            particle_id
+            for particle_id, particle_feasible in zip(particles_ids, feasible)
+            if particle_feasible
+        ]
+
+    def __calculate_objective_function(self, particles_ids: list = None) -> None:
         """
         Methdod responsible for calculating the objective
-        function of each particle.
+        function of each particle. With the panel aerody-
+        namic backend, the cl and cd of all the sections
+        of all the particles are obtained at once, without
+        xfoil and its files, and the blade element theory
+        of all of them is a single batch. The quantities
+        which only depend on the flight conditions are cal-
+        culated once for all the particles. With xfoil, the
+        sections of all the particles are executed from a
+        single queue of the xfoil instances, and the blade
+        element theory of each particle is executed as soon
+        as all its sections end.
+
+        :param particles_ids: ids of the particles to be
+            evaluated, if None, all particles are.
         """
 
         def create_airfoil_files(particles: Dict[int, Particle]) -> dict:
@@ -189,6 +394,7 @@ class ObjectiveFunction:
                 id_particle: {
                     section: AirfoilCreation.create_airfoil_in_xfoil_from_splines(
                         particle.splines[section],
+                        scratch_workspace=self.scratch_workspace,
                     )
                     for section in range(len(particle.splines))
                 }
@@ -197,8 +403,111 @@ class ObjectiveFunction:
 
             return airfoil_file_names
 
+        def calculate_panel_coefficients(
+            particles_ids: list, alpha: float, terms: dict
+        ) -> tuple:
+            """
+            Method responsible for obtaining the cl and cd of
+            each section of the particles with the panel me-
+            thod, at the operating points of the blade element
+            theory.
+
+            :param particles_ids: ids of the particles
+            :param alpha: angle of attack of the sections
+            :param terms: flight condition quantities
+            ...
+            :return: cl and cd of shape (particles, sections),
+                0 and 1 for the sections without airfoil
+            """
+            sections = len(self.particles.get(particles_ids[0]).splines)
+            cl = np.zeros((len(particles_ids), sections))
+            cd = np.ones((len(particles_ids), sections))
+
+            keys = [
+                (row, section)
+                for row, particle_id in enumerate(particles_ids)
+                for section in range(sections)
+                if self.particles.get(particle_id).splines[section] is not None
+            ]
+
+            if not keys:
+                return cl, cd
+
+            rows, columns = np.array(keys).T
+            cl[rows, columns], cd[rows, columns] = panel_coefficients(
+                [
+                    self.particles.get(particles_ids[row]).splines[section]
+                    for row, section in keys
+                ],
+                alpha=np.full(len(keys), alpha),
+                reynolds=np.full(len(keys), float(terms.get("reynolds"))),
+            )
+
+            return cl, cd
+
+        def schedule_the_sections(airfoil_names: dict, alpha: float, terms: dict):
+            """
+            Method responsible for executing the sections of
+            all the particles in the xfoil instances, from a
+            single queue.
+
+            :param airfoil_names: airfoil files of each
+                particle of each section
+            :param alpha: angle of attack of the sections
+            :param terms: flight condition quantities
+            ...
+            :return: iterator of the particle id and the re-
+                sults of its sections, as soon as all of them
+                end
+            """
+            sections = range(len(next(iter(airfoil_names.values()))))
+            reynolds = float(terms.get("reynolds"))
+            timeout_policy = (
+                TimeoutPolicy() if self.timeout_policy is None else self.timeout_policy
+            )
+            timeout = timeout_policy.timeout(
+                TimeoutPolicy.configuration(XFOIL_PANELS, XFOIL_ITERATIONS, reynolds)
+            )
+
+            section_results = {particle_id: dict() for particle_id in airfoil_names}
+
+            with (
+                nullcontext(self.worker_pool)
+                if self.worker_pool is not None
+                else WorkerPool(self.xfoil_instances)
+            ) as worker_pool:
+                for (particle_id, section), result in schedule_xfoil(
+                    worker_pool,
+                    [
+                        ((particle_id, section), airfoil_name, section)
+                        for particle_id, names in airfoil_names.items()
+                        for section, airfoil_name in names.items()
+                    ],
+                    [
+                        self.xfoil_instance_offset + xfoil_instance
+                        for xfoil_instance in range(self.xfoil_instances)
+                    ],
+                    (
+                        alpha,
+                        reynolds,
+                        terms.get("mach"),
+                        self.scratch_workspace,
+                        self.xfoil_sessions,
+                        timeout,
+                        self.polar_database,
+                    ),
+                    threads=self.xfoil_sessions,
+                ):
+                    section_results[particle_id][section] = result
+
+                    if len(section_results[particle_id]) == len(sections):
+                        yield particle_id, section_results.pop(particle_id)
+
         def execute_the_blade_element_theory(
-            particle_id: int, airfoil_names: dict
+            particle_id: int,
+            airfoil_names: dict,
+            terms: dict,
+            section_results: dict = None,
         ) -> None:
             """
             Method responsible for executing the blade element
@@ -208,6 +517,9 @@ class ObjectiveFunction:
             :param particle_id: particle id
             :param airfoil_names: airfoil files of each
                 particle of each section
+            :param terms: flight condition quantities
+            :param section_results: if given, results of the
+                xfoil runs of each section, already executed
             """
             blade_instance = BladeElementTheory(
                 uuid=self.uuid,
@@ -215,6 +527,15 @@ class ObjectiveFunction:
                 flight_conditions=self.flight_conditions,
                 propeller_geometric_conditions=self.propeller_geometry,
                 xfoil_instances=self.xfoil_instances,
+                xfoil_instance=self.xfoil_instance,
+                xfoil_instance_offset=self.xfoil_instance_offset,
+                scratch_workspace=self.scratch_workspace,
+                xfoil_sessions=self.xfoil_sessions,
+                timeout_policy=self.timeout_policy,
+                section_results=section_results,
+                terms=terms,
+                polar_database=self.polar_database,
+                worker_pool=self.worker_pool,
             )
             results = blade_instance.calculate_propeller_results()
 
@@ -222,7 +543,51 @@ class ObjectiveFunction:
                 objective_function=results.get("efficiency"), results=results
             )
 
-        airfoil_names = create_airfoil_files(self.particles)
+        particles_ids = self.particles.keys() if particles_ids is None else particles_ids
+
+        terms = flight_condition_terms(self.flight_conditions, self.propeller_geometry)
+        alpha = self.propeller_geometry.get("AoAInMaximumEfficiency")
+
+        if self.aerodynamic_backend == "panel":
+            if not particles_ids:
+                return
+
+            particles_ids = list(particles_ids)
+            cl, cd = calculate_panel_coefficients(particles_ids, alpha, terms)
 
-        for particle in self.particles:
-            execute_the_blade_element_theory(particle, airfoil_names.get(particle))
+            for particle_id, results in zip(
+                particles_ids, BladeElementTheory.batch_results(terms, cl, cd)
+            ):
+                self.particles[particle_id] = self.particles[particle_id]._replace(
+                    objective_function=results.get("efficiency"), results=results
+                )
+
+            return
+
+        airfoil_names = create_airfoil_files(
+            {particle: self.particles.get(particle) for particle in particles_ids}
+        )
+        self.scratch_workspace.enforce_limits()
+
+        if self.xfoil_instance is not None:
+            for particle in particles_ids:
+                execute_the_blade_element_theory(
+                    particle, airfoil_names.get(particle), terms
+                )
+                self.scratch_workspace.remove(airfoil_names.get(particle).values())
+
+            return
+
+        if not airfoil_names:
+            return
+
+        for particle, section_results in schedule_the_sections(
+            airfoil_names, alpha, terms
+        ):
+            execute_the_blade_element_theory(
+                particle,
+                airfoil_names.get(particle),
+                terms,
+                section_results=section_results,
+            )
+            self.scratch_workspace.remove(airfoil_names.get(particle).values())
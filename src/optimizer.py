@@ -2,21 +2,105 @@ import os
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 from .data_modules.data_reader import DataReader
-from .data_modules.data_structures import Particle
+from .data_modules.data_structures import Particle, Swarm
 from .objective_function import ObjectiveFunction
+from .utilities.constants import (
+    SCALAR_RESULTS,
+    CHECKPOINT_FILENAME,
+    HISTORY_DIRNAME,
+)
+from .utilities.history_recorder import HistoryRecorder
+from .utilities.evaluation_cache import EvaluationCache
+from .utilities.scratch_workspace import ScratchWorkspace
+from .utilities.timeout_policy import TimeoutPolicy
+from .utilities.polar_database import PolarDatabase
+
+
+def violated_constraints(fo: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for checking which particles do
+    not satisfy the constraints. The efficiency must be
+    between 0 and 1 and the airfoils closely to the root
+    of the blade must have larger thickness than those
+    farly.
+
+    :param fo: objective function value of each particle
+    :param x: variables of each particle
+    ...
+    :return: True for each particle which violates them
+    """
+    fo_condition = (fo < 1) & (fo >= 0)
+    thickness_condition = np.all(x[:, [0]] <= x, axis=1)
+
+    return ~(fo_condition & thickness_condition)
+
+
+def penalize_constraints(fo: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for checking if the constraints
+    are valid for certain conditions, if not, a penalty
+    value is applied in the FO value of the correspon-
+    ding particle.
+
+    :param fo: objective function value of each particle
+    :param x: variables of each particle
+    ...
+    :return: objective function values, penalized
+    """
+    penalized = violated_constraints(fo, x)
+
+    fo = np.array(fo, dtype=float)
+    if not np.any(penalized):
+        return fo
+
+    fo_penalized = fo[penalized]
+    low = np.where(fo_penalized > 1, 1.0, np.minimum(fo_penalized, 0.0))
+    high = np.where(fo_penalized > 1, fo_penalized, np.maximum(fo_penalized, 0.0))
+
+    fo[penalized] = fo_penalized - np.random.uniform(low, high)
+
+    return fo
 
 
 class PSO:
-    def __init__(self, data_reader: DataReader, uuid: str, results_dir: str) -> None:
+    def __init__(
+        self, data_reader: DataReader, uuid: str, results_dir: str, **kwargs
+    ) -> None:
         self.data_reader = data_reader
         self.uuid = uuid
         self.results_dir = results_dir
-        self.results_per_time = dict()
         self.fo_per_time = dict()
+        self.start_iteration = 2
+        self.particles_iteration = None
+        self.checkpoint_file = kwargs.get(
+            "checkpoint_file", os.path.join(results_dir, CHECKPOINT_FILENAME)
+        )
+        self.xfoil_instance_offset = kwargs.get("xfoil_instance_offset", 0)
+        self.migration = kwargs.get("migration", None)
+        self.worker_pool = kwargs.get("worker_pool", None)
+        self.history = HistoryRecorder(
+            kwargs.get("history_dir", os.path.join(results_dir, HISTORY_DIRNAME))
+        )
+        self.evaluation_cache = EvaluationCache.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.scratch_workspace = ScratchWorkspace.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.timeout_policy = TimeoutPolicy.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.polar_database = PolarDatabase.from_optimization_data(
+            self.data_reader.optimization_data
+        )
 
         self.particles = self.__set_particles()
+        self.swarm = Swarm(len(self.particles), 7)
+        self.__all_ids = np.arange(len(self.particles))
         self.best = self.__set_best()
         self.best_objective = self.__set_best_objective()
         self.hyperparameters = self.__set_hyperparameters()
@@ -48,14 +132,13 @@ class PSO:
     def __set_best(self) -> dict:
         """
         Method responsible for setting an empty
-        instance of the best Particle (g_best)
-        and the best of each particle per ite-
-        ration (p_best).
+        instance of the best Particle (g_best).
+        The best position of each particle (p_best)
+        is kept in the swarm arrays.
 
         :return:: best particles instance.
         """
         best = {
-            "p_best": self.particles.copy(),
             "g_best": {0: self.particles.get(0)},
         }
 
@@ -70,7 +153,7 @@ class PSO:
         :return: best objective values
         """
         best_obj = {
-            "p_best_obj": {particle: 0.0 for particle in self.particles},
+            "p_best_obj": self.swarm.p_best_obj,
             "g_best_obj": {0: 0.0},
         }
 
@@ -116,153 +199,99 @@ class PSO:
         :return: True if the optimization is converged, and
             False if not.
         """
-        best_variables = list(self.best.get("g_best").values())[0].variables
+        mean_distances = np.mean(
+            np.abs(self.swarm.positions - self.swarm.g_best), axis=0
+        )
 
-        converg_counter = 0
-        for i, var in enumerate(best_variables):
-            distances = np.array(
-                [part.variables[i] - var for part in self.particles.values()]
+        return bool(
+            np.all(
+                mean_distances <= self.data_reader.optimization_data.get("tolerance")
             )
-            mean_distances = np.mean(np.abs(distances))
-
-            if mean_distances <= self.data_reader.optimization_data.get("tolerance"):
-                converg_counter += 1
-
-        if converg_counter == len(best_variables):
-            return True
-
-        return False
+        )
 
-    def __check_constrainsts(self) -> None:
+    def __check_constrainsts(self, ids: np.ndarray = None) -> None:
         """
         Method responsible for checking if the constraints
         are valid for certain conditions, if not, a penal-
         ty value is applied in the FO value of the corres-
         ponding particle.
+
+        :param ids: ids of the particles to be checked, if
+            None, all particles are checked.
         """
+        ids = self.__all_ids if ids is None else ids
+
+        self.swarm.objective[ids] = penalize_constraints(
+            self.swarm.objective[ids], self.swarm.positions[ids]
+        )
 
-        def penalize(fo: float) -> float:
-            """
-            Method responsible for penalizing the objective
-            function if the constraints are not fullfiled.
-
-            :param fo: objective function value
-            ...
-            :return: new FO, penalized.
-            """
-            if fo > 1:
-                penalty = np.random.uniform(1, fo)
-            elif fo < 0:
-                penalty = np.random.uniform(fo, 0)
-            else:
-                penalty = np.random.uniform(0, fo)
-
-            return fo - penalty
-
-        def check_fo_condition(fo: float) -> bool:
-            """
-            Method responsible for checking if the objective
-            function value is valid.
-
-            :param fo: objective function value
-            ...
-            :return: True if the value is value, else False
-            """
-            return True if (fo < 1) & (fo >= 0) else False
-
-        def check_thickness_condition(x: np.ndarray) -> bool:
-            """
-            Method responsible for checking if the thickness
-            values of the airfoil are valid. In a nutshell,
-            airfoils closely to the root of the blade must
-            have larger thickness than those farly.
-
-            :param x: variables of the optimization problem
-            ...
-            :return: True if the condition is valid, else
-                False.
-            """
-            condition = {False for id_ in range(len(x)) if x[0] > x[id_]}
-
-            return False if condition else True
-
-        for id_part, particle in self.particles.items():
-            fo_condition = check_fo_condition(particle.objective_function)
-            thickness_condition = check_thickness_condition(particle.variables)
-
-            if (not fo_condition) or (not thickness_condition):
-                new_fo = penalize(particle.objective_function)
-                self.particles[id_part] = particle._replace(objective_function=new_fo)
-
-    def __update_p_best(self) -> None:
+    def __update_p_best(self, ids: np.ndarray = None) -> None:
         """
-        Method responsible for updating the best particle
-        of each particle in the best attribute of parti-
-        cles (p_best).
+        Method responsible for updating the best position
+        of each particle in the swarm arrays (p_best).
+
+        :param ids: ids of the particles to be updated, if
+            None, all particles are updated.
         """
-        for id_p, particle in self.particles.items():
-            if particle.objective_function >= self.best_objective.get("p_best_obj").get(
-                id_p
-            ):
-                self.best["p_best"][id_p] = particle
-                self.best_objective["p_best_obj"][id_p] = particle.objective_function
+        ids = self.__all_ids if ids is None else ids
+        improved = ids[self.swarm.objective[ids] >= self.swarm.p_best_obj[ids]]
+
+        self.swarm.p_best[improved] = self.swarm.positions[improved]
+        self.swarm.p_best_obj[improved] = self.swarm.objective[improved]
 
-    def __update_g_best(self) -> None:
+    def __update_g_best(self, ids: np.ndarray = None) -> None:
         """
         Method responsible for updating the best particle
         of all particles in global the best attribute.
+
+        :param ids: ids of the particles candidates to
+            g_best, if None, all particles are considered.
         """
-        part_obj = {p.objective_function: p_idx for p_idx, p in self.particles.items()}
-        best_obj = max(part_obj.keys())
-        best_part = part_obj.get(best_obj)
+        ids = self.__all_ids if ids is None else ids
+        best_part = int(ids[np.argmax(self.swarm.objective[ids])])
+        best_obj = float(self.swarm.objective[best_part])
+
+        if best_obj >= self.swarm.g_best_obj:
+            self.swarm.g_best[:] = self.swarm.positions[best_part]
+            self.swarm.g_best_obj = best_obj
+            self.swarm.g_best_id = best_part
 
-        if best_obj >= list(self.best["g_best"].values())[0].objective_function:
             self.best["g_best"] = {best_part: self.particles.get(best_part)}
-            self.best_objective["g_best_obj"] = {
-                best_part: self.particles.get(best_part)
-            }
+            self.best_objective["g_best_obj"] = {best_part: best_obj}
 
-    def __update_velocity(self, t: int) -> None:
+    def __update_velocity(self, t: int, ids: np.ndarray = None) -> None:
         """
         Method responsible for updating the velocity
         terms of each particle.
 
         :param t: the step iteration
+        :param ids: ids of the particles to be updated, if
+            None, all particles are updated.
         """
-        for id_part, p_best_part in self.best.get("p_best").items():
-            particle_variables = self.particles.get(id_part).variables
-            p_best_variables = p_best_part.variables
-            g_best_variables = list(self.best.get("g_best").values())[0].variables
-
-            new_velocity = (
-                self.hyperparameters.get("c1")(t)
-                * self.hyperparameters.get("r")[0]
-                * (p_best_variables - particle_variables)
-            ) + (
-                self.hyperparameters.get("c2")(t)
-                * self.hyperparameters.get("r")[1]
-                * (g_best_variables - particle_variables)
-            )
+        ids = self.__all_ids if ids is None else ids
+        x = self.swarm.positions[ids]
+        r = self.hyperparameters.get("r")
 
-            if id_part not in list(self.best.get("g_best").keys()):
-                new_velocity += (
-                    self.hyperparameters.get("w")(t)
-                    * self.particles.get(id_part).velocity
-                )
+        inertia = self.hyperparameters.get("w")(t) * self.swarm.velocities[ids]
+        inertia[ids == self.swarm.g_best_id] = 0.0
 
-            self.particles[id_part] = self.particles.get(id_part)._replace(
-                velocity=new_velocity
-            )
+        self.swarm.velocities[ids] = (
+            self.hyperparameters.get("c1")(t) * r[0] * (self.swarm.p_best[ids] - x)
+            + self.hyperparameters.get("c2")(t) * r[1] * (self.swarm.g_best - x)
+            + inertia
+        )
 
-    def __update_variables(self) -> None:
+    def __update_variables(self, ids: np.ndarray = None) -> None:
         """
         Method responsible for updating the variables of the
         optimization problem.
+
+        :param ids: ids of the particles to be updated, if
+            None, all particles are updated.
         """
-        for id_particle, particle in self.particles.items():
-            new_position = particle.velocity + particle.variables
+        ids = self.__all_ids if ids is None else ids
 
-            self.particles[id_particle] = particle._replace(variables=new_position)
+        self.swarm.positions[ids] += self.swarm.velocities[ids]
 
     def __update_objective_function(self) -> None:
         """
@@ -276,12 +305,141 @@ class PSO:
             propeller_geometry=self.data_reader.propeller_geometric_conditions,
             uuid=self.uuid,
             xfoil_instances=self.data_reader.optimization_data.get("xfoilInstances"),
+            xfoil_instance_offset=self.xfoil_instance_offset,
             airfoil_shape=self.data_reader.airfoil_geometry,
+            evaluation_cache=self.evaluation_cache,
+            scratch_workspace=self.scratch_workspace,
+            timeout_policy=self.timeout_policy,
+            polar_database=self.polar_database,
+            worker_pool=self.worker_pool,
+            aerodynamic_backend=self.data_reader.optimization_data.get(
+                "aerodynamicBackend", "xfoil"
+            ),
+            xfoil_sessions=self.data_reader.optimization_data.get(
+                "xfoilSessions", False
+            ),
         )
         obj_func_instance.set_new_conditions()
 
         self.particles = obj_func_instance.particles
 
+    def __evaluate_particle(self, id_part: int, free_instances: Queue) -> tuple:
+        """
+        Method responsible for evaluating the objective
+        function of a single particle, using one of the
+        free xfoil instances for all its sections.
+
+        :param id_part: particle id
+        :param free_instances: queue of the xfoil instan-
+            ces not being used by other particles
+        ...
+        :return: particle id and the evaluated particle
+        """
+        xfoil_instance = free_instances.get()
+
+        try:
+            obj_func_instance = ObjectiveFunction(
+                airfoil_name=self.data_reader.propeller_geometric_conditions.get(
+                    "airfoil"
+                ),
+                particles={id_part: self.particles.get(id_part)},
+                flight_conditions=self.data_reader.flight_conditions,
+                propeller_geometry=self.data_reader.propeller_geometric_conditions,
+                uuid=self.uuid,
+                xfoil_instance=xfoil_instance,
+                airfoil_shape=self.data_reader.airfoil_geometry,
+                evaluation_cache=self.evaluation_cache,
+                scratch_workspace=self.scratch_workspace,
+                timeout_policy=self.timeout_policy,
+                polar_database=self.polar_database,
+                aerodynamic_backend=self.data_reader.optimization_data.get(
+                    "aerodynamicBackend", "xfoil"
+                ),
+                xfoil_sessions=self.data_reader.optimization_data.get(
+                    "xfoilSessions", False
+                ),
+            )
+            obj_func_instance.set_new_conditions()
+        finally:
+            free_instances.put(xfoil_instance)
+
+        return id_part, obj_func_instance.particles.get(id_part)
+
+    def __update_swarm(self, ids: np.ndarray = None) -> None:
+        """
+        Method responsible for gathering the evaluated
+        particles into the swarm arrays, applying the
+        constraints and updating the p_best and g_best.
+
+        :param ids: ids of the evaluated particles, if
+            None, all particles are considered.
+        """
+        self.swarm.load_particles(self.particles, ids)
+
+        self.__check_constrainsts(ids)
+        self.__update_p_best(ids)
+        self.swarm.export_particles(self.particles, ids)
+        self.__update_g_best(ids)
+
+    def __migrate(self, t: int) -> None:
+        """
+        Method responsible for exchanging the g_best particle
+        with the other swarms (islands), every migration in-
+        terval. Each received particle replaces the worst
+        particle of this swarm, becoming its p_best and, if
+        better, the g_best. Nothing is sent before the g_best
+        is found.
+
+        :param t: the step iteration
+        """
+        if self.migration is None or t % self.migration.interval:
+            return
+
+        emigrant = self.best["g_best"].get(self.swarm.g_best_id)
+        if emigrant is None or not len(emigrant.variables):
+            emigrant = None
+
+        immigrants = self.migration.exchange(emigrant)
+
+        for immigrant in immigrants:
+            worst = int(np.argmin(self.swarm.objective))
+            ids = np.array([worst])
+
+            self.particles[worst] = immigrant._replace(
+                velocity=self.particles[worst].velocity
+            )
+            self.swarm.load_particles(self.particles, ids)
+            self.swarm.p_best[ids] = self.swarm.positions[ids]
+            self.swarm.p_best_obj[ids] = self.swarm.objective[ids]
+            self.__update_g_best(ids)
+
+    def export_state(self) -> dict:
+        """
+        Method responsible for exporting the results of the
+        optimization, used when it runs in another process.
+
+        :return: optimization results by attribute name
+        """
+        return {
+            "particles": self.particles,
+            "swarm": self.swarm,
+            "best": self.best,
+            "best_objective": self.best_objective,
+            "history": self.history,
+            "fo_per_time": self.fo_per_time,
+            "evaluation_cache": self.evaluation_cache,
+        }
+
+    def import_state(self, state: dict) -> None:
+        """
+        Method responsible for importing the results of an
+        optimization exported by export_state.
+
+        :param state: optimization results by attribute name
+        """
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+
     def set_initial_conditions(self):
         """
         Method responsible for setting the initial conditions
@@ -294,42 +452,270 @@ class PSO:
             propeller_geometry=self.data_reader.propeller_geometric_conditions,
             uuid=self.uuid,
             xfoil_instances=self.data_reader.optimization_data.get("xfoilInstances"),
+            xfoil_instance_offset=self.xfoil_instance_offset,
             airfoil_shape=self.data_reader.airfoil_geometry,
+            evaluation_cache=self.evaluation_cache,
+            scratch_workspace=self.scratch_workspace,
+            timeout_policy=self.timeout_policy,
+            polar_database=self.polar_database,
+            worker_pool=self.worker_pool,
+            aerodynamic_backend=self.data_reader.optimization_data.get(
+                "aerodynamicBackend", "xfoil"
+            ),
+            xfoil_sessions=self.data_reader.optimization_data.get(
+                "xfoilSessions", False
+            ),
+            initial_sampling=self.data_reader.optimization_data.get(
+                "initialSampling", "uniform"
+            ),
         )
         init_cond_inst.set_initial_conditions()
 
         self.particles = init_cond_inst.particles
 
-        self.__check_constrainsts()
-        self.__update_p_best()
-        self.__update_g_best()
+        self.__update_swarm()
         self.__update_velocity(1)
         self.__update_variables()
+        self.swarm.export_particles(self.particles)
+
+        self.fo_per_time[1] = self.swarm.g_best_obj
+        self.history.clear()
+        self.history.record(1, self.particles)
+
+        self.save_checkpoint(1)
+
+    def save_checkpoint(self, t: int, particles_iteration: np.ndarray = None) -> None:
+        """
+        Method responsible for saving the state of the
+        optimization after the iteration t into a com-
+        pressed npz file, which is replaced atomically.
+        The history of the iterations is already kept
+        by the history recorder.
+
+        :param t: the last iteration completed
+        :param particles_iteration: iteration of each par-
+            ticle in the asynchronous mode, if None, all of
+            them are at the iteration t + 1. It is clamped
+            to the iteration after the maximum one, which
+            means the particle is done
+        """
+        maximum_iterations = self.data_reader.optimization_data.get("maximumIterations")
+
+        if particles_iteration is None:
+            particles_iteration = np.full(len(self.particles), t + 1)
+        particles_iteration = np.minimum(particles_iteration, maximum_iterations + 1)
+
+        rng_state = np.random.get_state()
+        first_particle = self.particles.get(0)
+
+        arrays = {
+            **self.swarm.to_arrays(),
+            "iteration": np.array(t),
+            "particlesIteration": particles_iteration,
+            "points_p": first_particle.points_p,
+            "points_a": first_particle.points_a,
+            "results": HistoryRecorder.scalar_results(self.particles),
+            "foPerTimeIterations": np.array(list(self.fo_per_time.keys())),
+            "foPerTimeValues": np.array(list(self.fo_per_time.values())),
+            "hyperparametersR": self.hyperparameters.get("r"),
+            "rngKeys": rng_state[1],
+            "rngPos": np.array(rng_state[2]),
+            "rngHasGauss": np.array(rng_state[3]),
+            "rngCachedGaussian": np.array(rng_state[4]),
+        }
+
+        temporary_file = self.checkpoint_file + ".tmp"
+        with open(temporary_file, "wb") as writer:
+            np.savez_compressed(writer, **arrays)
+
+        os.replace(temporary_file, self.checkpoint_file)
+
+    def load_checkpoint(self, checkpoint_file: str) -> None:
+        """
+        Method responsible for restoring the state of the
+        optimization saved by save_checkpoint, so the ite-
+        ration process continues at the next iteration wi-
+        thout setting the initial conditions again.
+
+        :param checkpoint_file: checkpoint file directory
+        """
+        with np.load(checkpoint_file) as checkpoint:
+            arrays = {key: checkpoint[key] for key in checkpoint.files}
+
+        self.swarm.from_arrays(arrays)
+
+        self.particles = {
+            id_part: Particle(
+                objective_function=float(self.swarm.objective[id_part]),
+                variables=self.swarm.positions[id_part].copy(),
+                velocity=self.swarm.velocities[id_part].copy(),
+                points_p=arrays["points_p"],
+                points_a=arrays["points_a"],
+                splines=list(),
+                results=dict(zip(SCALAR_RESULTS, arrays["results"][id_part])),
+            )
+            for id_part in range(len(self.swarm.objective))
+        }
+        self.fo_per_time = {
+            int(time): float(value)
+            for time, value in zip(
+                arrays["foPerTimeIterations"], arrays["foPerTimeValues"]
+            )
+        }
 
-        self.fo_per_time[1] = list(self.best["g_best"].values())[0].objective_function
-        self.results_per_time[1] = self.particles.copy()
+        self.best["g_best"] = {
+            self.swarm.g_best_id: self.particles.get(self.swarm.g_best_id)._replace(
+                objective_function=self.swarm.g_best_obj,
+                variables=self.swarm.g_best.copy(),
+            )
+        }
+        self.best_objective["g_best_obj"] = {
+            self.swarm.g_best_id: self.swarm.g_best_obj
+        }
+        self.hyperparameters["r"] = arrays["hyperparametersR"]
+
+        np.random.set_state(
+            (
+                "MT19937",
+                arrays["rngKeys"],
+                int(arrays["rngPos"]),
+                int(arrays["rngHasGauss"]),
+                float(arrays["rngCachedGaussian"]),
+            )
+        )
+
+        self.start_iteration = int(arrays["iteration"]) + 1
+        self.particles_iteration = arrays.get("particlesIteration")
+        if self.particles_iteration is not None:
+            self.particles_iteration = np.minimum(
+                self.particles_iteration,
+                self.data_reader.optimization_data.get("maximumIterations") + 1,
+            )
+        self.history.truncate(int(arrays["iteration"]))
 
     def iterate(self) -> None:
         """
         Method responsible for starting the iteration process
         of the propeller optimization.
         """
-        for t in tqdm(
-            range(2, self.data_reader.optimization_data.get("maximumIterations") + 1)
-        ):
+        if self.data_reader.optimization_data.get("asynchronous", False):
+            self.__iterate_asynchronously()
+            return
+
+        maximum_iterations = self.data_reader.optimization_data.get("maximumIterations")
+
+        for t in tqdm(range(self.start_iteration, maximum_iterations + 1)):
             self.__update_objective_function()
-            self.__check_constrainsts()
-            self.__update_p_best()
-            self.__update_g_best()
+            self.__update_swarm()
 
-            self.fo_per_time[t] = list(self.best["g_best"].values())[
-                0
-            ].objective_function
-            self.results_per_time[t] = self.particles.copy()
+            self.fo_per_time[t] = self.swarm.g_best_obj
+            self.history.record(t, self.particles)
 
             if self.__check_convergence():
                 break
+            self.__migrate(t)
             self.__update_velocity(t)
             self.__update_variables()
+            self.swarm.export_particles(self.particles)
+
+            if t < maximum_iterations:
+                self.save_checkpoint(t)
 
             os.system("cls")
+
+    def __iterate_asynchronously(self) -> None:
+        """
+        Method responsible for iterating the optimization in
+        the asynchronous (steady-state) mode. Each particle
+        has its velocity and position updated as soon as its
+        own evaluation ends, against the current g_best, and
+        it is sent back to the free xfoil instance without
+        waiting for the rest of the swarm. Every time the
+        quantity of particles is evaluated, an iteration is
+        recorded. Each particle is sent until it is evaluated
+        at the maximum iteration, keeping the same evaluation
+        budget of the synchronous mode, and the run ends when
+        every particle is done. On convergence, no particle is
+        sent again, but the evaluations already running are
+        waited and recorded in the swarm.
+
+        The checkpoints are saved while other particles are
+        still being evaluated, so resuming is approximate:
+        the particles evaluated after the checkpoint are
+        evaluated again, at the positions saved, and the
+        remaining budget is taken from the iteration of each
+        particle.
+        """
+        quantity_of_particles = len(self.particles)
+        xfoil_instances = self.data_reader.optimization_data.get("xfoilInstances")
+        maximum_iterations = self.data_reader.optimization_data.get("maximumIterations")
+
+        particles_iteration = np.full(quantity_of_particles, self.start_iteration)
+        if self.particles_iteration is not None:
+            particles_iteration = np.array(self.particles_iteration)
+
+        budget = int(np.sum(maximum_iterations + 1 - particles_iteration))
+
+        free_instances = Queue()
+        for xfoil_instance in range(xfoil_instances):
+            free_instances.put(self.xfoil_instance_offset + xfoil_instance)
+
+        evaluated, t = 0, self.start_iteration - 1
+        converged = False
+
+        with ThreadPoolExecutor(max_workers=xfoil_instances) as executor, tqdm(
+            total=budget
+        ) as progress:
+            pending = {
+                executor.submit(self.__evaluate_particle, id_part, free_instances)
+                for id_part in self.particles
+                if particles_iteration[id_part] <= maximum_iterations
+            }
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    id_part, particle = future.result()
+                    ids = np.array([id_part])
+
+                    self.particles[id_part] = particle
+                    self.__update_swarm(ids)
+
+                    evaluated += 1
+                    progress.update()
+
+                    checkpoint = False
+                    if not evaluated % quantity_of_particles and not converged:
+                        t += 1
+                        self.fo_per_time[t] = self.swarm.g_best_obj
+                        self.history.record(t, self.particles)
+
+                        if self.__check_convergence():
+                            converged = True
+                            pending = {
+                                running for running in pending if not running.cancel()
+                            }
+                        else:
+                            checkpoint = t < maximum_iterations
+
+                    if converged:
+                        continue
+
+                    iteration = int(particles_iteration[id_part])
+                    particles_iteration[id_part] += 1
+
+                    if iteration < maximum_iterations:
+                        self.__update_velocity(iteration, ids)
+                        self.__update_variables(ids)
+                        self.swarm.export_particles(self.particles, ids)
+
+                    if checkpoint:
+                        self.save_checkpoint(t, particles_iteration)
+
+                    if iteration < maximum_iterations:
+                        pending.add(
+                            executor.submit(
+                                self.__evaluate_particle, id_part, free_instances
+                            )
+                        )
@@ -0,0 +1,441 @@
+import os
+import numpy as np
+from abc import ABC, abstractmethod
+from tqdm import tqdm
+
+from .data_modules.data_reader import DataReader
+from .data_modules.data_structures import Particle
+from .objective_function import ObjectiveFunction
+from .optimizer import penalize_constraints, violated_constraints
+from .utilities.constants import HISTORY_DIRNAME
+from .utilities.evaluation_cache import EvaluationCache
+from .utilities.scratch_workspace import ScratchWorkspace
+from .utilities.timeout_policy import TimeoutPolicy
+from .utilities.polar_database import PolarDatabase
+from .utilities.history_recorder import HistoryRecorder
+
+
+class BatchOptimizer(ABC):
+    def __init__(
+        self, data_reader: DataReader, uuid: str, results_dir: str, **kwargs
+    ) -> None:
+        """
+        Base of the optimizers which propose a batch of
+        variables per iteration, evaluated by the same
+        engine (ObjectiveFunction) used by the PSO.
+        Subclasses implement initialize, propose, update
+        and converged.
+
+        :param data_reader: data reader of the input
+        :param uuid: uuid of the execution
+        :param results_dir: output directory
+        :param worker_pool: worker pool of the run, which
+            executes the xfoil runs
+        """
+        self.data_reader = data_reader
+        self.uuid = uuid
+        self.results_dir = results_dir
+        self.fo_per_time = dict()
+        self.history = HistoryRecorder(os.path.join(results_dir, HISTORY_DIRNAME))
+
+        self.particles = dict()
+        self.template = None
+        self.g_best_variables = None
+        self.g_best_obj = 0.0
+        self.penalized = np.array([], dtype=bool)
+        self.best = {"g_best": dict()}
+        self.evaluation_cache = EvaluationCache.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.scratch_workspace = ScratchWorkspace.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.timeout_policy = TimeoutPolicy.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.polar_database = PolarDatabase.from_optimization_data(
+            self.data_reader.optimization_data
+        )
+        self.worker_pool = kwargs.get("worker_pool", None)
+
+    def __objective_function(self, particles: dict) -> ObjectiveFunction:
+        """
+        Method responsible for instantiating the objective
+        function for a batch of particles.
+
+        :param particles: dict of particles
+        ...
+        :return: ObjectiveFunction instance
+        """
+        return ObjectiveFunction(
+            airfoil_name=self.data_reader.propeller_geometric_conditions.get("airfoil"),
+            particles=particles,
+            flight_conditions=self.data_reader.flight_conditions,
+            propeller_geometry=self.data_reader.propeller_geometric_conditions,
+            uuid=self.uuid,
+            xfoil_instances=self.data_reader.optimization_data.get("xfoilInstances"),
+            airfoil_shape=self.data_reader.airfoil_geometry,
+            evaluation_cache=self.evaluation_cache,
+            scratch_workspace=self.scratch_workspace,
+            timeout_policy=self.timeout_policy,
+            polar_database=self.polar_database,
+            worker_pool=self.worker_pool,
+            aerodynamic_backend=self.data_reader.optimization_data.get(
+                "aerodynamicBackend", "xfoil"
+            ),
+            xfoil_sessions=self.data_reader.optimization_data.get(
+                "xfoilSessions", False
+            ),
+            initial_sampling=self.data_reader.optimization_data.get(
+                "initialSampling", "uniform"
+            ),
+        )
+
+    def evaluate(self, variables: np.ndarray) -> tuple:
+        """
+        Method responsible for evaluating a batch of vari-
+        ables, applying the constraints penalty and upda-
+        ting the best particle found.
+
+        :param variables: array of shape (batch, variables)
+        ...
+        :return: penalized objective function of each va-
+            riables vector and the dict of evaluated par-
+            ticles, in the same order.
+        """
+        batch = {
+            id_part: self.template._replace(
+                variables=np.array(x), velocity=np.zeros(len(x))
+            )
+            for id_part, x in enumerate(variables)
+        }
+
+        obj_func_instance = self.__objective_function(batch)
+        obj_func_instance.set_new_conditions()
+
+        return self.__register(obj_func_instance.particles)
+
+    def __register(self, batch: dict) -> tuple:
+        """
+        Method responsible for penalizing the evaluated
+        batch and updating the best particle (g_best). The
+        particles penalized are kept in penalized.
+
+        :param batch: dict of evaluated particles
+        ...
+        :return: penalized objective function of each
+            particle and the dict of particles.
+        """
+        variables = np.array([p.variables for p in batch.values()])
+        objective = np.array([p.objective_function for p in batch.values()])
+
+        self.penalized = violated_constraints(objective, variables)
+        objective = penalize_constraints(objective, variables)
+
+        for id_part, fo in enumerate(objective):
+            batch[id_part] = batch[id_part]._replace(objective_function=float(fo))
+
+        best_part = int(np.argmax(objective))
+        if objective[best_part] >= self.g_best_obj:
+            self.g_best_obj = float(objective[best_part])
+            self.g_best_variables = variables[best_part].copy()
+            self.best["g_best"] = {best_part: batch.get(best_part)}
+
+        return objective, batch
+
+    def set_initial_conditions(self) -> None:
+        """
+        Method responsible for setting the initial conditions
+        to run the optimizer, using the same random initial
+        population of the PSO.
+        """
+        particles = {
+            particle: Particle(
+                objective_function=0.0,
+                variables=np.array([]),
+                velocity=np.zeros(7),
+                points_p=np.array([]),
+                points_a=np.array([]),
+                splines=list(),
+                results=dict(),
+            )
+            for particle in range(
+                self.data_reader.optimization_data.get("quantityOfParticles")
+            )
+        }
+
+        init_cond_inst = self.__objective_function(particles)
+        init_cond_inst.set_initial_conditions()
+
+        objective, self.particles = self.__register(init_cond_inst.particles)
+        self.template = self.particles.get(0)._replace(
+            splines=list(), results=dict()
+        )
+
+        self.initialize(
+            np.array([p.variables for p in self.particles.values()]), objective
+        )
+
+        self.fo_per_time[1] = self.g_best_obj
+        self.history.clear()
+        self.history.record(1, self.particles)
+
+    def iterate(self) -> None:
+        """
+        Method responsible for starting the iteration process
+        of the optimization: propose a batch, evaluate it and
+        update the optimizer state, until convergence.
+        """
+        for t in tqdm(
+            range(2, self.data_reader.optimization_data.get("maximumIterations") + 1)
+        ):
+            variables = self.propose()
+            objective, batch = self.evaluate(variables)
+            self.update(variables, objective, batch)
+
+            self.fo_per_time[t] = self.g_best_obj
+            self.history.record(t, self.particles)
+
+            if self.converged():
+                break
+
+        g_best_id, g_best_particle = list(self.best.get("g_best").items())[0]
+        self.particles[g_best_id] = g_best_particle
+
+    @abstractmethod
+    def initialize(self, variables: np.ndarray, objective: np.ndarray) -> None:
+        """
+        Method responsible for initializing the optimizer
+        state from the initial population.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        """
+
+    @abstractmethod
+    def propose(self) -> np.ndarray:
+        """
+        Method responsible for proposing the next batch
+        of variables to be evaluated.
+
+        :return: array of shape (batch, variables)
+        """
+
+    @abstractmethod
+    def update(self, variables: np.ndarray, objective: np.ndarray, batch: dict):
+        """
+        Method responsible for updating the optimizer state
+        with an evaluated batch, and the current particles.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        :param batch: dict of evaluated particles
+        """
+
+    @abstractmethod
+    def converged(self) -> bool:
+        """
+        Method responsible for checking if the optimization
+        is converged by the tolerance.
+
+        :return: True if the optimization is converged
+        """
+
+
+class CMAES(BatchOptimizer):
+    def initialize(self, variables: np.ndarray, objective: np.ndarray) -> None:
+        """
+        Method responsible for setting the strategy para-
+        meters of the CMA-ES (Hansen, 2016), with the mean
+        started on the best half of the initial population
+        and the step size on its spread.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        """
+        self.lam, n = variables.shape
+        self.mu = self.lam // 2
+
+        weights = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / np.sum(weights)
+        self.mueff = 1 / np.sum(self.weights**2)
+
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(
+            1 - self.c1,
+            2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff),
+        )
+        self.damps = (
+            1 + 2 * max(0.0, np.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        )
+        self.chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n**2))
+
+        order = np.argsort(-objective)[: self.mu]
+        self.mean = self.weights @ variables[order]
+        self.sigma = self.data_reader.optimization_data.get(
+            "cmaesSigma", float(np.mean(np.std(variables, axis=0)))
+        )
+
+        self.pc = np.zeros(n)
+        self.ps = np.zeros(n)
+        self.C = np.eye(n)
+        self.B = np.eye(n)
+        self.D = np.ones(n)
+        self.generation = 0
+
+    def propose(self) -> np.ndarray:
+        """
+        Method responsible for sampling the offspring from
+        the current multivariate normal distribution.
+
+        :return: array of shape (batch, variables)
+        """
+        z = np.random.standard_normal((self.lam, len(self.mean)))
+
+        return self.mean + self.sigma * (z * self.D) @ self.B.T
+
+    def update(self, variables: np.ndarray, objective: np.ndarray, batch: dict):
+        """
+        Method responsible for updating the mean, the evolu-
+        tion paths, the covariance matrix and the step size
+        with the best half of the offspring.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        :param batch: dict of evaluated particles
+        """
+        n = len(self.mean)
+        self.generation += 1
+
+        order = np.argsort(-objective)[: self.mu]
+        y = (variables[order] - self.mean) / self.sigma
+        y_w = self.weights @ y
+
+        self.mean = self.mean + self.sigma * y_w
+
+        inv_sqrt_c = self.B @ np.diag(1 / self.D) @ self.B.T
+        self.ps = (1 - self.cs) * self.ps + np.sqrt(
+            self.cs * (2 - self.cs) * self.mueff
+        ) * (inv_sqrt_c @ y_w)
+
+        h_sigma = np.linalg.norm(self.ps) / np.sqrt(
+            1 - (1 - self.cs) ** (2 * self.generation)
+        ) / self.chi_n < 1.4 + 2 / (n + 1)
+
+        self.pc = (1 - self.cc) * self.pc + h_sigma * np.sqrt(
+            self.cc * (2 - self.cc) * self.mueff
+        ) * y_w
+
+        self.C = (
+            (1 - self.c1 - self.cmu) * self.C
+            + self.c1
+            * (
+                np.outer(self.pc, self.pc)
+                + (1 - h_sigma) * self.cc * (2 - self.cc) * self.C
+            )
+            + self.cmu * (y.T * self.weights) @ y
+        )
+        self.sigma *= np.exp(
+            (self.cs / self.damps) * (np.linalg.norm(self.ps) / self.chi_n - 1)
+        )
+
+        self.C = (self.C + self.C.T) / 2
+        eigenvalues, self.B = np.linalg.eigh(self.C)
+        self.D = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+        self.particles = batch
+
+    def converged(self) -> bool:
+        """
+        Method responsible for checking if the step size
+        along the largest axis of the distribution is be-
+        low the tolerance.
+
+        :return: True if the optimization is converged
+        """
+        return bool(
+            self.sigma * np.max(self.D)
+            <= self.data_reader.optimization_data.get("tolerance")
+        )
+
+
+class DifferentialEvolution(BatchOptimizer):
+    def initialize(self, variables: np.ndarray, objective: np.ndarray) -> None:
+        """
+        Method responsible for taking the initial popula-
+        tion of the differential evolution (DE/rand/1/bin).
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        """
+        self.population = variables.copy()
+        self.population_obj = objective.copy()
+
+        self.mutation_factor = self.data_reader.optimization_data.get(
+            "deMutationFactor", 0.5
+        )
+        self.crossover_rate = self.data_reader.optimization_data.get(
+            "deCrossoverRate", 0.9
+        )
+
+    def propose(self) -> np.ndarray:
+        """
+        Method responsible for creating one trial vector
+        per member of the population, by mutation with
+        three other distinct members and binomial cross-
+        over.
+
+        :return: array of shape (batch, variables)
+        """
+        quantity, n = self.population.shape
+
+        choice = np.random.rand(quantity, quantity)
+        np.fill_diagonal(choice, np.inf)
+        r = np.argsort(choice, axis=1)[:, :3]
+
+        mutant = self.population[r[:, 0]] + self.mutation_factor * (
+            self.population[r[:, 1]] - self.population[r[:, 2]]
+        )
+
+        crossover = np.random.rand(quantity, n) < self.crossover_rate
+        crossover[np.arange(quantity), np.random.randint(n, size=quantity)] = True
+
+        return np.where(crossover, mutant, self.population)
+
+    def update(self, variables: np.ndarray, objective: np.ndarray, batch: dict):
+        """
+        Method responsible for replacing each member of the
+        population by its trial vector, if the trial is not
+        worse.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        :param batch: dict of evaluated particles
+        """
+        improved = objective >= self.population_obj
+
+        self.population[improved] = variables[improved]
+        self.population_obj[improved] = objective[improved]
+
+        for id_part in np.flatnonzero(improved):
+            self.particles[int(id_part)] = batch.get(int(id_part))
+
+    def converged(self) -> bool:
+        """
+        Method responsible for checking if the population
+        is converged around the best member by the tole-
+        rance.
+
+        :return: True if the optimization is converged
+        """
+        mean_distances = np.mean(
+            np.abs(self.population - self.g_best_variables), axis=0
+        )
+
+        return bool(
+            np.all(
+                mean_distances <= self.data_reader.optimization_data.get("tolerance")
+            )
+        )
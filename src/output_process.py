@@ -1,14 +1,21 @@
 import os
+import numpy as np
 import plotly.express as px
 import pandas as pd
 
+from contextlib import nullcontext
 from matplotlib import pyplot as plt
-from tqdm import tqdm
 
 from .optimizer import PSO
 from .data_modules.data_reader import DataReader
-from .blade_element_theory import BladeElementTheory
+from .blade_element_theory import execute_xfoil_polar
 from .utilities.airfoil_creation import AirfoilCreation
+from .utilities.bet_kernel import blade_element_kernel, flight_condition_terms
+from .utilities.constants import XFOIL_ITERATIONS, XFOIL_PANELS
+from .utilities.panel_method import panel_polar
+from .utilities.scratch_workspace import ScratchWorkspace
+from .utilities.timeout_policy import TimeoutPolicy
+from .utilities.worker_pool import WorkerPool
 
 
 class OutputProcess:
@@ -18,11 +25,13 @@ class OutputProcess:
         optimization_instance: PSO,
         results_dir: str,
         data_reader: DataReader,
+        **kwargs,
     ) -> None:
         self.uuid = uuid
         self.opt_inst = optimization_instance
         self.results_dir = results_dir
         self.data_reader = data_reader
+        self.worker_pool = kwargs.get("worker_pool", None)
 
     def process_outputs(self) -> None:
         """
@@ -39,35 +48,12 @@ class OutputProcess:
     def __create_excel_output_file(self) -> None:
         """
         Method responsible for creating the excel
-        output file for each particle per time.
+        output file for each particle per time, rea-
+        ding the history recorded along the optimi-
+        zation.
         """
-        vars_time = [
-            (
-                time,
-                id_part,
-                particle.results.get("traction"),
-                particle.results.get("torque"),
-                particle.results.get("tCoefficient"),
-                particle.results.get("qCoefficient"),
-                particle.results.get("pCoefficient"),
-                particle.results.get("efficiency"),
-            )
-            for time in self.opt_inst.results_per_time
-            for id_part, particle in self.opt_inst.results_per_time.get(time).items()
-        ]
-
-        df_result = pd.DataFrame(
-            vars_time,
-            columns=[
-                "iteration",
-                "idParticle",
-                "Traction",
-                "Torque",
-                "Ct",
-                "Cq",
-                "Cp",
-                "efficiency",
-            ],
+        df_result = self.__read_history(
+            "results", ["Traction", "Torque", "Ct", "Cq", "Cp", "efficiency"]
         )
 
         with pd.ExcelWriter(
@@ -75,6 +61,28 @@ class OutputProcess:
         ) as writer:
             df_result.to_excel(writer, sheet_name="particlesResults", index=False)
 
+    def __read_history(self, key: str, columns: list) -> pd.DataFrame:
+        """
+        Method responsible for reading one of the arrays
+        recorded in the optimization history, iteration
+        by iteration, into a dataframe.
+
+        :param key: name of the array recorded
+        :param columns: column names of the array
+        ...
+        :return: dataframe with the iteration, the particle
+            id and the array columns
+        """
+        frames = list()
+        for time, chunk in self.opt_inst.history.read():
+            frame = pd.DataFrame(chunk.get(key), columns=columns)
+            frame.insert(0, "idParticle", chunk.get("idParticle"))
+            frame.insert(0, "iteration", time)
+
+            frames.append(frame)
+
+        return pd.concat(frames, ignore_index=True)
+
     def __create_FO_per_time_graph(self) -> None:
         """
         Method responsible for creating the graph
@@ -104,25 +112,7 @@ class OutputProcess:
             exist_ok=True,
         )
 
-        vars_time = [
-            (
-                time,
-                id_part,
-                particle.variables[0],
-                particle.variables[1],
-                particle.variables[2],
-                particle.variables[3],
-                particle.variables[4],
-                particle.variables[5],
-                particle.variables[6],
-            )
-            for time in self.opt_inst.results_per_time
-            for id_part, particle in self.opt_inst.results_per_time.get(time).items()
-        ]
-        df_vars_time = pd.DataFrame(
-            vars_time,
-            columns=["iteration", "idParticle"] + [f"var{i}" for i in range(7)],
-        )
+        df_vars_time = self.__read_history("variables", [f"var{i}" for i in range(7)])
 
         for var in range(6):
             fig = px.scatter(
@@ -177,53 +167,134 @@ class OutputProcess:
     def __create_ct_and_cq_graphs_per_j(self) -> None:
         """
         Method responsible for creating the Ct and Cq
-        coefficients per advance ratio value.
+        coefficients per advance ratio value. The polar of
+        each section over all the flight conditions is ob-
+        tained in a single run of xfoil, in its session or
+        from a file of commands. The blade element theory
+        of all of them is a single batch. The airfoil files are created in
+        the scratch workspace of the run and removed once
+        the polars are read.
         """
 
-        def create_airfoil_files():
-            id_best_particle = list(self.opt_inst.best.get("g_best").keys())[0]
-            splines = self.opt_inst.particles.get(id_best_particle).splines
+        id_best_particle = list(self.opt_inst.best.get("g_best").keys())[0]
+        splines = self.opt_inst.particles.get(id_best_particle).splines
+        panel_backend = (
+            self.data_reader.optimization_data.get("aerodynamicBackend", "xfoil")
+            == "panel"
+        )
+
+        scratch_workspace = getattr(self.opt_inst, "scratch_workspace", None)
+        if scratch_workspace is None:
+            scratch_workspace = ScratchWorkspace.from_optimization_data(
+                self.data_reader.optimization_data
+            )
 
+        def create_airfoil_files():
             return {
                 section: AirfoilCreation.create_airfoil_in_xfoil_from_splines(
-                    splines[section]
+                    splines[section], scratch_workspace=scratch_workspace
                 )
                 for section in range(len(splines))
             }
 
-        def execute_blade_element_theory(airfoil_files: dict, flight_conditions: dict):
-            blade_instance = BladeElementTheory(
-                uuid=self.uuid,
-                airfoils=airfoil_files,
-                flight_conditions=flight_conditions,
-                propeller_geometric_conditions=self.data_reader.propeller_geometric_conditions,
-                xfoil_instances=self.data_reader.optimization_data.get(
-                    "xfoilInstances"
-                ),
+        def calculate_polars(airfoil_files: dict, points: np.ndarray) -> dict:
+            """
+            Method responsible for executing all the operating
+            points of each section in the xfoil instances, in
+            a single run of xfoil per section, in its session
+            if the xfoil sessions are enabled, or with the pa-
+            nel method if it is the aerodynamic backend.
+
+            :param airfoil_files: airfoil file of each section,
+                None with the panel method
+            :param points: array of shape (conditions, 3) with
+                the operating point of the sections per flight
+                condition
+            ...
+            :return: polar of each section, with one row per
+                flight condition
+            """
+            if panel_backend:
+                return {
+                    section: panel_polar(splines[section], points)
+                    for section in airfoil_files
+                }
+
+            xfoil_instances = self.data_reader.optimization_data.get("xfoilInstances")
+            xfoil_sessions = self.data_reader.optimization_data.get(
+                "xfoilSessions", False
             )
-            blade_instance.calculate_propeller_results()
+            polar_database = getattr(self.opt_inst, "polar_database", None)
 
-            return blade_instance.results
+            timeout_policy = getattr(self.opt_inst, "timeout_policy", None)
+            if timeout_policy is None:
+                timeout_policy = TimeoutPolicy()
 
-        airfoil_files = create_airfoil_files()
-        velocities = [vel for vel in range(1, 100, 5)]
-        flight_cond = self.data_reader.flight_conditions.copy()
+            timeouts = [
+                timeout_policy.timeout(
+                    TimeoutPolicy.configuration(XFOIL_PANELS, XFOIL_ITERATIONS, reynolds)
+                )
+                for reynolds in points[:, 1]
+            ]
+
+            with (
+                nullcontext(self.worker_pool)
+                if self.worker_pool is not None
+                else WorkerPool(xfoil_instances)
+            ) as worker_pool:
+                polars = worker_pool.starmap(
+                    execute_xfoil_polar,
+                    [
+                        (
+                            airfoil_file,
+                            section % xfoil_instances,
+                            section,
+                            points,
+                            max(timeouts),
+                            polar_database,
+                            xfoil_sessions,
+                            scratch_workspace,
+                        )
+                        for section, airfoil_file in airfoil_files.items()
+                    ],
+                    threads=True,
+                )
 
-        total_results = {
-            "advanceRate": list(),
-            "efficiency": list(),
-            "tractionCoefficient": list(),
-            "toqueCoefficient": list(),
-        }
+            return dict(polars)
 
-        for velocity in tqdm(velocities):
-            flight_cond["speed"] = velocity
-            result = execute_blade_element_theory(airfoil_files, flight_cond)
+        airfoil_files = (
+            dict.fromkeys(range(len(splines)))
+            if panel_backend
+            else create_airfoil_files()
+        )
+        velocities = np.arange(1, 100, 5, dtype=float)
 
-            total_results["advanceRate"].append(result.get("advanceRate"))
-            total_results["efficiency"].append(result.get("efficiency"))
-            total_results["tractionCoefficient"].append(result.get("tCoefficient"))
-            total_results["toqueCoefficient"].append(result.get("qCoefficient"))
+        terms = flight_condition_terms(
+            dict(self.data_reader.flight_conditions, speed=velocities),
+            self.data_reader.propeller_geometric_conditions,
+        )
+        points = np.zeros((len(velocities), 3))
+        points[:, 0] = self.data_reader.propeller_geometric_conditions.get(
+            "AoAInMaximumEfficiency"
+        )
+        points[:, 1] = terms.get("reynolds")
+
+        try:
+            polars = calculate_polars(airfoil_files, points)
+        finally:
+            scratch_workspace.remove(airfoil_files.values())
+        performance = blade_element_kernel(
+            np.stack([polars.get(section)[:, 3] for section in airfoil_files], axis=1),
+            np.stack([polars.get(section)[:, 4] for section in airfoil_files], axis=1),
+            terms,
+        )
+
+        total_results = {
+            "advanceRate": terms.get("advanceRate"),
+            "efficiency": performance.get("efficiency"),
+            "tractionCoefficient": performance.get("tCoefficient"),
+            "toqueCoefficient": performance.get("qCoefficient"),
+        }
 
         for type_result in ["efficiency", "tractionCoefficient", "toqueCoefficient"]:
             fig, axs = plt.subplots(1, 1)
@@ -2,12 +2,25 @@ import argparse
 import uuid
 import os
 import logging
-import shutil
 
 from .data_modules.data_reader import DataReader
+from .utilities.constants import OPTIMIZER_NAMES
 from .utilities.custom_logger import CustomLogger
 from .optimizer import PSO
+from .island_model import IslandModel
+from .optimizer_backends import CMAES, DifferentialEvolution
+from .surrogate_optimizer import SurrogateOptimizer
+from .blade_element_theory import BladeElementTheory
 from .output_process import OutputProcess
+from .utilities.exceptions import ErrorIslandsParameters, ErrorOptimizerParameters
+from .utilities.scratch_workspace import ScratchWorkspace
+from .utilities.worker_pool import WorkerPool
+from .utilities.xfoil_sandbox import available_cpus, sandbox_directory
+from .utilities.xfoil_session import XfoilSession
+
+OPTIMIZER_CLASSES = dict(
+    zip(OPTIMIZER_NAMES, (PSO, CMAES, DifferentialEvolution, SurrogateOptimizer))
+)
 
 
 class PipelineMethods:
@@ -19,22 +32,11 @@ class PipelineMethods:
             os.path.basename(parsed_arguments.file).split(".")[0],
         )
         self.data_reader = DataReader(self.parsed_arguments)
+        self.worker_pool = None
 
-        self.__clean_old_data()
         self.__create_folders()
         self.__create_logger()
 
-    def __clean_old_data(self):
-        """
-        Method responsible for cleaning purge
-        data.
-        """
-        for file in os.listdir("processing/execution_steps"):
-            if file == ".gitkeep":
-                continue
-
-            os.remove(os.path.join("processing", "execution_steps", file))
-
     def __create_folders(self) -> None:
         """
         Method responsible for creating the
@@ -66,27 +68,56 @@ class PipelineMethods:
 
     def create_xfoil_instances(self) -> None:
         """
-        Method responsible for creating new
-        xfoil instances.
+        Method responsible for creating the sand-
+        box directories of the xfoil instances,
+        which share the same xfoil binary.
         """
         self.logger.start("Create xfoil instances")
 
-        dir_base = os.path.join(
-            os.getcwd(),
-            "processing",
-            "xfoil_instances",
-        )
-        xfoil_base = os.path.join(
-            dir_base,
-            "xfoil.exe",
-        )
-        quantity_of_instances = self.data_reader.optimization_data.get("xfoilInstances")
+        quantity_of_instances = self.data_reader.optimization_data.get(
+            "xfoilInstances"
+        ) * self.data_reader.optimization_data.get("islands", 1)
 
         for i in range(quantity_of_instances):
-            shutil.copy(xfoil_base, os.path.join(dir_base, f"xfoil_{i}.exe"))
+            sandbox_directory(i)
+
+        self.logger.info_msg(
+            f"{quantity_of_instances} xfoil instances, "
+            f"{available_cpus()} CPUs available"
+        )
 
         self.logger.end("Create xfoil instances")
 
+    def create_worker_pool(self) -> None:
+        """
+        Method responsible for creating the worker
+        pool of the run, which executes the xfoil
+        runs of all the evaluations and of the re-
+        sults, with the modules of the blade ele-
+        ment theory preloaded.
+        """
+        self.logger.start("Create worker pool")
+
+        self.worker_pool = WorkerPool.from_optimization_data(
+            self.data_reader.optimization_data,
+            preload=(BladeElementTheory.__module__,),
+        )
+
+        self.logger.end("Create worker pool")
+
+    def close_worker_pool(self) -> None:
+        """
+        Method responsible for finishing the wor-
+        ker pool of the run, if created.
+        """
+        if self.worker_pool is None:
+            return
+
+        self.worker_pool.close()
+        self.logger.info_msg(self.worker_pool.report())
+
+        self.worker_pool = None
+
     def optimize(self):
         """
         Method responsible for starting the
@@ -94,18 +125,81 @@ class PipelineMethods:
         """
         self.logger.start("Optimization")
 
-        optimization_instance = PSO(
+        ScratchWorkspace.from_optimization_data(
+            self.data_reader.optimization_data
+        ).remove_stale()
+
+        if self.data_reader.optimization_data.get("islands", 1) > 1:
+            self.__optimize_islands()
+            self.logger.end("Optimization")
+
+            return
+
+        optimizer = self.data_reader.optimization_data.get("optimizer", "pso")
+        optimization_instance = OPTIMIZER_CLASSES.get(optimizer)(
             data_reader=self.data_reader,
             uuid=self.uuid,
             results_dir=self.results_dir,
+            worker_pool=self.worker_pool,
         )
-        optimization_instance.set_initial_conditions()
+        if self.parsed_arguments.resume is None:
+            optimization_instance.set_initial_conditions()
+        else:
+            if optimizer != "pso":
+                raise ErrorOptimizerParameters(
+                    "Resuming is only available for the pso optimizer"
+                )
+
+            self.data_reader.validator.check_file_existance(
+                self.parsed_arguments.resume
+            )
+            optimization_instance.load_checkpoint(self.parsed_arguments.resume)
+            self.logger.info_msg(
+                f"Resuming at iteration {optimization_instance.start_iteration}"
+            )
+
         optimization_instance.iterate()
 
         self.opt_inst = optimization_instance
 
+        if optimization_instance.evaluation_cache is not None:
+            self.logger.info_msg(optimization_instance.evaluation_cache.report())
+
+        self.logger.info_msg(optimization_instance.scratch_workspace.report())
+        self.logger.info_msg(optimization_instance.timeout_policy.report())
+
+        if optimization_instance.polar_database is not None:
+            self.logger.info_msg(optimization_instance.polar_database.report())
+
+        if self.data_reader.optimization_data.get("xfoilSessions", False):
+            self.logger.info_msg(XfoilSession.report())
+
         self.logger.end("Optimization")
 
+    def __optimize_islands(self) -> None:
+        """
+        Method responsible for executing the
+        optimization with one swarm per island.
+        """
+        if self.parsed_arguments.resume is not None:
+            raise ErrorIslandsParameters(
+                "Resuming is only available for a single swarm optimization"
+            )
+
+        island_model = IslandModel(
+            data_reader=self.data_reader,
+            uuid=self.uuid,
+            results_dir=self.results_dir,
+        )
+        self.opt_inst = island_model.optimize()
+
+        for island, g_best_obj in island_model.g_best_per_island.items():
+            self.logger.info_msg(f"Island {island} best objective: {g_best_obj}")
+
+            evaluation_cache = island_model.evaluation_cache_per_island.get(island)
+            if evaluation_cache is not None:
+                self.logger.info_msg(f"Island {island} {evaluation_cache.report()}")
+
     def obtain_results(self):
         """
         Method responsible for making the plots of
@@ -114,7 +208,11 @@ class PipelineMethods:
         self.logger.start("Making results")
 
         output_instance = OutputProcess(
-            self.uuid, self.opt_inst, self.results_dir, self.data_reader
+            self.uuid,
+            self.opt_inst,
+            self.results_dir,
+            self.data_reader,
+            worker_pool=self.worker_pool,
         )
         output_instance.process_outputs()
 
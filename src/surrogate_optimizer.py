@@ -0,0 +1,271 @@
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import minimize
+from scipy.stats import norm
+
+from .optimizer_backends import BatchOptimizer
+from .utilities.constants import (
+    GP_LENGTH_SCALE_STARTS,
+    LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE,
+)
+
+
+class GaussianProcess:
+    def __init__(self, lower: np.ndarray, upper: np.ndarray) -> None:
+        """
+        Gaussian process regression with an anisotropic
+        Matern 5/2 kernel, over variables normalized to
+        the unit box by the bounds.
+
+        :param lower: lower bound of each variable
+        :param upper: upper bound of each variable
+        """
+        self.lower = lower
+        self.upper = upper
+
+        self.log_length_scales = np.zeros(len(lower))
+        self.log_noise = np.log(1e-3)
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Method responsible for fitting the kernel hyperpa-
+        rameters, by maximizing the log marginal likeli-
+        hood, and conditioning the process on the data.
+        The optimization starts at the best of the current
+        hyperparameters and a few isotropic length scales,
+        as the likelihood is flat for the short ones.
+
+        :param x: array of shape (points, variables)
+        :param y: observed value of each point
+        """
+        self.y_mean = np.mean(y)
+        self.y_std = np.std(y) if np.std(y) > 0 else 1.0
+
+        u = self.__normalize(x)
+        v = (y - self.y_mean) / self.y_std
+
+        def negative_log_likelihood(theta: np.ndarray) -> float:
+            k = self.__kernel(u, u, theta[:-1]) + np.exp(theta[-1]) * np.eye(len(u))
+
+            try:
+                factor = cho_factor(k, lower=True)
+            except np.linalg.LinAlgError:
+                return 1e10
+
+            return 0.5 * v @ cho_solve(factor, v) + np.sum(
+                np.log(np.diag(factor[0]))
+            )
+
+        starts = [np.append(self.log_length_scales, self.log_noise)] + [
+            np.append(np.full(len(self.lower), np.log(length_scale)), self.log_noise)
+            for length_scale in GP_LENGTH_SCALE_STARTS
+        ]
+
+        solution = minimize(
+            negative_log_likelihood,
+            min(starts, key=negative_log_likelihood),
+            method="L-BFGS-B",
+            bounds=[(np.log(1e-2), np.log(1e2))] * len(self.lower)
+            + [(np.log(1e-6), np.log(1.0))],
+        )
+        self.log_length_scales = solution.x[:-1]
+        self.log_noise = solution.x[-1]
+
+        self.condition(x, y)
+
+    def condition(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Method responsible for conditioning the process on
+        the data, keeping the current hyperparameters.
+
+        :param x: array of shape (points, variables)
+        :param y: observed value of each point
+        """
+        self.u = self.__normalize(x)
+        k = self.__kernel(self.u, self.u, self.log_length_scales) + (
+            np.exp(self.log_noise) + 1e-10
+        ) * np.eye(len(self.u))
+
+        self.factor = cho_factor(k, lower=True)
+        self.alpha = cho_solve(self.factor, (y - self.y_mean) / self.y_std)
+
+    def predict(self, x: np.ndarray) -> tuple:
+        """
+        Method responsible for predicting the mean and the
+        standard deviation of the process.
+
+        :param x: array of shape (points, variables)
+        ...
+        :return: mean and standard deviation of each point
+        """
+        k = self.__kernel(self.__normalize(x), self.u, self.log_length_scales)
+
+        mean = k @ self.alpha
+        variance = 1.0 - np.sum(k * cho_solve(self.factor, k.T).T, axis=1)
+
+        return (
+            self.y_mean + self.y_std * mean,
+            self.y_std * np.sqrt(np.maximum(variance, 1e-12)),
+        )
+
+    def __normalize(self, x: np.ndarray) -> np.ndarray:
+        return (x - self.lower) / (self.upper - self.lower)
+
+    @staticmethod
+    def __kernel(u: np.ndarray, w: np.ndarray, log_length_scales: np.ndarray):
+        scaled_distance = np.sqrt(
+            np.sum(
+                ((u[:, None, :] - w[None, :, :]) / np.exp(log_length_scales)) ** 2,
+                axis=2,
+            )
+        )
+
+        return (
+            1 + np.sqrt(5) * scaled_distance + 5 / 3 * scaled_distance**2
+        ) * np.exp(-np.sqrt(5) * scaled_distance)
+
+
+class SurrogateOptimizer(BatchOptimizer):
+    def initialize(self, variables: np.ndarray, objective: np.ndarray) -> None:
+        """
+        Method responsible for taking the initial population
+        as the first design of the efficient global optimi-
+        zation.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        """
+        self.x = variables.copy()
+        self.y = objective.copy()
+        self.feasible = ~self.penalized
+
+        limits = np.array(
+            [
+                LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE.get(section)
+                for section in range(variables.shape[1])
+            ]
+        )
+        width = limits[:, 1] - limits[:, 0]
+        self.lower = np.minimum(limits[:, 0] - width, np.min(variables, axis=0))
+        self.upper = np.maximum(limits[:, 1] + width, np.max(variables, axis=0))
+
+        self.batch_size = self.data_reader.optimization_data.get("xfoilInstances")
+        self.quantity_of_candidates = self.data_reader.optimization_data.get(
+            "surrogateCandidates", 2000
+        )
+        self.gaussian_process = GaussianProcess(self.lower, self.upper)
+        self.expected_improvement = np.inf
+
+    def propose(self) -> np.ndarray:
+        """
+        Method responsible for fitting the surrogate on all
+        the evaluations done so far and choosing one batch
+        of variables per xfoil instance, by maximizing the
+        expected improvement. After each choice, the predic-
+        ted value is taken as observed (kriging believer),
+        so the next choices spread along other regions. The
+        evaluations penalized by the constraints, whose ob-
+        jective is random, are fitted with the worst feasi-
+        ble objective, so their regions are not proposed
+        again, unless all of them are penalized.
+
+        :return: array of shape (batch, variables)
+        """
+        x, y = self.x, self.y
+        if np.any(self.feasible):
+            y = np.where(self.feasible, y, np.min(y[self.feasible]))
+
+        self.gaussian_process.fit(x, y)
+        batch = list()
+
+        for point in range(self.batch_size):
+            candidate, expected_improvement = self.__maximize_expected_improvement(
+                x, y
+            )
+
+            if not point:
+                self.expected_improvement = expected_improvement
+
+            prediction, _ = self.gaussian_process.predict(candidate[None, :])
+            x = np.vstack((x, candidate))
+            y = np.append(y, prediction)
+            self.gaussian_process.condition(x, y)
+
+            batch.append(candidate)
+
+        return np.array(batch)
+
+    def __maximize_expected_improvement(self, x: np.ndarray, y: np.ndarray) -> tuple:
+        """
+        Method responsible for looking for the variables of
+        maximum expected improvement, among random candi-
+        dates in the bounds and around the best evaluations,
+        polishing the best candidate with L-BFGS-B.
+
+        :param x: variables of the evaluations fitted
+        :param y: objective function of each one
+        ...
+        :return: variables and their expected improvement
+        """
+        y_best = np.max(y)
+
+        def expected_improvement(x: np.ndarray) -> np.ndarray:
+            mean, std = self.gaussian_process.predict(np.atleast_2d(x))
+            z = (mean - y_best) / std
+
+            return (mean - y_best) * norm.cdf(z) + std * norm.pdf(z)
+
+        quantity = self.quantity_of_candidates // 2
+        best_points = x[np.argsort(-y)[:5]]
+
+        candidates = np.vstack(
+            (
+                np.random.uniform(
+                    self.lower, self.upper, size=(quantity, len(self.lower))
+                ),
+                best_points[np.random.randint(len(best_points), size=quantity)]
+                + np.random.normal(
+                    scale=0.05 * (self.upper - self.lower),
+                    size=(quantity, len(self.lower)),
+                ),
+            )
+        )
+        candidates = np.clip(candidates, self.lower, self.upper)
+
+        start = candidates[np.argmax(expected_improvement(candidates))]
+        solution = minimize(
+            lambda x: -expected_improvement(x)[0],
+            start,
+            method="L-BFGS-B",
+            bounds=list(zip(self.lower, self.upper)),
+        )
+
+        return solution.x, float(-solution.fun)
+
+    def update(self, variables: np.ndarray, objective: np.ndarray, batch: dict):
+        """
+        Method responsible for adding the evaluated batch to
+        the data of the surrogate.
+
+        :param variables: array of shape (batch, variables)
+        :param objective: objective function of each one
+        :param batch: dict of evaluated particles
+        """
+        self.x = np.vstack((self.x, variables))
+        self.y = np.append(self.y, objective)
+        self.feasible = np.append(self.feasible, ~self.penalized)
+
+        self.particles = batch
+
+    def converged(self) -> bool:
+        """
+        Method responsible for checking if the expected im-
+        provement of the last batch is below the surrogate
+        tolerance.
+
+        :return: True if the optimization is converged
+        """
+        return bool(
+            self.expected_improvement
+            <= self.data_reader.optimization_data.get("surrogateTolerance", 1e-5)
+        )
@@ -5,7 +5,15 @@ import os
 import numpy as np
 
 # from propeller_optmization.data_structures import PPoints
-from uuid import uuid4
+from .constants import (
+    AIRFOIL_CACHE_DIRECTORY,
+    NACA_COORDINATES_POINTS,
+    NACA_PANEL_CURVATURE_WEIGHT,
+    NACA_PANEL_NODES,
+)
+from .geometry_kernel import solve_a_points
+from .naca_airfoils import naca_coordinates, naca_designation, panel_nodes
+from .scratch_workspace import ScratchWorkspace
 
 
 class AirfoilCreation:
@@ -46,6 +54,49 @@ class AirfoilCreation:
 
         return points_p
 
+    def obtain_naca_points(self, airfoil_name: str) -> tuple:
+        """
+        Method responsible for obtaining the bezier P and A
+        points of a NACA 4 or 5-digit airfoil, generated
+        analytically, without xfoil. The points are cached
+        in a file per airfoil and panelling parameters (num-
+        ber of coordinates, of nodes and curvature weight),
+        reused by the next runs.
+
+        :param airfoil_name: airfoil name, like 'naca 0020'
+        ...
+        :return: P and A points of the airfoil
+        """
+        self.airfoil_name = airfoil_name
+        designation = naca_designation(airfoil_name)
+        cache_file = os.path.join(
+            AIRFOIL_CACHE_DIRECTORY,
+            f"naca{designation}_{NACA_COORDINATES_POINTS}_{NACA_PANEL_NODES}_"
+            f"{NACA_PANEL_CURVATURE_WEIGHT:g}.npz",
+        )
+
+        if os.path.isfile(cache_file):
+            with np.load(cache_file) as cached:
+                return cached["pointsP"], cached["pointsA"]
+
+        points_p = panel_nodes(
+            naca_coordinates(designation, NACA_COORDINATES_POINTS), NACA_PANEL_NODES
+        )
+        points_p[1][0] = 0
+        points_p[1][-1] = 0
+
+        points_a = solve_a_points(points_p)
+
+        os.makedirs(AIRFOIL_CACHE_DIRECTORY, exist_ok=True)
+        temporary_file = cache_file + f".{os.getpid()}.tmp"
+
+        with open(temporary_file, "wb") as writer:
+            np.savez(writer, pointsP=points_p, pointsA=points_a)
+
+        os.replace(temporary_file, cache_file)
+
+        return points_p, points_a
+
     def suit_p_points(self, airfoil_data: dict) -> np.ndarray:
         """
         Method responsible for adapting the airfoil bezier P
@@ -103,7 +154,9 @@ class AirfoilCreation:
 
     @staticmethod
     def create_airfoil_in_xfoil_from_splines(
-        spline: np.ndarray, results_filename: str = None
+        spline: np.ndarray,
+        results_filename: str = None,
+        scratch_workspace: ScratchWorkspace = None,
     ) -> str:
         """
         Method responsible for writing the airfoil
@@ -114,6 +167,9 @@ class AirfoilCreation:
         :param spline: spline of the foil
         :param results_filename: the filename of the
             airfoil
+        :param scratch_workspace: workspace where the
+            file is created if no filename is passed,
+            if None, the default one is used.
         ...
         :return: the complete patch name of the airfoil
         """
@@ -124,10 +180,11 @@ class AirfoilCreation:
         x_points = spline[0]
         y_points = spline[1]
 
-        uuid_airfoil = str(uuid4())[:10].replace("-", "")
-
         if results_filename is None:
-            filename_dir = f"processing/execution_steps/airfoil_{uuid_airfoil}.dat"
+            scratch_workspace = (
+                ScratchWorkspace() if scratch_workspace is None else scratch_workspace
+            )
+            filename_dir = scratch_workspace.path("airfoil", "dat")
         else:
             filename_dir = results_filename
 
@@ -0,0 +1,137 @@
+import numpy as np
+
+FLIGHT_RESULTS = (
+    "tangencialVelocity",
+    "advanceRate",
+    "phi",
+    "resultantVelocity",
+    "reynolds",
+    "mach",
+)
+
+
+def flight_condition_terms(
+    flight_conditions: dict, propeller_geometric_conditions: dict
+) -> dict:
+    """
+    Method responsible for calculating the quantities of
+    the blade element theory which only depend on the
+    flight conditions and on the propeller geometry, once
+    per operating point. The flight conditions may be ar-
+    rays of shape (conditions,), as the speeds of a sweep,
+    giving the quantities of all of them at once.
+
+    :param flight_conditions: flight conditions
+    :param propeller_geometric_conditions: propeller
+        geometric conditions
+    ...
+    :return: quantities by name, the ones along the blade
+        of shape (..., radius), with the radius, the chord
+        and the dynamic pressure
+    """
+    speed = np.asarray(flight_conditions.get("speed"), dtype=float)[..., None]
+    engine_spin = np.asarray(flight_conditions.get("engineSpin"), dtype=float)
+    air_density = np.asarray(flight_conditions.get("airDensity"), dtype=float)
+    radius = np.asarray(propeller_geometric_conditions.get("radius"), dtype=float)
+    diameter = propeller_geometric_conditions.get("bladeDiameter")
+
+    tangencial_velocity = 2.0 * np.pi / 60.0 * engine_spin[..., None] * radius
+
+    phi = np.arctan(speed / tangencial_velocity)
+    phi[..., -1] = 0.0
+
+    resultant_velocity = tangencial_velocity / np.cos(phi)
+    temperature = np.asarray(flight_conditions.get("temperature"), dtype=float)
+
+    return {
+        "tangencialVelocity": tangencial_velocity,
+        "advanceRate": 60 * speed[..., 0] / engine_spin / diameter,
+        "phi": phi,
+        "resultantVelocity": resultant_velocity,
+        "reynolds": air_density
+        * speed[..., 0]
+        * diameter
+        / flight_conditions.get("viscosity"),
+        "mach": resultant_velocity / np.sqrt(1.4 * 287 * temperature)[..., None],
+        "radius": radius,
+        "chord": np.asarray(propeller_geometric_conditions.get("chord"), dtype=float),
+        "dynamicPressure": 0.5 * air_density * speed[..., 0] ** 2,
+        "rotationFrequency": engine_spin / 60,
+        "airDensity": air_density,
+        "bladeDiameter": diameter,
+    }
+
+
+def blade_element_kernel(cl: np.ndarray, cd: np.ndarray, terms: dict) -> dict:
+    """
+    Method responsible for calculating the thrust, the
+    torque, their coefficients and the efficiency of a
+    batch of propellers at once. The sections with null
+    cl do not load the blade, and the propellers without
+    power take a random efficiency below 0.1.
+
+    :param cl: cl of shape (batch, sections), the sec-
+        tions being the first ones of the blade radius
+    :param cd: cd of shape (batch, sections)
+    :param terms: flight condition quantities, broadcast
+        against the batch
+    ...
+    :return: gamma, dt and dq of shape (batch, radius),
+        and traction, torque, tCoefficient, qCoefficient,
+        pCoefficient and efficiency of shape (batch,)
+    """
+    cl = np.asarray(cl, dtype=float)
+    cd = np.asarray(cd, dtype=float)
+    sections = cl.shape[-1]
+
+    phi = terms.get("phi")[..., :sections]
+    chord = terms.get("chord")[:sections]
+    radius = terms.get("radius")
+    q = terms.get("dynamicPressure")[..., None]
+
+    loaded = cl != 0
+    gamma = np.arctan(np.divide(cd, cl, out=np.zeros(cl.shape), where=loaded))
+    den = np.cos(gamma) * np.sin(phi) ** 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dt = np.where(loaded, q * cl * chord * np.cos(phi + gamma) / den, 0.0)
+        dq = np.where(
+            loaded,
+            q * cl * chord * radius[:sections] * np.sin(phi + gamma) / den,
+            0.0,
+        )
+
+    padding = [(0, 0)] * (dt.ndim - 1) + [(0, len(radius) - sections)]
+    dt = np.pad(dt, padding)
+    dq = np.pad(dq, padding)
+
+    width = np.diff(radius)
+    traction = np.sum(width * (dt[..., 1:] + dt[..., :-1]) / 2, axis=-1)
+    torque = np.sum(width * (dq[..., 1:] + dq[..., :-1]) / 2, axis=-1)
+
+    scale = terms.get("airDensity") * terms.get("rotationFrequency") ** 2
+    t_coeffic = traction / (scale * terms.get("bladeDiameter") ** 4)
+    q_coeffic = torque / (scale * terms.get("bladeDiameter") ** 5)
+    p_coeffic = 2 * np.pi * q_coeffic
+
+    powered = p_coeffic != 0
+    efficiency = terms.get("advanceRate") * np.divide(
+        t_coeffic, p_coeffic, out=np.zeros(p_coeffic.shape), where=powered
+    )
+
+    if not np.all(powered):
+        efficiency[~powered] = np.random.uniform(
+            low=0, high=0.1, size=np.sum(~powered)
+        )
+
+    return {
+        "gamma": np.where(loaded, gamma, np.nan),
+        "dt": dt,
+        "dq": dq,
+        "traction": traction,
+        "torque": torque,
+        "tCoefficient": t_coeffic,
+        "qCoefficient": q_coeffic,
+        "pCoefficient": p_coeffic,
+        "efficiency": efficiency,
+    }
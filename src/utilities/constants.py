@@ -4,7 +4,6 @@ INPUT_SCHEMA = {
         "maximumIterations": int,
         "tolerance": float,
         "constantHyperParameters": bool,
-        "xfoilInstances": int,
     },
     "flightConditions": {
         "speed": float,
@@ -34,3 +33,72 @@ LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE = {
     5: (0.025, 0.039),
     6: (0.04, 0.05),
 }
+
+XFOIL_PANELS = 200
+
+XFOIL_ITERATIONS = 200
+
+PANEL_NODES = 161
+
+PANEL_TRAILING_EDGE_CUTOFF = 0.02
+
+POLAR_COLUMNS = ("alpha", "reynolds", "mach", "cl", "cd", "converged")
+
+SCREENING_MINIMUM_THICKNESS = 1e-3
+
+SCREENED_OBJECTIVE_FUNCTION = -1.0
+
+SCALAR_RESULTS = [
+    "traction",
+    "torque",
+    "tCoefficient",
+    "qCoefficient",
+    "pCoefficient",
+    "efficiency",
+]
+
+CHECKPOINT_FILENAME = "checkpoint.npz"
+
+SCRATCH_DIRECTORY = "processing/execution_steps"
+
+XFOIL_INSTANCES_DIRECTORY = "processing/xfoil_instances"
+
+CGROUP_DIRECTORY = "/sys/fs/cgroup"
+
+AIRFOIL_CACHE_DIRECTORY = "processing/airfoil_cache"
+
+POLAR_DATABASE_PATH = "processing/polar_database.sqlite"
+
+POLAR_DATABASE_VERSION = 1
+
+NACA_PANEL_CURVATURE_WEIGHT = 0.4
+
+NACA_COORDINATES_POINTS = 161
+
+NACA_PANEL_NODES = 5
+
+NACA_FIVE_DIGIT_CAMBER_LINES = {
+    "10": (0.0580, 361.400, 0.0),
+    "20": (0.1260, 51.640, 0.0),
+    "30": (0.2025, 15.957, 0.0),
+    "40": (0.2900, 6.643, 0.0),
+    "50": (0.3910, 3.230, 0.0),
+    "21": (0.1300, 51.990, 0.000764),
+    "31": (0.2170, 15.793, 0.00677),
+    "41": (0.3180, 6.520, 0.0303),
+    "51": (0.4410, 3.191, 0.1355),
+}
+
+HISTORY_DIRNAME = "history"
+
+ISLAND_POLLING_INTERVAL = 5.0
+
+MIGRATION_TOPOLOGIES = ("ring", "fullyConnected")
+
+OPTIMIZER_NAMES = ("pso", "cmaes", "differentialEvolution", "surrogate")
+
+GP_LENGTH_SCALE_STARTS = (0.1, 0.3, 1.0)
+
+INITIAL_SAMPLINGS = ("uniform", "latinHypercube", "sobol")
+
+AERODYNAMIC_BACKENDS = ("xfoil", "panel")
@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Union
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class EvaluationCache:
+    def __init__(
+        self, tolerance: float, maximum_size: int = 10000, radius: float = 0.0
+    ) -> None:
+        """
+        In-memory LRU cache of the objective function
+        evaluations, keyed on the variables quantized to
+        a tolerance.
+
+        :param tolerance: quantization step of the variables
+        :param maximum_size: maximum number of evaluations
+            stored, the least recently used are discarded
+        :param radius: if greater than zero, a variables vector
+            without an exact key match returns the nearest
+            stored evaluation within this distance
+        """
+        self.tolerance = tolerance
+        self.maximum_size = maximum_size
+        self.radius = radius
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+        self.__tree = None
+        self.__tree_keys = list()
+
+    @classmethod
+    def from_optimization_data(cls, optimization_data: dict):
+        """
+        Method responsible for instantiating the cache with
+        the parameters of the optimization input, if enabled.
+
+        :param optimization_data: optimization input data
+        ...
+        :return: evaluation cache, or None if the cache
+            tolerance is zero.
+        """
+        tolerance = optimization_data.get("cacheTolerance", 1e-6)
+
+        if not tolerance:
+            return None
+
+        return cls(
+            tolerance=tolerance,
+            maximum_size=optimization_data.get("cacheMaximumSize", 10000),
+            radius=optimization_data.get("cacheRadius", 0.0),
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_EvaluationCache__lock"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def key(self, variables: np.ndarray) -> tuple:
+        """
+        Method responsible for quantizing the variables
+        to the cache tolerance.
+
+        :param variables: variables of the particle
+        ...
+        :return: cache key of the variables
+        """
+        return tuple(np.round(np.asarray(variables) / self.tolerance).astype(np.int64))
+
+    def get(self, variables: np.ndarray) -> Union[tuple, None]:
+        """
+        Method responsible for obtaining the stored evalua-
+        tion of the variables, looking for the exact quan-
+        tized key and, if a radius is set, for the nearest
+        stored variables within it.
+
+        :param variables: variables of the particle
+        ...
+        :return: stored evaluation, or None if not found
+        """
+        key = self.key(variables)
+
+        with self.__lock:
+            if key not in self.__entries and self.radius > 0:
+                key = self.__nearest_key(variables)
+
+            if key is None or key not in self.__entries:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+
+            return self.__entries[key]
+
+    def put(self, variables: np.ndarray, evaluation: tuple) -> None:
+        """
+        Method responsible for storing the evaluation of the
+        variables, discarding the least recently used ones
+        if the maximum size is reached.
+
+        :param variables: variables of the particle
+        :param evaluation: evaluation to be stored
+        """
+        key = self.key(variables)
+
+        with self.__lock:
+            self.__entries[key] = evaluation
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.maximum_size:
+                self.__entries.popitem(last=False)
+
+            self.__tree = None
+
+    def __nearest_key(self, variables: np.ndarray) -> Union[tuple, None]:
+        """
+        Method responsible for looking for the nearest stored
+        variables within the cache radius, using a KD-tree
+        rebuilt only after the cache changes.
+
+        :param variables: variables of the particle
+        ...
+        :return: key of the nearest evaluation, or None
+        """
+        if not self.__entries:
+            return None
+
+        if self.__tree is None:
+            self.__tree_keys = list(self.__entries.keys())
+            self.__tree = cKDTree(np.array(self.__tree_keys) * self.tolerance)
+
+        distance, index = self.__tree.query(np.asarray(variables))
+
+        return self.__tree_keys[index] if distance <= self.radius else None
+
+    def report(self) -> str:
+        """
+        Method responsible for summarizing the cache usage.
+
+        :return: message with the hits and misses
+        """
+        total = self.hits + self.misses
+        hit_rate = 100 * self.hits / total if total else 0.0
+
+        return (
+            f"Evaluation cache: {self.hits} hits, {self.misses} misses "
+            f"({hit_rate:.1f}% hit rate), {len(self)} evaluations stored"
+        )
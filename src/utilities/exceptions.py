@@ -14,4 +14,10 @@ class ErrorAirfoilShape(Exception):
     pass
 
 class ErrorMaximumXfoilInstances(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class ErrorIslandsParameters(Exception):
+    pass
+
+class ErrorOptimizerParameters(Exception):
+    pass
@@ -0,0 +1,310 @@
+from functools import lru_cache
+
+import numpy as np
+
+from src.utilities.constants import POINTS_BETWEEN_POINTS_P
+
+
+@lru_cache(maxsize=None)
+def bernstein_basis(points: int = POINTS_BETWEEN_POINTS_P) -> np.ndarray:
+    """
+    Method responsible for creating the cubic Bernstein
+    basis sampled at the points of each bezier segment,
+    cached per sampling density.
+
+    :param points: number of points per segment
+    ...
+    :return: read only array of shape (points, 4)
+    """
+    t = np.linspace(0, 1, num=points)
+    basis = np.stack(
+        ((1 - t) ** 3, 3 * t * (1 - t) ** 2, 3 * t**2 * (1 - t), t**3), axis=1
+    )
+    basis.setflags(write=False)
+
+    return basis
+
+
+def sample_bezier_segments(
+    p_points: np.ndarray,
+    a_points: np.ndarray,
+    b_points: np.ndarray,
+    points: int = POINTS_BETWEEN_POINTS_P,
+) -> np.ndarray:
+    """
+    Method responsible for sampling all the cubic bezier
+    segments of the splines with one matrix product.
+
+    :param p_points: P points, of shape (..., n + 1)
+    :param a_points: A points, of shape (..., n)
+    :param b_points: B points, of shape (..., n)
+    :param points: number of points per segment
+    ...
+    :return: spline points, of shape (..., n * points)
+    """
+    control = np.stack(
+        (p_points[..., :-1], a_points, b_points, p_points[..., 1:]), axis=-1
+    )
+    samples = control @ bernstein_basis(points).T
+
+    return samples.reshape(samples.shape[:-2] + (-1,))
+
+
+def first_occurrence_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for marking the first occurrence of
+    each value along the last axis, used for removing the
+    duplicated points of the splines.
+
+    :param values: array of shape (..., points)
+    ...
+    :return: boolean mask, True for the first occurrences
+    """
+    order = np.argsort(values, axis=-1, kind="stable")
+    sorted_values = np.take_along_axis(values, order, axis=-1)
+
+    repeated = np.zeros(values.shape, dtype=bool)
+    repeated[..., 1:] = sorted_values[..., 1:] == sorted_values[..., :-1]
+
+    mask = np.empty(values.shape, dtype=bool)
+    np.put_along_axis(mask, order, ~repeated, axis=-1)
+
+    return mask
+
+
+@lru_cache(maxsize=None)
+def bezier_system_factorization(n: int) -> tuple:
+    """
+    Method responsible for factorizing the tridiagonal
+    system which relates the bezier A points to the P
+    points, cached per quantity of segments. The system
+    is diagonally dominant, so the LU factorization is
+    done without pivoting.
+
+    :param n: quantity of bezier segments
+    ...
+    :return: multipliers of the lower factor, diagonal
+        and upper diagonal of the upper factor
+    """
+    diagonal = np.full(n, 4.0)
+    diagonal[0], diagonal[-1] = 2.0, 7.0
+
+    lower_diagonal = np.ones(n - 1)
+    lower_diagonal[-1] = 2.0
+
+    upper_diagonal = np.ones(n - 1)
+
+    multipliers = np.zeros(n - 1)
+    pivots = diagonal.copy()
+
+    for i in range(1, n):
+        multipliers[i - 1] = lower_diagonal[i - 1] / pivots[i - 1]
+        pivots[i] = diagonal[i] - multipliers[i - 1] * upper_diagonal[i - 1]
+
+    for factor in (multipliers, pivots, upper_diagonal):
+        factor.setflags(write=False)
+
+    return multipliers, pivots, upper_diagonal
+
+
+def solve_a_points(p_points: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for obtaining the bezier A points
+    of the P points, solving the tridiagonal system with
+    its cached factorization.
+
+    :param p_points: P points, of shape (..., n + 1)
+    ...
+    :return: A points, of shape (..., n)
+    """
+    p_points = np.asarray(p_points, dtype=float)
+    n = p_points.shape[-1] - 1
+    multipliers, pivots, upper_diagonal = bezier_system_factorization(n)
+
+    a_points = 2 * (2 * p_points[..., :-1] + p_points[..., 1:])
+    a_points[..., 0] = p_points[..., 0] + 2 * p_points[..., 1]
+    a_points[..., -1] = 8 * p_points[..., -2] + p_points[..., -1]
+
+    for i in range(1, n):
+        a_points[..., i] -= multipliers[i - 1] * a_points[..., i - 1]
+
+    a_points[..., -1] /= pivots[-1]
+
+    for i in range(n - 2, -1, -1):
+        a_points[..., i] = (
+            a_points[..., i] - upper_diagonal[i] * a_points[..., i + 1]
+        ) / pivots[i]
+
+    return a_points
+
+
+@lru_cache(maxsize=None)
+def p_points_recurrence(n: int) -> np.ndarray:
+    """
+    Method responsible for creating the matrix of the P
+    points recurrence, cached per quantity of segments.
+    As the recurrence is linear, the new P points are the
+    product of this matrix by the A points followed by the
+    first and last P points.
+
+    :param n: quantity of bezier segments
+    ...
+    :return: read only array of shape (n + 1, n + 2)
+    """
+    basis = np.eye(n + 2)
+    a, first, last = basis[:n], basis[n], basis[n + 1]
+
+    recurrence = np.zeros((n + 1, n + 2))
+    recurrence[0] = first
+    recurrence[1] = (2 * a[0] + a[1] - first) / 2
+
+    for i in range(1, n - 2):
+        recurrence[i + 1] = (a[i - 1] + 4 * a[i] + a[i + 1]) / 2 - 2 * recurrence[i]
+
+    recurrence[n - 1] = (2 * a[n - 2] + 7 * a[n - 1] - last) / 8
+    recurrence[n] = last
+    recurrence.setflags(write=False)
+
+    return recurrence
+
+
+def create_p_points(a_points: np.ndarray, p_points: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for creating the new P points after
+    any movement in the A points, keeping the first and the
+    last P points.
+
+    :param a_points: A points, of shape (..., n)
+    :param p_points: old P points, of shape (..., n + 1)
+    ...
+    :return: new P points, of shape (..., n + 1)
+    """
+    n = a_points.shape[-1]
+    terms = np.concatenate(
+        (a_points, p_points[..., :1], p_points[..., -1:]), axis=-1
+    )
+
+    return terms @ p_points_recurrence(n).T
+
+
+def create_b_points(a_points: np.ndarray, p_points: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for creating the B points based on
+    the P and A points.
+
+    :param a_points: A points, of shape (..., n)
+    :param p_points: P points, of shape (..., n + 1)
+    ...
+    :return: B points, of shape (..., n)
+    """
+    b_points = np.empty(a_points.shape)
+    b_points[..., :-1] = 2 * p_points[..., 1:-1] - a_points[..., 1:]
+    b_points[..., -1] = (a_points[..., -1] + p_points[..., -1]) / 2
+
+    return b_points
+
+
+@lru_cache(maxsize=None)
+def segment_pairs(segments: int) -> tuple:
+    """
+    Method responsible for listing the pairs of non adja-
+    cent segments (i, j), with j < i - 1, of a spline, ca-
+    ched per quantity of segments.
+
+    :param segments: quantity of segments of the spline
+    ...
+    :return: read only arrays of the i and j indexes
+    """
+    i_pairs, j_pairs = np.tril_indices(segments, k=-2)
+
+    for pairs in (i_pairs, j_pairs):
+        pairs.setflags(write=False)
+
+    return i_pairs, j_pairs
+
+
+def count_self_intersections(
+    splines: np.ndarray, limit: int = None, chunk_size: int = 2**20
+):
+    """
+    Method responsible for counting the pairs of non adja-
+    cent segments of the spline whose lines intersect at an
+    abscissa inside both segments, evaluating blocks of
+    segment pairs at once. Only the pairs whose abscissa
+    intervals overlap can intersect, so the others are
+    discarded before any arithmetic.
+
+    :param splines: spline points, of shape (2, points), or
+        a batch of splines of shape (..., 2, points)
+    :param limit: if given, the counting stops as soon as
+        every count exceeds this value
+    :param chunk_size: maximum quantity of segment pairs
+        evaluated at once, bounding the memory usage
+    ...
+    :return: quantity of intersecting segment pairs, an ar-
+        ray of shape (...) for a batch of splines
+    """
+    batch = splines.reshape(
+        (int(np.prod(splines.shape[:-2])),) + splines.shape[-2:]
+    )
+
+    x1, x2 = batch[:, 0, :-1].T, batch[:, 0, 1:].T
+    y1, y2 = batch[:, 1, :-1].T, batch[:, 1, 1:].T
+
+    dx, dy = x1 - x2, y1 - y2
+    x_min, x_max = np.minimum(x1, x2), np.maximum(x1, x2)
+    cross = x1 * y2 - y1 * x2
+
+    i_pairs, j_pairs = segment_pairs(len(x1))
+    step = max(1, chunk_size // max(len(batch), 1))
+    count = np.zeros(len(batch), dtype=int)
+
+    for start in range(0, len(i_pairs), step):
+        i, j = i_pairs[start : start + step], j_pairs[start : start + step]
+
+        overlapping, items = np.nonzero(
+            (x_min[i] <= x_max[j]) & (x_min[j] <= x_max[i])
+        )
+        i, j = i[overlapping], j[overlapping]
+
+        d = dx[i, items] * dy[j, items] - dy[i, items] * dx[j, items]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xs = (cross[i, items] * dx[j, items] - dx[i, items] * cross[j, items]) / d
+
+        intersecting = (
+            (d != 0)
+            & (xs >= x_min[i, items])
+            & (xs <= x_max[i, items])
+            & (xs >= x_min[j, items])
+            & (xs <= x_max[j, items])
+        )
+        count += np.bincount(items[intersecting], minlength=len(batch))
+
+        if limit is not None and np.all(count > limit):
+            break
+
+    if splines.ndim == 2:
+        return int(count[0])
+
+    return count.reshape(splines.shape[:-2])
+
+
+def airfoil_shape_metrics(splines: list) -> np.ndarray:
+    """
+    Method responsible for obtaining basic shape metrics of
+    airfoil splines of any lengths at once, by reducing over
+    their concatenated points.
+
+    :param splines: list of splines, of shape (2, points)
+    ...
+    :return: maximum thickness of each spline, taken as its
+        height
+    """
+    lengths = np.array([spline.shape[1] for spline in splines])
+    starts = np.r_[0, np.cumsum(lengths)[:-1]]
+    points = np.hstack(splines)
+
+    return np.maximum.reduceat(points[1], starts) - np.minimum.reduceat(
+        points[1], starts
+    )
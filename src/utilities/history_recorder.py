@@ -0,0 +1,110 @@
+import os
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .constants import SCALAR_RESULTS
+
+
+class HistoryRecorder:
+    def __init__(self, history_dir: str) -> None:
+        """
+        Append-only record of the optimization history,
+        written as one npz chunk per iteration, holding
+        the variables, the objective function and the
+        scalar results of each particle.
+
+        :param history_dir: directory of the chunks
+        """
+        self.history_dir = history_dir
+
+        os.makedirs(history_dir, exist_ok=True)
+
+    @property
+    def iterations(self) -> List[int]:
+        """
+        Iterations already recorded, in ascending order.
+        """
+        return sorted(
+            int(file[len("iteration") : -len(".npz")])
+            for file in os.listdir(self.history_dir)
+            if file.startswith("iteration") and file.endswith(".npz")
+        )
+
+    def record(self, t: int, particles: dict) -> None:
+        """
+        Method responsible for appending the state of the
+        particles in the iteration t to the history.
+
+        :param t: the step iteration
+        :param particles: dict of particles
+        """
+        chunk_file = self.__chunk_file(t)
+        temporary_file = chunk_file + ".tmp"
+
+        with open(temporary_file, "wb") as writer:
+            np.savez(
+                writer,
+                idParticle=np.array(list(particles.keys())),
+                objective=np.array(
+                    [p.objective_function for p in particles.values()], dtype=float
+                ),
+                variables=np.array([p.variables for p in particles.values()]),
+                results=self.scalar_results(particles),
+            )
+
+        os.replace(temporary_file, chunk_file)
+
+    def read(self) -> Iterator[Tuple[int, Dict[str, np.ndarray]]]:
+        """
+        Method responsible for reading the history lazily,
+        one iteration at a time.
+
+        :return: iterator of the iteration and its arrays
+        """
+        for t in self.iterations:
+            with np.load(self.__chunk_file(t)) as chunk:
+                yield t, {key: chunk[key] for key in chunk.files}
+
+    def truncate(self, last_iteration: int) -> None:
+        """
+        Method responsible for removing the iterations re-
+        corded after the last iteration, used when an opti-
+        mization is resumed from a checkpoint.
+
+        :param last_iteration: last iteration kept
+        """
+        for t in self.iterations:
+            if t > last_iteration:
+                os.remove(self.__chunk_file(t))
+
+    def clear(self) -> None:
+        """
+        Method responsible for removing all the iterations
+        recorded.
+        """
+        self.truncate(0)
+
+    def __chunk_file(self, t: int) -> str:
+        return os.path.join(self.history_dir, f"iteration{t:06d}.npz")
+
+    @staticmethod
+    def scalar_results(particles: dict) -> np.ndarray:
+        """
+        Method responsible for gathering the scalar results
+        of the propeller of each particle.
+
+        :param particles: dict of particles
+        ...
+        :return: array of shape (particles, scalar results)
+        """
+        return np.array(
+            [
+                [
+                    np.nan if p.results.get(key) is None else p.results.get(key)
+                    for key in SCALAR_RESULTS
+                ]
+                for p in particles.values()
+            ],
+            dtype=float,
+        )
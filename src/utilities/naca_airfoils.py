@@ -0,0 +1,149 @@
+import re
+from typing import Union
+
+import numpy as np
+
+from .constants import (
+    NACA_COORDINATES_POINTS,
+    NACA_FIVE_DIGIT_CAMBER_LINES,
+    NACA_PANEL_CURVATURE_WEIGHT,
+    NACA_PANEL_NODES,
+)
+
+
+def naca_designation(airfoil_name: str) -> Union[str, None]:
+    """
+    Method responsible for obtaining the digits of a NACA
+    4 or 5-digit airfoil name, like 'naca 0020'.
+
+    :param airfoil_name: airfoil name
+    ...
+    :return: digits of the airfoil, or None if the name is
+        not a supported NACA airfoil
+    """
+    match = re.fullmatch(r"\s*naca\s*(\d{4}|\d{5})\s*", str(airfoil_name), re.I)
+
+    if match is None:
+        return None
+
+    designation = match.group(1)
+    if len(designation) == 5 and designation[1:3] not in NACA_FIVE_DIGIT_CAMBER_LINES:
+        return None
+
+    return designation
+
+
+def naca_coordinates(
+    designation: str, points: int = NACA_COORDINATES_POINTS
+) -> np.ndarray:
+    """
+    Method responsible for generating the coordinates of a
+    NACA 4 or 5-digit airfoil, with closed trailing edge and
+    cosine spacing, from the trailing edge along the upper
+    surface to the leading edge and back along the lower
+    surface.
+
+    :param designation: digits of the airfoil
+    :param points: quantity of points per surface
+    ...
+    :return: array of shape (2, 2 * points - 1)
+    """
+    x = (1 - np.cos(np.linspace(0, np.pi, points))) / 2
+    thickness = int(designation[-2:]) / 100
+
+    yt = (
+        5
+        * thickness
+        * (
+            0.2969 * np.sqrt(x)
+            - 0.1260 * x
+            - 0.3516 * x**2
+            + 0.2843 * x**3
+            - 0.1036 * x**4
+        )
+    )
+
+    if len(designation) == 4:
+        m, p = int(designation[0]) / 100, int(designation[1]) / 10
+
+        if m and p:
+            yc = np.where(
+                x < p,
+                m / p**2 * (2 * p * x - x**2),
+                m / (1 - p) ** 2 * (1 - 2 * p + 2 * p * x - x**2),
+            )
+            dyc = np.where(x < p, 2 * m / p**2 * (p - x), 2 * m / (1 - p) ** 2 * (p - x))
+        else:
+            yc, dyc = np.zeros_like(x), np.zeros_like(x)
+    else:
+        m, k1, k2_k1 = NACA_FIVE_DIGIT_CAMBER_LINES.get(designation[1:3])
+        scale = int(designation[0]) / 2
+
+        yc = np.where(
+            x < m,
+            (x - m) ** 3 - k2_k1 * (1 - m) ** 3 * x - m**3 * x + m**3,
+            k2_k1 * (x - m) ** 3 - k2_k1 * (1 - m) ** 3 * x - m**3 * x + m**3,
+        )
+        dyc = np.where(
+            x < m,
+            3 * (x - m) ** 2 - k2_k1 * (1 - m) ** 3 - m**3,
+            3 * k2_k1 * (x - m) ** 2 - k2_k1 * (1 - m) ** 3 - m**3,
+        )
+        yc, dyc = scale * k1 / 6 * yc, scale * k1 / 6 * dyc
+
+    theta = np.arctan(dyc)
+
+    x_upper, y_upper = x - yt * np.sin(theta), yc + yt * np.cos(theta)
+    x_lower, y_lower = x + yt * np.sin(theta), yc - yt * np.cos(theta)
+
+    return np.array(
+        [
+            np.r_[x_upper[::-1], x_lower[1:]],
+            np.r_[y_upper[::-1], y_lower[1:]],
+        ]
+    )
+
+
+def panel_nodes(
+    coordinates: np.ndarray, quantity: int = NACA_PANEL_NODES
+) -> np.ndarray:
+    """
+    Method responsible for choosing the nodes of a coarse
+    panelling of the airfoil, used as its bezier P points.
+    Both trailing edge points and the leading edge point
+    are nodes, and the others are equally spaced along
+    each surface by the arc length weighted by the curva-
+    ture, as the panelling of xfoil.
+
+    :param coordinates: airfoil coordinates, of shape (2,
+        points), from the upper trailing edge to the lower
+    :param quantity: quantity of nodes, odd
+    ...
+    :return: nodes, of shape (2, quantity)
+    """
+    x, y = coordinates
+    ds = np.hypot(np.diff(x), np.diff(y))
+    s = np.r_[0, np.cumsum(ds)]
+
+    dx, dy = np.gradient(x, s), np.gradient(y, s)
+    curvature = np.abs(dx * np.gradient(dy, s) - dy * np.gradient(dx, s)) / (
+        dx**2 + dy**2
+    ) ** 1.5
+    average_curvature = np.sum((curvature[1:] + curvature[:-1]) / 2 * ds) / s[-1]
+
+    weight = 1 + NACA_PANEL_CURVATURE_WEIGHT * curvature / average_curvature
+    weighted_s = np.r_[0, np.cumsum((weight[1:] + weight[:-1]) / 2 * ds)]
+
+    leading_edge = weighted_s[np.argmin(x)]
+    per_surface = (quantity - 1) // 2
+
+    nodes_s = np.interp(
+        np.r_[
+            np.linspace(0, leading_edge, per_surface + 1),
+            np.linspace(leading_edge, weighted_s[-1], per_surface + 1)[1:],
+        ],
+        weighted_s,
+        s,
+    )
+
+    return np.array([np.interp(nodes_s, s, x), np.interp(nodes_s, s, y)])
@@ -0,0 +1,338 @@
+import numpy as np
+
+from .constants import PANEL_NODES, PANEL_TRAILING_EDGE_CUTOFF, POLAR_COLUMNS
+
+
+def resample_airfoils(splines: list, nodes: int = PANEL_NODES) -> np.ndarray:
+    """
+    Method responsible for resampling airfoil splines of any
+    lengths to the same number of nodes, ordered clockwise
+    from the trailing edge along the lower surface, with a
+    cosine spacing in arc length on each surface, which
+    clusters the nodes at the leading and trailing edges.
+
+    :param splines: list of splines, of shape (2, points)
+    :param nodes: number of nodes, must be odd
+    ...
+    :return: array of shape (splines, 2, nodes)
+    """
+    half = (nodes - 1) // 2
+    spacing = (1 - np.cos(np.linspace(0, np.pi, half + 1))) / 2
+
+    resampled = np.empty((len(splines), 2, nodes))
+
+    for i, spline in enumerate(splines):
+        x, y = spline
+        if np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y) > 0:
+            x, y = x[::-1], y[::-1]
+
+        arc = np.r_[0, np.cumsum(np.hypot(np.diff(x), np.diff(y)))]
+        leading_edge = arc[np.argmin(x)]
+
+        s = np.r_[
+            leading_edge * spacing,
+            leading_edge + (arc[-1] - leading_edge) * spacing[1:],
+        ]
+        resampled[i, 0] = np.interp(s, arc, x)
+        resampled[i, 1] = np.interp(s, arc, y)
+
+    return resampled
+
+
+def solve_vortex_panels(points: np.ndarray, alpha: np.ndarray) -> tuple:
+    """
+    Method responsible for solving the linear strength vor-
+    tex panel method of a batch of airfoils, with the zero
+    normal velocity at the panel midpoints and the Kutta
+    condition at the trailing edge.
+
+    :param points: clockwise nodes, of shape (batch, 2, n + 1)
+    :param alpha: angle of attack of each airfoil, in radians
+    ...
+    :return: tangential velocity at the panel midpoints and
+        panel lengths, of shape (batch, n), both relative to
+        the free stream velocity and to the chord
+    """
+    x, y = points[:, 0], points[:, 1]
+    n = x.shape[1] - 1
+
+    xc, yc = (x[:, :-1] + x[:, 1:]) / 2, (y[:, :-1] + y[:, 1:]) / 2
+    length = np.hypot(np.diff(x), np.diff(y))
+    theta = np.arctan2(np.diff(y), np.diff(x))
+
+    dx = xc[:, :, None] - x[:, None, :-1]
+    dy = yc[:, :, None] - y[:, None, :-1]
+    theta_i, theta_j = theta[:, :, None], theta[:, None, :]
+    s_j = length[:, None, :]
+
+    a = -dx * np.cos(theta_j) - dy * np.sin(theta_j)
+    b = dx**2 + dy**2
+    c = np.sin(theta_i - theta_j)
+    d = np.cos(theta_i - theta_j)
+    e = dx * np.sin(theta_j) - dy * np.cos(theta_j)
+    f = np.log1p(s_j * (s_j + 2 * a) / b)
+    g = np.arctan2(e * s_j, b + a * s_j)
+    p = dx * np.sin(theta_i - 2 * theta_j) + dy * np.cos(theta_i - 2 * theta_j)
+    q = dx * np.cos(theta_i - 2 * theta_j) - dy * np.sin(theta_i - 2 * theta_j)
+
+    cn2 = d + 0.5 * q * f / s_j - (a * c + d * e) * g / s_j
+    cn1 = 0.5 * d * f + c * g - cn2
+    ct2 = c + 0.5 * p * f / s_j + (a * d - c * e) * g / s_j
+    ct1 = 0.5 * c * f - d * g - ct2
+
+    diagonal = np.arange(n)
+    cn1[:, diagonal, diagonal], cn2[:, diagonal, diagonal] = -1.0, 1.0
+    ct1[:, diagonal, diagonal], ct2[:, diagonal, diagonal] = np.pi / 2, np.pi / 2
+
+    normal = np.zeros((len(x), n + 1, n + 1))
+    normal[:, :n, :n] += cn1
+    normal[:, :n, 1:] += cn2
+    normal[:, n, [0, n]] = 1.0
+
+    tangential = np.zeros((len(x), n, n + 1))
+    tangential[:, :, :n] += ct1
+    tangential[:, :, 1:] += ct2
+
+    rhs = np.zeros((len(x), n + 1))
+    rhs[:, :n] = np.sin(theta - alpha[:, None])
+
+    gamma = np.linalg.solve(normal, rhs[..., None])[..., 0]
+    velocity = np.cos(theta - alpha[:, None]) + np.einsum(
+        "bij,bj->bi", tangential, gamma
+    )
+
+    return velocity, length
+
+
+def boundary_layer_drag(
+    velocity: np.ndarray, length: np.ndarray, reynolds: np.ndarray
+) -> np.ndarray:
+    """
+    Method responsible for estimating the drag coefficient
+    by the integral boundary layer of both surfaces, marched
+    from the stagnation point: Thwaites' method in the lami-
+    nar part, transition by Michel's criterion or laminar
+    separation, Head's method in the turbulent part and the
+    Squire-Young formula near the trailing edge. The march
+    stops short of the trailing edge, whose inviscid stagna-
+    tion would separate any boundary layer.
+
+    :param velocity: tangential velocity at the panel mid-
+        points, of shape (batch, n)
+    :param length: panel lengths, of shape (batch, n)
+    :param reynolds: reynolds number of each airfoil
+    ...
+    :return: drag coefficient of each airfoil
+    """
+    batch, n = velocity.shape
+    rows = np.arange(batch)[:, None]
+    reynolds = reynolds[:, None]
+
+    arc = np.cumsum(length, axis=1) - length / 2
+
+    changes = np.c_[
+        np.zeros(batch, dtype=bool), (velocity[:, :-1] <= 0) & (velocity[:, 1:] > 0)
+    ]
+    distance = np.where(changes, np.abs(np.arange(n) - n // 2), n)
+    stagnation = np.where(
+        np.any(changes, axis=1), np.argmin(distance, axis=1), n // 2
+    )[:, None]
+
+    v0 = velocity[rows, stagnation - 1]
+    v1 = velocity[rows, stagnation]
+    s0, s1 = arc[rows, stagnation - 1], arc[rows, stagnation]
+    s_stagnation = s0 + (s1 - s0) * np.clip(-v0 / (v1 - v0), 0, 1)
+
+    steps = np.arange(n)[None, :]
+    drag = np.zeros(batch)
+
+    for indexes in (stagnation + steps, stagnation - 1 - steps):
+        valid = (indexes >= 0) & (indexes < n)
+        indexes = np.clip(indexes, 0, n - 1)
+
+        ue = np.maximum(np.abs(velocity[rows, indexes]), 1e-6)
+        s = np.abs(arc[rows, indexes] - s_stagnation)
+        s = np.maximum.accumulate(np.where(valid, s, 0), axis=1)
+
+        valid &= s <= s[:, -1:] - PANEL_TRAILING_EDGE_CUTOFF
+        valid[:, 0] = True
+        last = np.sum(valid, axis=1) - 1
+
+        ds = np.diff(np.c_[np.zeros(batch), s], axis=1)
+        ue5 = ue**5
+        integral = np.cumsum(
+            ds * (ue5 + np.c_[np.zeros(batch), ue5[:, :-1]]) / 2, axis=1
+        )
+        theta_laminar = np.sqrt(0.45 * integral / (reynolds * ue**6))
+
+        dueds = np.gradient(ue, axis=1) / np.maximum(np.gradient(s, axis=1), 1e-9)
+        lam = np.clip(theta_laminar**2 * reynolds * dueds, -0.1, 0.1)
+        h_laminar = np.where(
+            lam >= 0,
+            2.61 - 3.75 * lam + 5.24 * lam**2,
+            2.088 + 0.0731 / (lam + 0.14),
+        )
+
+        re_theta = reynolds * ue * theta_laminar
+        re_x = np.maximum(reynolds * ue * s, 1.0)
+        transition = (re_theta > 1.174 * (1 + 22400 / re_x) * re_x**0.46) | (
+            lam <= -0.09
+        )
+        transition &= valid & (steps > 0)
+        start = np.where(np.any(transition, axis=1), np.argmax(transition, axis=1), n)
+
+        theta = theta_laminar[:, 0].copy()
+        h = h_laminar[:, 0].copy()
+
+        for step in range(1, n):
+            h1 = np.where(
+                h <= 1.6,
+                3.3 + 0.8234 * np.maximum(h - 1.1, 1e-3) ** -1.287,
+                3.3 + 1.5501 * np.maximum(h - 0.6778, 1e-3) ** -3.064,
+            )
+            cf = (
+                0.246
+                * 10 ** (-0.678 * h)
+                * np.maximum(reynolds[:, 0] * ue[:, step - 1] * theta, 1.0) ** -0.268
+            )
+            entrainment = 0.0306 * np.maximum(h1 - 3, 1e-3) ** -0.6169
+
+            theta_new = np.maximum(
+                theta
+                + (cf / 2 - (h + 2) * theta / ue[:, step - 1] * dueds[:, step - 1])
+                * ds[:, step],
+                1e-9,
+            )
+            h1_new = (
+                ue[:, step - 1] * (theta * h1 + entrainment * ds[:, step])
+            ) / (ue[:, step] * theta_new)
+            h_new = np.clip(
+                np.where(
+                    h1_new >= 5.3,
+                    1.1 + (np.maximum(h1_new - 3.3, 1e-3) / 0.8234) ** (-1 / 1.287),
+                    0.6778
+                    + (np.maximum(h1_new - 3.3, 1e-3) / 1.5501) ** (-1 / 3.064),
+                ),
+                1.1,
+                3.0,
+            )
+
+            marching = valid[:, step]
+            laminar = marching & (step < start)
+            turbulent = marching & (step > start)
+
+            theta = np.select(
+                [laminar, turbulent], [theta_laminar[:, step], theta_new], theta
+            )
+            h = np.select(
+                [laminar, turbulent, marching & (step == start)],
+                [h_laminar[:, step], h_new, 1.4],
+                h,
+            )
+
+        ue_trailing_edge = ue[np.arange(batch), last]
+        drag += 2 * theta * ue_trailing_edge ** ((h + 5) / 2)
+
+    return drag
+
+
+def panel_coefficients(
+    splines: list,
+    alpha: np.ndarray,
+    reynolds: np.ndarray,
+    nodes: int = PANEL_NODES,
+    chunk_size: int = 64,
+) -> tuple:
+    """
+    Method responsible for obtaining the cl and cd of a batch
+    of airfoils with the vortex panel method and the integral
+    boundary layer, solving chunks of airfoils at once. The
+    cl is the inviscid one, taken from the circulation. The
+    airfoils without a valid solution have the cl and cd
+    values 0 and 1, as the xfoil results not converged.
+
+    :param splines: list of splines, of shape (2, points)
+    :param alpha: angle of attack of each airfoil, in degrees
+    :param reynolds: reynolds number of each airfoil
+    :param nodes: number of panel nodes, must be odd
+    :param chunk_size: maximum number of airfoils solved at
+        once, bounding the memory usage
+    ...
+    :return: cl and cd of each airfoil
+    """
+    alpha = np.radians(np.broadcast_to(np.asarray(alpha, dtype=float), len(splines)))
+    reynolds = np.broadcast_to(np.asarray(reynolds, dtype=float), len(splines))
+
+    def solve(points: np.ndarray, alpha: np.ndarray, reynolds: np.ndarray):
+        """
+        Method responsible for obtaining the cl and cd of the
+        resampled airfoils.
+
+        :param points: clockwise nodes, of shape (batch, 2, n + 1)
+        :param alpha: angle of attack, in radians
+        :param reynolds: reynolds number
+        ...
+        :return: cl and cd of each airfoil
+        """
+        chord = np.ptp(points[:, 0], axis=1)
+
+        with np.errstate(all="ignore"):
+            velocity, length = solve_vortex_panels(points, alpha)
+            cl = 2 * np.sum(velocity * length, axis=1) / chord
+            cd = boundary_layer_drag(velocity, length / chord[:, None], reynolds)
+
+        return cl, cd
+
+    cl, cd = np.zeros(len(splines)), np.ones(len(splines))
+
+    for start in range(0, len(splines), chunk_size):
+        chunk = np.arange(start, min(start + chunk_size, len(splines)))
+        points = resample_airfoils([splines[i] for i in chunk], nodes)
+
+        try:
+            cl_chunk, cd_chunk = solve(points, alpha[chunk], reynolds[chunk])
+        except np.linalg.LinAlgError:
+            cl_chunk, cd_chunk = np.zeros(len(chunk)), np.full(len(chunk), np.nan)
+
+            for i in range(len(chunk)):
+                item = slice(i, i + 1)
+                try:
+                    cl_chunk[item], cd_chunk[item] = solve(
+                        points[item], alpha[chunk[item]], reynolds[chunk[item]]
+                    )
+                except np.linalg.LinAlgError:
+                    continue
+
+        solved = np.isfinite(cl_chunk) & np.isfinite(cd_chunk) & (cd_chunk > 0)
+        cl[chunk] = np.where(solved, cl_chunk, 0.0)
+        cd[chunk] = np.where(solved, cd_chunk, 1.0)
+
+    return cl, cd
+
+
+def panel_polar(spline: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for obtaining the polar of an airfoil
+    with the panel method, in the same form of the xfoil
+    polars of XfoilManagement.execute_xfoil_polar.
+
+    :param spline: airfoil spline, of shape (2, points), or
+        None if the airfoil is intersected
+    :param points: array of shape (points, 3) with the angle
+        of attack, reynolds and mach numbers
+    ...
+    :return: polar of shape (points, 6), with the POLAR_COLUMNS
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    polar = np.zeros((len(points), len(POLAR_COLUMNS)))
+    polar[:, :3] = points
+    polar[:, 4] = 1
+
+    if spline is None or not len(points):
+        return polar
+
+    cl, cd = panel_coefficients([spline] * len(points), points[:, 0], points[:, 1])
+    polar[:, 3], polar[:, 4] = cl, cd
+    polar[:, 5] = (cl != 0) | (cd != 1)
+
+    return polar
@@ -0,0 +1,242 @@
+import hashlib
+import os
+import sqlite3
+from threading import Lock
+
+import numpy as np
+
+from .constants import POLAR_DATABASE_PATH, POLAR_DATABASE_VERSION
+from .xfoil_sandbox import xfoil_executable
+
+
+class PolarDatabase:
+    connections = dict()
+    connections_lock = Lock()
+
+    def __init__(self, path: str = POLAR_DATABASE_PATH) -> None:
+        """
+        Persistent store of the xfoil results, shared by the
+        runs and their worker processes, keyed by the hash of
+        the airfoil coordinates file and the operating point
+        (angle of attack, reynolds and mach numbers) and the
+        xfoil configuration (ncrit, number of panels and ma-
+        ximum iterations). The results are also keyed by the
+        hash of the xfoil executable, and their table by the
+        POLAR_DATABASE_VERSION, which must be increased when-
+        ever the xfoil commands change, so the results of
+        another xfoil build or commands are not reused. It
+        is an SQLite database in write-ahead logging mode,
+        so many processes may read while one writes, with
+        a single connection per process, shared by its
+        threads and by the copies of the database sent to
+        its tasks.
+
+        :param path: path of the database file
+        """
+        self.path = path
+        self.solver = self.solver_hash()
+        self.table = f"polars_v{POLAR_DATABASE_VERSION}"
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.__execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "solver TEXT, airfoil TEXT, alpha REAL, reynolds REAL, mach REAL, "
+            "ncrit REAL, panels INTEGER, iterations INTEGER, cl REAL, cd REAL, "
+            "PRIMARY KEY "
+            "(solver, airfoil, alpha, reynolds, mach, ncrit, panels, iterations))",
+            (),
+        )
+
+    @classmethod
+    def from_optimization_data(cls, optimization_data: dict):
+        """
+        Method responsible for instantiating the database with
+        the parameters of the optimization input, if enabled.
+
+        :param optimization_data: optimization input data
+        ...
+        :return: polar database, or None if its path is empty
+        """
+        path = optimization_data.get("polarDatabase", POLAR_DATABASE_PATH)
+
+        if not path:
+            return None
+
+        return cls(path=path)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_PolarDatabase__lock"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    def __execute(self, statement: str, parameters, many: bool = False) -> list:
+        """
+        Method responsible for executing a statement in the
+        connection of the current process, opening it on the
+        first use. The statements of the threads are execu-
+        ted one at a time.
+
+        :param statement: SQL statement
+        :param parameters: parameters of the statement, or a
+            list of them if many is True
+        :param many: if True, the statement is executed for
+            each parameters
+        ...
+        :return: rows returned by the statement
+        """
+        key = (os.getpid(), os.path.abspath(self.path))
+
+        with PolarDatabase.connections_lock:
+            if key not in PolarDatabase.connections:
+                connection = sqlite3.connect(
+                    self.path,
+                    timeout=60,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+
+                PolarDatabase.connections[key] = connection
+
+            connection = PolarDatabase.connections[key]
+            if many:
+                return connection.executemany(statement, parameters).fetchall()
+
+            return connection.execute(statement, parameters).fetchall()
+
+    @staticmethod
+    def solver_hash() -> str:
+        """
+        Method responsible for hashing the content of the
+        xfoil executable.
+
+        :return: hexadecimal digest of the executable, or
+            an empty string if it is not found
+        """
+        try:
+            with open(xfoil_executable(), "rb") as file:
+                return hashlib.sha1(file.read()).hexdigest()
+        except OSError:
+            return ""
+
+    @staticmethod
+    def airfoil_hash(splines_file: str) -> str:
+        """
+        Method responsible for hashing the content of the
+        airfoil coordinates file.
+
+        :param splines_file: path of the file with the
+            splines coordinates
+        ...
+        :return: hexadecimal digest of the file
+        """
+        with open(splines_file, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+
+    def lookup(self, airfoil: str, points: np.ndarray, configuration: tuple):
+        """
+        Method responsible for obtaining the stored cl and cd
+        of the operating points of an airfoil.
+
+        :param airfoil: hash of the airfoil
+        :param points: array of shape (points, 3) with the
+            angle of attack, reynolds and mach numbers
+        :param configuration: ncrit, number of panels and
+            maximum iterations of xfoil
+        ...
+        :return: array of shape (points, 2) with the cl and
+            cd, NaN for the points not stored
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        coefficients = np.full((len(points), 2), np.nan)
+
+        for i, point in enumerate(points):
+            rows = self.__execute(
+                f"SELECT cl, cd FROM {self.table} WHERE solver = ? "
+                "AND airfoil = ? AND alpha = ? AND reynolds = ? AND mach = ? "
+                "AND ncrit = ? AND panels = ? AND iterations = ?",
+                (self.solver, airfoil, *map(float, point), *configuration),
+            )
+
+            if rows:
+                coefficients[i] = rows[0]
+
+        return coefficients
+
+    def store(
+        self,
+        airfoil: str,
+        points: np.ndarray,
+        coefficients: np.ndarray,
+        configuration: tuple,
+    ) -> None:
+        """
+        Method responsible for storing the cl and cd of the
+        operating points of an airfoil.
+
+        :param airfoil: hash of the airfoil
+        :param points: array of shape (points, 3) with the
+            angle of attack, reynolds and mach numbers
+        :param coefficients: array of shape (points, 2) with
+            the cl and cd
+        :param configuration: ncrit, number of panels and
+            maximum iterations of xfoil
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        coefficients = np.asarray(coefficients, dtype=float).reshape(-1, 2)
+
+        self.__execute(
+            f"INSERT OR REPLACE INTO {self.table} "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    self.solver,
+                    airfoil,
+                    *map(float, point),
+                    *configuration,
+                    *map(float, values),
+                )
+                for point, values in zip(points, coefficients)
+            ],
+            many=True,
+        )
+
+    def record(self, hits: int, misses: int) -> None:
+        """
+        Method responsible for counting the hits and misses
+        of the current run.
+
+        :param hits: number of points found in the database
+        :param misses: number of points executed in xfoil
+        """
+        with self.__lock:
+            self.hits += hits
+            self.misses += misses
+
+    def report(self) -> str:
+        """
+        Method responsible for summarizing the database usage
+        of the current run.
+
+        :return: message with the hits and misses
+        """
+        total = self.hits + self.misses
+        hit_rate = 100 * self.hits / total if total else 0.0
+
+        return (
+            f"Polar database {self.path}: {self.hits} hits, {self.misses} misses "
+            f"({hit_rate:.1f}% hit rate)"
+        )
@@ -0,0 +1,210 @@
+import os
+import time
+from threading import Lock
+from uuid import uuid4
+
+from .constants import SCRATCH_DIRECTORY
+
+
+class ScratchWorkspace:
+    def __init__(
+        self,
+        directory: str = SCRATCH_DIRECTORY,
+        maximum_files: int = 10000,
+        maximum_bytes: int = 2**28,
+        minimum_age: float = 5.0,
+    ) -> None:
+        """
+        Directory of the temporary files of the evalua-
+        tions (airfoil coordinates and xfoil commands and
+        polars), which may be placed in a RAM-backed file
+        system, like /dev/shm. Each evaluation removes its
+        files once the cl and cd are read, and the quantity
+        of files and bytes is kept below the limits. As the
+        directory may be shared by other threads, islands
+        or runs, only the files which are not in use by
+        this workspace and older than the minimum age are
+        removed by the limits.
+
+        :param directory: directory of the temporary files
+        :param maximum_files: maximum quantity of files, the
+            oldest ones are removed above it
+        :param maximum_bytes: maximum quantity of bytes, the
+            oldest files are removed above it
+        :param minimum_age: age of a file, in seconds, below
+            which it may still be in use by another run, as
+            the maximum deadline of the xfoil runs
+        """
+        self.directory = directory
+        self.maximum_files = maximum_files
+        self.maximum_bytes = maximum_bytes
+        self.minimum_age = minimum_age
+
+        self.peak_files = 0
+        self.peak_bytes = 0
+        self.evicted_files = 0
+
+        self.__in_use = set()
+        self.__lock = Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_optimization_data(cls, optimization_data: dict):
+        """
+        Method responsible for instantiating the workspace
+        with the parameters of the optimization input.
+
+        :param optimization_data: optimization input data
+        ...
+        :return: scratch workspace
+        """
+        return cls(
+            directory=optimization_data.get("scratchDirectory", SCRATCH_DIRECTORY),
+            maximum_files=optimization_data.get("scratchMaximumFiles", 10000),
+            maximum_bytes=optimization_data.get("scratchMaximumBytes", 2**28),
+            minimum_age=optimization_data.get("timeoutMaximum", 5.0),
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_ScratchWorkspace__lock"]
+        del state["_ScratchWorkspace__in_use"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__in_use = set()
+        self.__lock = Lock()
+
+    def path(self, prefix: str, extension: str) -> str:
+        """
+        Method responsible for creating a unique file path
+        in the workspace, which is in use until it is re-
+        moved.
+
+        :param prefix: prefix of the filename
+        :param extension: extension of the filename
+        ...
+        :return: path of the file
+        """
+        file_uuid = str(uuid4())[:10].replace("-", "")
+        path = os.path.join(self.directory, f"{prefix}_{file_uuid}.{extension}")
+
+        with self.__lock:
+            self.__in_use.add(os.path.abspath(path))
+
+        return path
+
+    def remove(self, paths: list) -> None:
+        """
+        Method responsible for removing files of the work-
+        space, ignoring the ones already removed, which are
+        no longer in use.
+
+        :param paths: paths of the files, None is ignored
+        """
+        for path in paths:
+            if path is None:
+                continue
+
+            with self.__lock:
+                self.__in_use.discard(os.path.abspath(path))
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def enforce_limits(self) -> None:
+        """
+        Method responsible for measuring the usage of the
+        workspace, updating its peak, and removing the
+        oldest stale files while the quantity of files or
+        bytes is above the limits.
+        """
+        with self.__lock:
+            files = self.__scan()
+
+            quantity = len(files)
+            size = sum(file_size for _, file_size, _ in files)
+
+            self.peak_files = max(self.peak_files, quantity)
+            self.peak_bytes = max(self.peak_bytes, size)
+
+            stale = self.__stale(files)
+
+        for _, file_size, path in stale:
+            if quantity <= self.maximum_files and size <= self.maximum_bytes:
+                break
+
+            self.remove([path])
+            self.evicted_files += 1
+
+            quantity -= 1
+            size -= file_size
+
+    def remove_stale(self) -> None:
+        """
+        Method responsible for removing the stale files of
+        the workspace, as the ones left by interrupted runs.
+        """
+        with self.__lock:
+            stale = self.__stale(self.__scan())
+
+        self.remove([path for _, _, path in stale])
+
+    def __scan(self) -> list:
+        """
+        Method responsible for listing the files of the
+        workspace.
+
+        :return: list of (modification time, size, path) of
+            each file
+        """
+        files = list()
+        for entry in os.scandir(self.directory):
+            if entry.name == ".gitkeep" or not entry.is_file():
+                continue
+
+            try:
+                status = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            files.append((status.st_mtime, status.st_size, entry.path))
+
+        return files
+
+    def __stale(self, files: list) -> list:
+        """
+        Method responsible for selecting the files which are
+        not in use by this workspace and older than the mini-
+        mum age, so no other run is still using them.
+
+        :param files: list of (modification time, size, path)
+            of each file
+        ...
+        :return: stale files, from the oldest
+        """
+        deadline = time.time() - self.minimum_age
+
+        return [
+            (modified, file_size, path)
+            for modified, file_size, path in sorted(files)
+            if modified < deadline and os.path.abspath(path) not in self.__in_use
+        ]
+
+    def report(self) -> str:
+        """
+        Method responsible for summarizing the workspace
+        usage.
+
+        :return: message with the peak usage
+        """
+        return (
+            f"Scratch workspace {self.directory}: peak of {self.peak_files} files "
+            f"and {self.peak_bytes / 2**20:.2f} MiB, "
+            f"{self.evicted_files} files removed by the limits"
+        )
@@ -0,0 +1,164 @@
+from collections import deque
+from threading import Lock
+
+import numpy as np
+
+
+class TimeoutPolicy:
+    def __init__(
+        self,
+        initial: float = 1.0,
+        percentile: float = 99.0,
+        factor: float = 2.0,
+        minimum: float = 0.25,
+        maximum: float = 5.0,
+        warm_up: int = 20,
+        window: int = 500,
+    ) -> None:
+        """
+        Deadline of the xfoil runs, taken from the distribu-
+        tion of the run times observed per configuration
+        (number of panels, maximum iterations and reynolds
+        number). Until a configuration has enough runs, the
+        initial deadline is used.
+
+        :param initial: deadline of the configurations with-
+            out enough runs, in seconds
+        :param percentile: percentile of the run times
+        :param factor: factor applied to the percentile
+        :param minimum: minimum deadline, in seconds
+        :param maximum: maximum deadline, in seconds
+        :param warm_up: number of runs of a configuration be-
+            fore its run times are used
+        :param window: number of the latest run times kept
+            per configuration
+        """
+        self.initial = initial
+        self.percentile = percentile
+        self.factor = factor
+        self.minimum = minimum
+        self.maximum = maximum
+        self.warm_up = warm_up
+        self.window = window
+
+        self.runs = 0
+        self.timeouts = 0
+        self.kills = 0
+        self.fallbacks = 0
+        self.timeout_fallbacks = 0
+
+        self.__run_times = dict()
+        self.__lock = Lock()
+
+    @classmethod
+    def from_optimization_data(cls, optimization_data: dict):
+        """
+        Method responsible for instantiating the policy with
+        the parameters of the optimization input.
+
+        :param optimization_data: optimization input data
+        ...
+        :return: timeout policy
+        """
+        return cls(
+            initial=optimization_data.get("timeoutInitial", 1.0),
+            percentile=optimization_data.get("timeoutPercentile", 99.0),
+            factor=optimization_data.get("timeoutFactor", 2.0),
+            minimum=optimization_data.get("timeoutMinimum", 0.25),
+            maximum=optimization_data.get("timeoutMaximum", 5.0),
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_TimeoutPolicy__lock"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    @staticmethod
+    def configuration(panels: int, iterations: int, reynolds: float) -> tuple:
+        """
+        Method responsible for creating the key of a run
+        configuration, rounding the reynolds number to three
+        significant digits.
+
+        :param panels: number of panels of the airfoil
+        :param iterations: maximum iterations of xfoil
+        :param reynolds: reynolds number
+        ...
+        :return: configuration key
+        """
+        return panels, iterations, float(f"{reynolds:.2e}")
+
+    def timeout(self, configuration: tuple) -> float:
+        """
+        Method responsible for obtaining the deadline of a
+        run of the configuration.
+
+        :param configuration: configuration key
+        ...
+        :return: deadline, in seconds
+        """
+        with self.__lock:
+            run_times = self.__run_times.get(configuration, ())
+
+            if len(run_times) < self.warm_up:
+                return self.initial
+
+            return float(
+                np.clip(
+                    self.factor * np.percentile(run_times, self.percentile),
+                    self.minimum,
+                    self.maximum,
+                )
+            )
+
+    def record(self, configuration: tuple, run: dict, fallback: bool) -> None:
+        """
+        Method responsible for recording a run. The run times
+        of the runs stopped by the deadline are not recorded,
+        as only a lower bound of them is known.
+
+        :param configuration: configuration key
+        :param run: statistics of the run, with its run time
+            and if it timed out and its process was killed
+        :param fallback: if the run returned the fallback cl
+            and cd values
+        """
+        with self.__lock:
+            self.runs += 1
+            self.kills += run.get("killed")
+            self.fallbacks += fallback
+
+            if run.get("timedOut"):
+                self.timeouts += 1
+                self.timeout_fallbacks += fallback
+
+                return
+
+            if configuration not in self.__run_times:
+                self.__run_times[configuration] = deque(maxlen=self.window)
+
+            self.__run_times[configuration].append(run.get("runTime"))
+
+    def report(self) -> str:
+        """
+        Method responsible for summarizing the xfoil runs and
+        the current deadline of each configuration.
+
+        :return: message with the timeouts and fallbacks
+        """
+        deadlines = ", ".join(
+            f"{configuration}: {self.timeout(configuration):.3f} s"
+            for configuration in list(self.__run_times)
+        )
+
+        return (
+            f"Xfoil runs: {self.runs} runs, {self.timeouts} timeouts, "
+            f"{self.kills} kills, {self.fallbacks} fallbacks "
+            f"({self.timeout_fallbacks} caused by timeouts), "
+            f"deadlines {{{deadlines}}}"
+        )
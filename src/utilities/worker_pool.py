@@ -0,0 +1,175 @@
+import importlib
+import multiprocessing
+from multiprocessing.pool import Pool, ThreadPool
+from threading import Lock
+
+
+def preload_modules(modules: tuple) -> None:
+    """
+    Method responsible for importing the modules in a
+    worker process when it starts, so the tasks do not
+    pay for their import.
+
+    :param modules: names of the modules
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+
+class WorkerPool:
+    def __init__(self, processes: int, preload: tuple = ()) -> None:
+        """
+        Executor of the xfoil runs kept for the whole run,
+        instead of a new pool per evaluation. Its worker
+        processes are started once, on the first use, from
+        a fork server which has already imported the pre-
+        loaded modules (or spawned, importing them at their
+        start, where the fork server is not available). As
+        the xfoil sessions live in the process which drives
+        them, their runs are executed by a pool of threads.
+
+        :param processes: number of workers of each pool
+        :param preload: names of the modules imported by
+            the worker processes before any task
+        """
+        self.processes = max(processes, 1)
+        self.preload = tuple(preload)
+
+        self.tasks = 0
+        self.batches = 0
+
+        self.__process_pool = None
+        self.__thread_pool = None
+        self.__lock = Lock()
+
+    @classmethod
+    def from_optimization_data(cls, optimization_data: dict, preload: tuple = ()):
+        """
+        Method responsible for instantiating the pool with
+        one worker per xfoil instance of the optimization.
+
+        :param optimization_data: optimization input data
+        :param preload: names of the modules imported by
+            the worker processes before any task
+        ...
+        :return: worker pool
+        """
+        return cls(processes=optimization_data.get("xfoilInstances"), preload=preload)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def start_method(self) -> str:
+        """
+        Start method of the worker processes, the fork ser-
+        ver if available on the platform.
+        """
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            return "forkserver"
+
+        return "spawn"
+
+    def starmap(self, function, arguments: list, threads: bool = False) -> list:
+        """
+        Method responsible for executing a function for each
+        tuple of arguments in the workers, waiting for all of
+        them.
+
+        :param function: function executed, which must be
+            importable by the worker processes
+        :param arguments: list of the arguments tuples
+        :param threads: if True, the function is executed by
+            the pool of threads, instead of the processes
+        ...
+        :return: results, in the order of the arguments
+        """
+        arguments = list(arguments)
+
+        with self.__lock:
+            self.tasks += len(arguments)
+            self.batches += 1
+
+        return self.__pool(threads).starmap(function, arguments)
+
+    def submit(
+        self, function, arguments: tuple, callback, threads: bool = False
+    ) -> None:
+        """
+        Method responsible for executing a function in the
+        first free worker, without waiting for it. The call-
+        back receives its result, or the exception raised,
+        in a thread of the pool.
+
+        :param function: function executed, which must be
+            importable by the worker processes
+        :param arguments: arguments tuple
+        :param callback: function called with the result
+        :param threads: if True, the function is executed by
+            the pool of threads, instead of the processes
+        """
+        with self.__lock:
+            self.tasks += 1
+
+        self.__pool(threads).apply_async(
+            function, arguments, callback=callback, error_callback=callback
+        )
+
+    def __pool(self, threads: bool):
+        """
+        Method responsible for obtaining one of the pools,
+        starting it on the first use.
+
+        :param threads: if True, the pool of threads is
+            obtained, else the pool of processes
+        ...
+        :return: pool
+        """
+        with self.__lock:
+            if threads:
+                if self.__thread_pool is None:
+                    self.__thread_pool = ThreadPool(processes=self.processes)
+
+                return self.__thread_pool
+
+            if self.__process_pool is None:
+                context = multiprocessing.get_context(self.start_method)
+                if self.start_method == "forkserver":
+                    context.set_forkserver_preload(list(self.preload))
+
+                self.__process_pool = Pool(
+                    processes=self.processes,
+                    initializer=preload_modules,
+                    initargs=(self.preload,),
+                    context=context,
+                )
+
+            return self.__process_pool
+
+    def close(self) -> None:
+        """
+        Method responsible for finishing the pools, waiting
+        for the tasks already submitted.
+        """
+        with self.__lock:
+            for pool in (self.__process_pool, self.__thread_pool):
+                if pool is not None:
+                    pool.close()
+                    pool.join()
+
+            self.__process_pool = None
+            self.__thread_pool = None
+
+    def report(self) -> str:
+        """
+        Method responsible for summarizing the pool usage.
+
+        :return: message with the workers and tasks
+        """
+        return (
+            f"Worker pool: {self.processes} workers ({self.start_method}), "
+            f"{self.tasks} tasks ({self.batches} batches)"
+        )
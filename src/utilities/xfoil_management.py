@@ -1,11 +1,14 @@
-import os
-import random
+import time
 import psutil
 import numpy as np
-from uuid import uuid4
 
 from subprocess import Popen, TimeoutExpired
 
+from .constants import POLAR_COLUMNS, XFOIL_PANELS
+from .scratch_workspace import ScratchWorkspace
+from .xfoil_sandbox import sandbox_directory, sandbox_path, xfoil_executable
+from .xfoil_session import XfoilSession, parse_operating_points
+
 N_CRIT = 9
 
 
@@ -14,9 +17,14 @@ class DoubleSolutionError(Exception):
 
 
 class XfoilManagement:
-    def __init__(self, reynolds: float, mach: float) -> None:
+    def __init__(
+        self, reynolds: float, mach: float, scratch_workspace: ScratchWorkspace = None
+    ) -> None:
         self.reynolds = reynolds
         self.mach = mach
+        self.scratch_workspace = (
+            ScratchWorkspace() if scratch_workspace is None else scratch_workspace
+        )
 
     def execute_xfoil(
         self,
@@ -38,6 +46,10 @@ class XfoilManagement:
         :param u_AoA: highest number of angle of attack
         :param AoA_step: angle of attack step
         :param iter: max iterations for converence
+        :param session: if given, the commands are executed
+            in the long-lived session of the xfoil instance,
+            instead of a new xfoil process
+        :param timeout: deadline of the xfoil run, in seconds
         """
         self.splines_file = splines_file
         self.l_AoA = l_AoA
@@ -49,12 +61,26 @@ class XfoilManagement:
         self.viscous_solution = True if "viscous" in kwargs else False
         self.mach_solution = True if "mach" in kwargs else False
         self.xfoil_instance = kwargs.get("xfoil_instance", 0)
+        self.session = kwargs.get("session", False)
+        self.timeout = kwargs.get("timeout", 1.0)
+        self.run_statistics = {
+            "runTime": 0.0,
+            "timedOut": False,
+            "killed": False,
+            "cached": False,
+        }
 
         if self.viscous_solution and self.mach_solution:
             raise DoubleSolutionError(
                 "Cannot execute xfoil with viscous and mach solution set to True"
             )
 
+        if self.session:
+            self.input_filename, self.output_filename = None, None
+            self.__execute_xfoil_session()
+
+            return
+
         self.input_filename, self.output_filename = self.__create_xfoil_file_commands()
         self.__execute_xfoil_file()
 
@@ -63,32 +89,23 @@ class XfoilManagement:
         Method for creating the xfoil file commands to
         use in xfoil.
 
-        :return: filename of the txt which will be used
-            in the xfoil.
+        :return: paths of the txt files of the commands and
+            of the results of the xfoil.
         """
-        file_uuid = str(uuid4())[:10].replace("-", "")
-
-        input_filename = f"xfoil_input_{file_uuid}.txt"
-        input = os.path.join(
-            os.getcwd(),
-            "processing",
-            "execution_steps",
-            input_filename,
-        )
-
-        output_filename = f"xfoil_output_{file_uuid}.txt"
+        input_filename = self.scratch_workspace.path("xfoil_input", "txt")
+        output_filename = self.scratch_workspace.path("xfoil_output", "txt")
 
-        with open(input, "w") as file:
+        with open(input_filename, "w") as file:
             file.write("PLOP" + "\n")
             file.write("G" + "\n")
             file.write("\n")
             file.write("LOAD" + "\n")
-            file.write(self.splines_file + "\n")
+            file.write(sandbox_path(self.splines_file, self.xfoil_instance) + "\n")
 
             if self.change_pannels:
                 file.write("PPAR" + "\n")
                 file.write("N" + "\n")
-                file.write("200" + "\n")
+                file.write(str(XFOIL_PANELS) + "\n")
                 file.write("\n")
                 file.write("\n")
 
@@ -106,7 +123,7 @@ class XfoilManagement:
 
             file.write("iter " + str(self.iter) + "\n")
             file.write("pacc" + "\n")
-            file.write(f"processing/execution_steps/" + output_filename + "\n")
+            file.write(sandbox_path(output_filename, self.xfoil_instance) + "\n")
             file.write("\n")
             file.write(
                 "aseq "
@@ -129,7 +146,7 @@ class XfoilManagement:
     def __execute_xfoil_file(self) -> None:
         """
         Method responsible for executing the xfoil file
-        in an instance of xfoil.
+        in an instance of xfoil, in its sandbox directory.
         """
 
         def kill_process(proc_pid: int) -> None:
@@ -138,6 +155,8 @@ class XfoilManagement:
             if the process did not converged.
 
             :param proc_pid: pid number of the process
+            ...
+            :return: True if the process was killed
             """
             try:
                 process = psutil.Process(proc_pid)
@@ -146,46 +165,114 @@ class XfoilManagement:
 
                 process.kill()
             except psutil.NoSuchProcess:
-                return
+                return False
 
-        xfoil_base_dir = os.path.join(
-            "processing",
-            "xfoil_instances",
-            f"xfoil_{self.xfoil_instance}.exe",
-        )
-        input_filename = os.path.join(
-            "processing",
-            "execution_steps",
-            self.input_filename,
-        )
+            return True
 
+        start = time.perf_counter()
         try:
-            p = Popen(f"{xfoil_base_dir} < " + input_filename, shell=True)
-            p.wait(1)
+            with open(self.input_filename) as input_file:
+                p = Popen(
+                    [xfoil_executable()],
+                    stdin=input_file,
+                    cwd=sandbox_directory(self.xfoil_instance),
+                )
+                p.wait(self.timeout)
         except TimeoutExpired:
-            kill_process(p.pid)
+            self.run_statistics["timedOut"] = True
+            self.run_statistics["killed"] = kill_process(p.pid)
         except Exception as e:
             print(e)
 
+        self.run_statistics["runTime"] = time.perf_counter() - start
+
+    def __execute_xfoil_session(self) -> None:
+        """
+        Method responsible for executing the commands in
+        the session of the xfoil instance, keeping its
+        output. As the viscous command toggles the viscous
+        solution, the reynolds number of a session already
+        viscous is only changed.
+        """
+
+        def session_commands(viscous: bool) -> list:
+            """
+            Method responsible for creating the commands of
+            the run from the viscous state of the session.
+
+            :param viscous: if the session is already in the
+                viscous solution
+            ...
+            :return: lines of xfoil commands
+            """
+            commands = ["LOAD", sandbox_path(self.splines_file, self.xfoil_instance)]
+
+            if self.change_pannels:
+                commands += ["PPAR", "N", str(XFOIL_PANELS), "", ""]
+
+            commands += ["oper", "init"]
+
+            if self.viscous_solution:
+                commands += [
+                    ("re " if viscous else "visc ") + str(self.reynolds),
+                    "vpar",
+                    "N",
+                    str(N_CRIT),
+                    "",
+                ]
+
+            if self.mach_solution:
+                commands.append("mach " + str(self.mach))
+
+            commands.append("iter " + str(self.iter))
+
+            if self.l_AoA == self.u_AoA:
+                commands.append("alfa " + str(self.l_AoA))
+            else:
+                commands.append(
+                    "aseq "
+                    + str(self.l_AoA)
+                    + " "
+                    + str(self.u_AoA)
+                    + " "
+                    + str(self.AoA_step)
+                )
+
+            commands.append("")
+
+            return commands
+
+        session = XfoilSession.acquire(self.xfoil_instance)
+
+        start = time.perf_counter()
+        self.session_output = session.run(
+            session_commands, self.timeout, viscous=self.viscous_solution
+        )
+        self.run_statistics["runTime"] = time.perf_counter() - start
+
+        if self.session_output is None:
+            timed_out = self.run_statistics["runTime"] >= self.timeout
+            self.run_statistics["timedOut"] = timed_out
+            self.run_statistics["killed"] = timed_out
+
     def obtain_cl_cd(self) -> tuple:
         """
         Method responsible for obtaining a cl
         and cd value of the airfoil executed
-        in xfoil.
+        in xfoil, removing the xfoil files from
+        the scratch workspace afterwards.
 
         :return: cl and cd values.
         """
-        output_dir = os.path.join(
-            os.getcwd(),
-            "processing",
-            "execution_steps",
-            self.output_filename,
-        )
+        if self.session:
+            return self.__obtain_session_cl_cd()
 
         try:
-            airfoil_data = np.loadtxt(output_dir, skiprows=12)
+            airfoil_data = np.loadtxt(self.output_filename, skiprows=12)
         except (OSError, Exception):
             return 0, 1
+        finally:
+            self.scratch_workspace.remove([self.input_filename, self.output_filename])
 
         if not airfoil_data.size:
             return 0, 1
@@ -194,3 +281,224 @@ class XfoilManagement:
         cd = abs(airfoil_data[2])
 
         return cl, cd
+
+    def __obtain_session_cl_cd(self) -> tuple:
+        """
+        Method responsible for obtaining the cl and cd
+        value of the first converged operating point
+        printed in the output of the xfoil session.
+
+        :return: cl and cd values.
+        """
+        if self.session_output is None:
+            return 0, 1
+
+        for _, cl, cd, converged in parse_operating_points(self.session_output):
+            if converged and cd is not None:
+                return cl, abs(cd)
+
+        return 0, 1
+
+    @staticmethod
+    def execute_xfoil_polar(
+        splines_file: str,
+        points: np.ndarray,
+        iter: int,
+        xfoil_instance: int = 0,
+        change_pannels: bool = True,
+        timeout: float = 1.0,
+        session: bool = True,
+        scratch_workspace: ScratchWorkspace = None,
+    ) -> np.ndarray:
+        """
+        Method responsible for executing many operating
+        points of one airfoil in a single run of xfoil,
+        in the session of the xfoil instance or from a
+        file of commands. The points are grouped by rey-
+        nolds and mach numbers, and the angles of attack
+        of each group are executed in ascending order with
+        aseq, so each converged boundary layer is the ini-
+        tial solution of the next point.
+
+        :param splines_file: path of the file with the
+            splines coordinates
+        :param points: array of shape (points, 3) with the
+            angle of attack, reynolds and mach numbers
+        :param iter: max iterations for converence
+        :param xfoil_instance: number of the xfoil instance
+        :param change_pannels: if True, the airfoil is re-
+            panelled with XFOIL_PANELS panels
+        :param timeout: deadline per operating point, in
+            seconds
+        :param session: if False, the commands are written in
+            a file executed by a new xfoil process, and the
+            polar of each group is read from its pacc file
+        :param scratch_workspace: workspace of the files of
+            the commands and polars, if None, the default one
+            is used
+        ...
+        :return: polar of shape (points, 6), in the order of
+            the points, with the POLAR_COLUMNS. The points not
+            converged have the cl and cd values 0 and 1.
+        """
+
+        def alpha_commands(alphas: np.ndarray) -> list:
+            """
+            Method responsible for splitting the sorted angles
+            of attack in sequences of constant step, each one
+            executed by a single command.
+
+            :param alphas: sorted angles of attack
+            ...
+            :return: lines of xfoil commands
+            """
+            sequences = [[alphas[0], alphas[0], 0.0]]
+
+            for alpha in alphas[1:]:
+                first, last, step = sequences[-1]
+                if first == last or np.isclose(alpha - last, step):
+                    sequences[-1] = [first, alpha, alpha - last]
+                else:
+                    sequences.append([alpha, alpha, 0.0])
+
+            return [
+                "alfa " + str(first) if first == last else f"aseq {first} {last} {step}"
+                for first, last, step in sequences
+            ]
+
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        polar = np.zeros((len(points), len(POLAR_COLUMNS)))
+        polar[:, :3] = points
+        polar[:, 4] = 1
+
+        if splines_file is None or not len(points):
+            return polar
+
+        conditions = np.unique(points[:, 1:], axis=0)
+        groups = [
+            np.flatnonzero((points[:, 1] == reynolds) & (points[:, 2] == mach))
+            for reynolds, mach in conditions
+        ]
+
+        def group_commands(viscous: bool) -> tuple:
+            """
+            Method responsible for creating the commands of
+            the airfoil and of the flight conditions of each
+            group, from the viscous state of xfoil.
+
+            :param viscous: if xfoil is already in the viscous
+                solution
+            ...
+            :return: lines of xfoil commands of the airfoil
+                and of each group
+            """
+            commands = ["LOAD", sandbox_path(splines_file, xfoil_instance)]
+
+            if change_pannels:
+                commands += ["PPAR", "N", str(XFOIL_PANELS), "", ""]
+
+            commands += ["oper", "init", "iter " + str(iter)]
+
+            commands_per_group = list()
+            for reynolds, mach in conditions:
+                commands_per_group.append(
+                    [
+                        ("re " if viscous else "visc ") + str(reynolds),
+                        "vpar",
+                        "N",
+                        str(N_CRIT),
+                        "",
+                        "mach " + str(mach),
+                    ]
+                )
+                viscous = True
+
+            return commands, commands_per_group
+
+        if not session:
+            scratch_workspace = (
+                ScratchWorkspace() if scratch_workspace is None else scratch_workspace
+            )
+            input_filename = scratch_workspace.path("xfoil_input", "txt")
+            output_filenames = [
+                scratch_workspace.path("xfoil_output", "txt") for _ in groups
+            ]
+
+            commands, commands_per_group = group_commands(False)
+            for output_filename, condition, rows in zip(
+                output_filenames, commands_per_group, groups
+            ):
+                commands += condition
+                commands += ["pacc", sandbox_path(output_filename, xfoil_instance), ""]
+                commands += alpha_commands(np.unique(points[rows, 0]))
+                commands.append("pacc")
+
+            with open(input_filename, "w") as file:
+                file.write("\n".join(["PLOP", "G", ""] + commands + ["", "quit"]))
+                file.write("\n")
+
+            xfoil = XfoilManagement(0.0, 0.0, scratch_workspace)
+            xfoil.input_filename = input_filename
+            xfoil.xfoil_instance = xfoil_instance
+            xfoil.timeout = timeout * len(points)
+            xfoil.run_statistics = {"runTime": 0.0, "timedOut": False, "killed": False}
+
+            try:
+                xfoil.__execute_xfoil_file()
+
+                for output_filename, rows in zip(output_filenames, groups):
+                    try:
+                        group_polar = np.loadtxt(output_filename, skiprows=12, ndmin=2)
+                    except (OSError, Exception):
+                        continue
+
+                    for alpha, cl, cd in group_polar[:, :3]:
+                        converged_rows = rows[
+                            np.isclose(points[rows, 0], alpha, atol=5e-4)
+                        ]
+                        polar[converged_rows, 3:] = cl, abs(cd), 1
+            finally:
+                scratch_workspace.remove([input_filename, *output_filenames])
+
+            return polar
+
+        def polar_commands(viscous: bool) -> list:
+            """
+            Method responsible for creating the commands of
+            all the groups from the viscous state of the ses-
+            sion, each group ended by its marker.
+
+            :param viscous: if the session is already in the
+                viscous solution
+            ...
+            :return: lines of xfoil commands
+            """
+            commands, commands_per_group = group_commands(viscous)
+
+            for group, (condition, rows) in enumerate(zip(commands_per_group, groups)):
+                commands += condition
+                commands += alpha_commands(np.unique(points[rows, 0]))
+                commands.append(f"G{group % 1000:03d}")
+
+            return commands + ["mach 0", ""]
+
+        output = XfoilSession.acquire(xfoil_instance).run(
+            polar_commands, timeout * len(points), viscous=True
+        )
+
+        if output is None:
+            return polar
+
+        for group, rows in enumerate(groups):
+            output_group, _, output = output.partition(
+                f"G{group % 1000:03d} command not recognized"
+            )
+
+            for alpha, cl, cd, converged in parse_operating_points(output_group):
+                if not converged or cd is None:
+                    continue
+
+                converged_rows = rows[np.isclose(points[rows, 0], alpha, atol=5e-4)]
+                polar[converged_rows, 3:] = cl, abs(cd), 1
+
+        return polar
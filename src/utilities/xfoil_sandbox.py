@@ -0,0 +1,100 @@
+import os
+import psutil
+
+from .constants import CGROUP_DIRECTORY, XFOIL_INSTANCES_DIRECTORY
+
+
+def available_cpus(cgroup_directory: str = CGROUP_DIRECTORY) -> int:
+    """
+    Method responsible for obtaining the number of CPUs the
+    process may actually use, which is the smallest of its
+    affinity mask and of its cgroup CPU quota (version 1 or
+    2), if any.
+
+    :param cgroup_directory: mount point of the cgroups
+    ...
+    :return: number of available CPUs, at least one
+    """
+    try:
+        cpus = len(psutil.Process().cpu_affinity())
+    except (AttributeError, psutil.Error):
+        cpus = os.cpu_count() or 1
+
+    quota_files = (
+        (os.path.join(cgroup_directory, "cpu.max"), None),
+        (
+            os.path.join(cgroup_directory, "cpu", "cpu.cfs_quota_us"),
+            os.path.join(cgroup_directory, "cpu", "cpu.cfs_period_us"),
+        ),
+    )
+    for quota_file, period_file in quota_files:
+        try:
+            with open(quota_file) as file:
+                values = file.read().split()
+
+            if period_file is not None:
+                with open(period_file) as file:
+                    values.append(file.read().strip())
+
+            if values[0] not in ("max", "-1"):
+                cpus = min(cpus, int(values[0]) // int(values[1]))
+        except (OSError, ValueError, IndexError):
+            continue
+
+        break
+
+    return max(cpus, 1)
+
+
+def xfoil_executable() -> str:
+    """
+    Method responsible for obtaining the absolute path of
+    the xfoil binary shared by all the workers.
+
+    :return: path of the xfoil binary
+    """
+    return os.path.abspath(os.path.join(XFOIL_INSTANCES_DIRECTORY, "xfoil.exe"))
+
+
+def sandbox_directory(xfoil_instance: int) -> str:
+    """
+    Method responsible for obtaining the working directory
+    of an xfoil instance, creating it if needed, so the
+    files written by xfoil in its working directory are not
+    shared among the workers.
+
+    :param xfoil_instance: number of the xfoil instance
+    ...
+    :return: path of the sandbox directory
+    """
+    directory = os.path.join(XFOIL_INSTANCES_DIRECTORY, f"worker_{xfoil_instance}")
+    os.makedirs(directory, exist_ok=True)
+
+    return directory
+
+
+def sandbox_path(path: str, xfoil_instance: int) -> str:
+    """
+    Method responsible for expressing a path relative to the
+    sandbox of an xfoil instance, which keeps the file names
+    passed to xfoil short. The absolute path is used when it
+    is shorter, or when there is no relative path, as across
+    the drives of Windows.
+
+    :param path: path relative to the current directory
+    :param xfoil_instance: number of the xfoil instance
+    ...
+    :return: path relative to the sandbox directory, or the
+        absolute path
+    """
+    absolute_path = os.path.abspath(path)
+
+    try:
+        relative_path = os.path.relpath(path, sandbox_directory(xfoil_instance))
+    except ValueError:
+        return absolute_path
+
+    if len(relative_path) > len(absolute_path):
+        return absolute_path
+
+    return relative_path
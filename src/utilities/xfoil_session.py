@@ -0,0 +1,296 @@
+import atexit
+import os
+import re
+import time
+import psutil
+
+from queue import Empty, Queue
+from subprocess import PIPE, STDOUT, Popen
+from threading import Lock, Thread
+
+from .xfoil_sandbox import sandbox_directory, xfoil_executable
+
+POINT_PATTERN = re.compile(r"\ba\s*=\s*(-?\d+\.\d*)\s+CL\s*=\s*(-?\d+\.\d*)")
+DRAG_PATTERN = re.compile(r"\bCD\s*=\s*(-?\d+\.\d*)")
+FAILURE_PATTERN = re.compile(r"Convergence failed")
+
+
+class XfoilSession:
+    sessions = dict()
+    sessions_lock = Lock()
+
+    def __init__(self, xfoil_instance: int) -> None:
+        """
+        Long-lived process of an xfoil instance, kept open
+        with pipes in its standard input and output. The
+        commands of each evaluation are written in its in-
+        put, followed by an unknown command as marker, and
+        the output is read until xfoil rejects the marker.
+        The process is only restarted if it exits or does
+        not answer the marker in time.
+
+        :param xfoil_instance: number of the xfoil instance
+        """
+        self.xfoil_instance = xfoil_instance
+        self.process = None
+        self.output = None
+        self.viscous = False
+
+        self.runs = 0
+        self.restarts = 0
+
+        self.__marker = 0
+        self.__lock = Lock()
+
+    @classmethod
+    def acquire(cls, xfoil_instance: int):
+        """
+        Method responsible for obtaining the session of the
+        xfoil instance, creating it on the first use. The
+        sessions are kept per process.
+
+        :param xfoil_instance: number of the xfoil instance
+        ...
+        :return: xfoil session
+        """
+        with cls.sessions_lock:
+            if xfoil_instance not in cls.sessions:
+                cls.sessions[xfoil_instance] = cls(xfoil_instance)
+
+            return cls.sessions[xfoil_instance]
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Method responsible for closing the processes of all
+        the sessions.
+        """
+        with cls.sessions_lock:
+            for session in cls.sessions.values():
+                session.close()
+
+    @classmethod
+    def report(cls) -> str:
+        """
+        Method responsible for summarizing the sessions usage.
+
+        :return: message with the runs and restarts
+        """
+        runs = sum(session.runs for session in cls.sessions.values())
+        restarts = sum(session.restarts for session in cls.sessions.values())
+
+        return (
+            f"Xfoil sessions: {len(cls.sessions)} processes, "
+            f"{runs} runs, {restarts} restarts"
+        )
+
+    def run(self, commands, timeout: float = 1.0, viscous: bool = False):
+        """
+        Method responsible for executing the commands in the
+        xfoil process, which must end in its main menu, and
+        reading their output. As the viscous command toggles
+        the viscous solution, the commands which depend on
+        it are built by a function of the viscous state of
+        the session, called while no other thread uses it.
+
+        :param commands: lines of xfoil commands, or function
+            which receives the viscous state of the session
+            and returns them
+        :param timeout: maximum time for xfoil answering, in
+            seconds, after which the process is restarted
+        :param viscous: if True, the commands leave the ses-
+            sion in the viscous solution
+        ...
+        :return: output of the commands, or None if xfoil
+            did not answer in time
+        """
+        with self.__lock:
+            if self.process is None or self.process.poll() is not None:
+                self.__start()
+
+            self.__discard_output()
+
+            if callable(commands):
+                commands = commands(self.viscous)
+
+            self.__marker = (self.__marker + 1) % 1000
+            marker = f"Z{self.__marker:03d}"
+
+            try:
+                self.process.stdin.write(
+                    ("\n".join(commands + [marker]) + "\n").encode()
+                )
+                self.process.stdin.flush()
+            except OSError:
+                self.__restart()
+                return None
+
+            output = self.__read_until(f"{marker} command not recognized", timeout)
+            self.runs += 1
+
+            if output is None:
+                self.__restart()
+            elif viscous:
+                self.viscous = True
+
+            return output
+
+    def close(self) -> None:
+        """
+        Method responsible for finishing the xfoil process,
+        killing it and its children if it does not quit.
+        """
+        if self.process is None:
+            return
+
+        try:
+            self.process.stdin.write(b"\nQUIT\n")
+            self.process.stdin.close()
+            self.process.wait(1)
+        except Exception:
+            self.__kill_process(self.process.pid)
+
+        self.process = None
+        self.viscous = False
+
+    def __start(self) -> None:
+        """
+        Method responsible for starting the xfoil process
+        in its sandbox directory, with its graphics dis-
+        abled, and the thread which forwards its output to
+        a queue.
+        """
+        self.process = Popen(
+            [xfoil_executable()],
+            cwd=sandbox_directory(self.xfoil_instance),
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=STDOUT,
+            env=dict(os.environ, GFORTRAN_UNBUFFERED_PRECONNECTED="y"),
+        )
+        self.output = Queue()
+        self.viscous = False
+
+        def forward_output(process: Popen, output: Queue) -> None:
+            """
+            Method responsible for reading the output of the
+            process as it is written, putting None at its end.
+
+            :param process: xfoil process
+            :param output: queue of the output chunks
+            """
+            for chunk in iter(lambda: process.stdout.read1(4096), b""):
+                output.put(chunk)
+
+            output.put(None)
+
+        Thread(
+            target=forward_output, args=(self.process, self.output), daemon=True
+        ).start()
+
+        self.process.stdin.write(b"PLOP\nG\n\n")
+        self.process.stdin.flush()
+
+    def __restart(self) -> None:
+        """
+        Method responsible for killing a wedged xfoil process,
+        which is started again on the next run.
+        """
+        self.__kill_process(self.process.pid)
+        self.process = None
+        self.viscous = False
+        self.restarts += 1
+
+    def __discard_output(self) -> None:
+        """
+        Method responsible for discarding the output left by
+        the previous commands, as the start up banner.
+        """
+        while True:
+            try:
+                self.output.get_nowait()
+            except Empty:
+                return
+
+    def __read_until(self, marker: str, timeout: float):
+        """
+        Method responsible for reading the output of the
+        process until the marker is found.
+
+        :param marker: text which ends the output
+        :param timeout: maximum time for reading, in seconds
+        ...
+        :return: output read, or None if the marker was not
+            found in time or the process exited
+        """
+        deadline = time.monotonic() + timeout
+        output = b""
+
+        while marker.encode() not in output:
+            try:
+                chunk = self.output.get(timeout=max(deadline - time.monotonic(), 0))
+            except Empty:
+                return None
+
+            if chunk is None:
+                return None
+
+            output += chunk
+
+        return output.decode(errors="replace")
+
+    @staticmethod
+    def __kill_process(proc_pid: int) -> None:
+        """
+        Method responsible for killing the xfoil process and
+        its children.
+
+        :param proc_pid: pid number of the process
+        """
+        try:
+            process = psutil.Process(proc_pid)
+            for proc in process.children(recursive=True):
+                proc.kill()
+
+            process.kill()
+        except psutil.NoSuchProcess:
+            return
+
+
+def parse_operating_points(output: str) -> list:
+    """
+    Method responsible for reading the operating points of
+    the xfoil output, as printed by the OPER menu. Each
+    Newton iteration prints the angle of attack with the
+    cl and cd, so the last values printed for an angle are
+    its result, unless its convergence failed.
+
+    :param output: xfoil output
+    ...
+    :return: list of (alpha, cl, cd, converged) per angle
+        of attack, in the order of execution
+    """
+    points = list()
+
+    for line in output.splitlines():
+        point = POINT_PATTERN.search(line)
+        drag = DRAG_PATTERN.search(line)
+
+        if point is not None:
+            alpha, cl = float(point.group(1)), float(point.group(2))
+
+            if points and points[-1][0] == alpha:
+                points[-1][1] = cl
+            else:
+                points.append([alpha, cl, None, True])
+
+        elif drag is not None and points:
+            points[-1][2] = float(drag.group(1))
+
+        elif FAILURE_PATTERN.search(line) and points:
+            points[-1][3] = False
+
+    return [tuple(point) for point in points]
+
+
+atexit.register(XfoilSession.close_all)
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.optimizer
+import src.optimizer_backends
+from src.utilities.constants import LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE
+
+LIMITS = np.array(
+    [LIMITS_FOR_RANDOM_PROPELLER_SECTION_CHOOSE.get(section) for section in range(7)]
+)
+OPTIMUM = LIMITS.mean(axis=1)
+
+
+class QuadraticObjectiveFunction:
+    def __init__(self, particles: dict, **kwargs) -> None:
+        """
+        Stand-in of the objective function, whose efficien-
+        cy is a quadratic with its maximum in the middle of
+        the limits of each section.
+
+        :param particles: dict of particles
+        """
+        self.particles = particles
+
+    def set_initial_conditions(self) -> None:
+        """
+        Method responsible for drawing the variables of the
+        particles in the limits of each section.
+        """
+        for id_part, particle in self.particles.items():
+            self.particles[id_part] = particle._replace(
+                variables=np.random.uniform(LIMITS[:, 0], LIMITS[:, 1])
+            )
+
+        self.set_new_conditions()
+
+    def set_new_conditions(self) -> None:
+        """
+        Method responsible for evaluating the quadratic.
+        """
+        for id_part, particle in self.particles.items():
+            self.particles[id_part] = particle._replace(
+                objective_function=float(
+                    0.9 - 1000 * np.sum((particle.variables - OPTIMUM) ** 2)
+                )
+            )
+
+
+@pytest.fixture
+def quadratic_objective_function(monkeypatch) -> np.ndarray:
+    """
+    Method responsible for replacing the objective function
+    of the optimizers by the quadratic stand-in.
+
+    :return: variables of the maximum of the quadratic
+    """
+    monkeypatch.setattr(src.optimizer, "ObjectiveFunction", QuadraticObjectiveFunction)
+    monkeypatch.setattr(
+        src.optimizer_backends, "ObjectiveFunction", QuadraticObjectiveFunction
+    )
+    monkeypatch.setattr(src.optimizer.os, "system", lambda command: 0)
+
+    return OPTIMUM
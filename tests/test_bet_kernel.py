@@ -0,0 +1,149 @@
+import numpy as np
+
+from src.utilities.bet_kernel import blade_element_kernel, flight_condition_terms
+
+FLIGHT_CONDITIONS = {
+    "speed": 20.0,
+    "viscosity": 1.789e-05,
+    "temperature": 288.2,
+    "airDensity": 1.225,
+    "engineSpin": 1000,
+}
+
+PROPELLER_GEOMETRY = {
+    "bladeDiameter": 2.4384,
+    "radius": [0.254, 0.3048, 0.4572, 0.6096, 0.762, 0.9144, 1.0668, 1.2192],
+    "chord": [0.122428, 0.139192, 0.174244, 0.185166, 0.179324, 0.16129, 0.128524, 0],
+}
+
+
+def reference_blade_element_theory(cl: list, cd: list, flight_conditions: dict):
+    """
+    Method responsible for calculating the efficiency and
+    the thrust and torque coefficients of one propeller,
+    one section at a time, as the blade element theory
+    was first implemented.
+
+    :param cl: cl of each section
+    :param cd: cd of each section
+    :param flight_conditions: flight conditions
+    ...
+    :return: efficiency, thrust and torque coefficients
+    """
+    speed = flight_conditions.get("speed")
+    engine_spin = flight_conditions.get("engineSpin")
+    air_density = flight_conditions.get("airDensity")
+    radius = PROPELLER_GEOMETRY.get("radius")
+    chord = PROPELLER_GEOMETRY.get("chord")
+    diameter = PROPELLER_GEOMETRY.get("bladeDiameter")
+
+    tangencial_velocity = 2.0 * np.pi / 60.0 * engine_spin * np.array(radius)
+    phi = np.arctan(speed / tangencial_velocity)
+    phi[-1] = 0.0
+
+    q = 0.5 * air_density * speed**2
+    dt, dq = [], []
+    for section, (cl_section, cd_section) in enumerate(zip(cl, cd)):
+        if cl_section == 0:
+            dt.append(0)
+            dq.append(0)
+            continue
+
+        gamma = np.arctan(cd_section / cl_section)
+        den = np.cos(gamma) * np.sin(phi[section]) ** 2
+
+        dt.append(
+            q * cl_section * chord[section] * np.cos(phi[section] + gamma) / den
+        )
+        dq.append(
+            q
+            * cl_section
+            * chord[section]
+            * radius[section]
+            * np.sin(phi[section] + gamma)
+            / den
+        )
+
+    dt.append(0)
+    dq.append(0)
+
+    traction, torque = 0, 0
+    for n in range(1, len(radius)):
+        traction += (radius[n] - radius[n - 1]) * (dt[n] + dt[n - 1]) / 2
+        torque += (radius[n] - radius[n - 1]) * (dq[n] + dq[n - 1]) / 2
+
+    n = engine_spin / 60
+    t_coeffic = traction / (air_density * n**2 * diameter**4)
+    q_coeffic = torque / (air_density * n**2 * diameter**5)
+    advance_rate = 60 * speed / engine_spin / diameter
+
+    return advance_rate * t_coeffic / (2 * np.pi * q_coeffic), t_coeffic, q_coeffic
+
+
+def test_kernel_matches_the_reference_for_a_batch_of_propellers():
+    rng = np.random.default_rng(0)
+    cl = rng.uniform(0.2, 1.2, size=(16, 7))
+    cd = rng.uniform(0.005, 0.05, size=(16, 7))
+    cl[3, 2] = 0.0
+
+    performance = blade_element_kernel(
+        cl, cd, flight_condition_terms(FLIGHT_CONDITIONS, PROPELLER_GEOMETRY)
+    )
+
+    for propeller in range(len(cl)):
+        efficiency, t_coeffic, q_coeffic = reference_blade_element_theory(
+            cl[propeller], cd[propeller], FLIGHT_CONDITIONS
+        )
+
+        np.testing.assert_allclose(
+            performance.get("efficiency")[propeller], efficiency, rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            performance.get("tCoefficient")[propeller], t_coeffic, rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            performance.get("qCoefficient")[propeller], q_coeffic, rtol=1e-12
+        )
+
+    assert performance.get("dt")[3, 2] == 0.0
+    assert np.isnan(performance.get("gamma")[3, 2])
+
+
+def test_kernel_matches_the_reference_for_a_speed_sweep():
+    speeds = np.arange(1, 100, 5, dtype=float)
+    cl = np.linspace(0.3, 0.9, 7)
+    cd = np.linspace(0.008, 0.02, 7)
+
+    terms = flight_condition_terms(
+        dict(FLIGHT_CONDITIONS, speed=speeds), PROPELLER_GEOMETRY
+    )
+    performance = blade_element_kernel(
+        np.tile(cl, (len(speeds), 1)), np.tile(cd, (len(speeds), 1)), terms
+    )
+
+    for condition, speed in enumerate(speeds):
+        efficiency, _, _ = reference_blade_element_theory(
+            cl, cd, dict(FLIGHT_CONDITIONS, speed=speed)
+        )
+
+        np.testing.assert_allclose(
+            performance.get("efficiency")[condition], efficiency, rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            terms.get("advanceRate")[condition],
+            60 * speed / FLIGHT_CONDITIONS.get("engineSpin") / 2.4384,
+            rtol=1e-12,
+        )
+
+
+def test_kernel_draws_a_low_efficiency_without_power():
+    cl = np.zeros((4, 7))
+    cd = np.ones((4, 7))
+
+    performance = blade_element_kernel(
+        cl, cd, flight_condition_terms(FLIGHT_CONDITIONS, PROPELLER_GEOMETRY)
+    )
+
+    assert np.all(performance.get("pCoefficient") == 0)
+    assert np.all(performance.get("efficiency") >= 0)
+    assert np.all(performance.get("efficiency") < 0.1)
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.optimizer import PSO
+
+OPTIMIZATION_DATA = {
+    "quantityOfParticles": 5,
+    "maximumIterations": 6,
+    "polarDatabase": "",
+}
+
+
+def create_optimizer(tmp_path) -> PSO:
+    """
+    Method responsible for creating an optimizer whose
+    files are written in the temporary directory.
+
+    :param tmp_path: temporary directory of the test
+    ...
+    :return: optimizer without initial conditions
+    """
+    data_reader = SimpleNamespace(
+        optimization_data=dict(
+            OPTIMIZATION_DATA, scratchDirectory=str(tmp_path / "scratch")
+        )
+    )
+
+    return PSO(data_reader, "test", str(tmp_path))
+
+
+def test_checkpoint_restores_the_swarm_and_the_random_state(tmp_path):
+    optimizer = create_optimizer(tmp_path)
+    rng = np.random.default_rng(0)
+
+    swarm = optimizer.swarm
+    swarm.positions[:] = rng.uniform(-0.1, 0.1, swarm.positions.shape)
+    swarm.velocities[:] = rng.uniform(-0.1, 0.1, swarm.velocities.shape)
+    swarm.p_best[:] = rng.uniform(-0.1, 0.1, swarm.p_best.shape)
+    swarm.p_best_obj[:] = rng.uniform(0, 1, swarm.p_best_obj.shape)
+    swarm.objective[:] = rng.uniform(0, 1, swarm.objective.shape)
+    swarm.g_best[:] = swarm.p_best[3]
+    swarm.g_best_obj = float(swarm.p_best_obj[3])
+    swarm.g_best_id = 3
+    swarm.export_particles(optimizer.particles)
+    optimizer.fo_per_time = {1: 0.5, 2: swarm.g_best_obj}
+
+    np.random.seed(1)
+    np.random.rand(3)
+    optimizer.save_checkpoint(2, np.array([3, 4, 9, 3, 7]))
+    expected = np.random.rand(4)
+
+    np.random.seed(2)
+    resumed = create_optimizer(tmp_path)
+    resumed.load_checkpoint(optimizer.checkpoint_file)
+
+    for key, array in swarm.to_arrays().items():
+        np.testing.assert_array_equal(resumed.swarm.to_arrays()[key], array)
+
+    assert resumed.start_iteration == 3
+    assert resumed.fo_per_time == optimizer.fo_per_time
+    assert resumed.best_objective.get("g_best_obj") == {3: swarm.g_best_obj}
+    np.testing.assert_array_equal(
+        resumed.best.get("g_best").get(3).variables, swarm.g_best
+    )
+    np.testing.assert_array_equal(
+        resumed.hyperparameters.get("r"), optimizer.hyperparameters.get("r")
+    )
+    np.testing.assert_array_equal(resumed.particles_iteration, [3, 4, 7, 3, 7])
+    np.testing.assert_array_equal(np.random.rand(4), expected)
@@ -0,0 +1,41 @@
+import pytest
+
+from src.data_modules.data_validation import DataValidation
+from src.utilities.exceptions import ErrorOptimizerParameters
+
+OPTIMIZATION_DATA = {"quantityOfParticles": 10}
+
+
+@pytest.mark.parametrize(
+    "optimizer, parameters",
+    [
+        ("cmaes", {"cmaesSigma": 0.02}),
+        ("differentialEvolution", {"deMutationFactor": 2, "deCrossoverRate": 0}),
+        ("differentialEvolution", {"deMutationFactor": 0.1, "deCrossoverRate": 1}),
+        ("surrogate", {"surrogateCandidates": 1}),
+    ],
+)
+def test_optimizer_accepts_the_valid_parameters(optimizer, parameters):
+    DataValidation().check_optimizer(
+        dict(OPTIMIZATION_DATA, optimizer=optimizer, **parameters)
+    )
+
+
+@pytest.mark.parametrize(
+    "optimizer, parameters",
+    [
+        ("cmaes", {"cmaesSigma": 0}),
+        ("cmaes", {"cmaesSigma": -0.1}),
+        ("differentialEvolution", {"deMutationFactor": 0}),
+        ("differentialEvolution", {"deMutationFactor": 2.5}),
+        ("differentialEvolution", {"deCrossoverRate": -0.1}),
+        ("differentialEvolution", {"deCrossoverRate": 1.5}),
+        ("surrogate", {"surrogateCandidates": 0}),
+        ("surrogate", {"surrogateCandidates": 10.5}),
+    ],
+)
+def test_optimizer_rejects_the_invalid_parameters(optimizer, parameters):
+    with pytest.raises(ErrorOptimizerParameters):
+        DataValidation().check_optimizer(
+            dict(OPTIMIZATION_DATA, optimizer=optimizer, **parameters)
+        )
@@ -0,0 +1,50 @@
+import numpy as np
+
+from src.utilities.evaluation_cache import EvaluationCache
+
+VARIABLES = np.array([0.010, -0.020, 0.030])
+
+
+def test_exact_hit_within_the_rounding_of_the_tolerance():
+    cache = EvaluationCache(tolerance=1e-3)
+    cache.put(VARIABLES, "evaluation")
+
+    assert cache.get(VARIABLES + 4e-4) == "evaluation"
+    assert cache.get(VARIABLES - 4e-4) == "evaluation"
+    assert cache.get(VARIABLES + np.array([6e-4, 0.0, 0.0])) is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_least_recently_used_is_discarded_at_the_maximum_size():
+    cache = EvaluationCache(tolerance=1e-3, maximum_size=3)
+    for i in range(3):
+        cache.put(VARIABLES + i, i)
+
+    assert cache.get(VARIABLES) == 0
+    cache.put(VARIABLES + 3, 3)
+
+    assert len(cache) == 3
+    assert cache.get(VARIABLES + 1) is None
+    assert [cache.get(VARIABLES + i) for i in (0, 2, 3)] == [0, 2, 3]
+
+
+def test_nearest_hit_within_the_radius():
+    cache = EvaluationCache(tolerance=1e-3, radius=5e-3)
+    cache.put(VARIABLES, "near")
+    cache.put(VARIABLES + 0.1, "far")
+
+    assert cache.get(VARIABLES + np.array([3e-3, 0.0, 0.0])) == "near"
+    assert cache.get(VARIABLES + 0.1 - np.array([2e-3, 0.0, 0.0])) == "far"
+    assert cache.get(VARIABLES + np.array([6e-3, 0.0, 0.0])) is None
+
+    cache.put(VARIABLES + np.array([2e-3, 0.0, 0.0]), "nearer")
+    assert cache.get(VARIABLES + np.array([3e-3, 0.0, 0.0])) == "nearer"
+
+
+def test_radius_zero_only_hits_the_exact_key():
+    cache = EvaluationCache(tolerance=1e-3, radius=0.0)
+    cache.put(VARIABLES, "evaluation")
+
+    assert cache.get(VARIABLES) == "evaluation"
+    assert cache.get(VARIABLES + np.array([2e-3, 0.0, 0.0])) is None
+    assert EvaluationCache.from_optimization_data({"cacheTolerance": 0}) is None
@@ -0,0 +1,179 @@
+import numpy as np
+import pytest
+
+from src.utilities.constants import POINTS_BETWEEN_POINTS_P
+from src.utilities.geometry_kernel import count_self_intersections, solve_a_points
+from src.utilities.geometry_management import GeometryManagement
+
+
+def reference_a_points(p_points: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for obtaining the bezier A points
+    of one coordinate of the P points, solving the dense
+    system as it was first implemented.
+
+    :param p_points: P points of one coordinate
+    ...
+    :return: A points of the coordinate
+    """
+    n = len(p_points) - 1
+    m = np.zeros((n, n))
+    m[0, 0] = 2.0
+    m[-1, -1] = 7.0
+    np.fill_diagonal(m[1:], 1.0)
+    np.fill_diagonal(m[0:-1, 1:], 1.0)
+    np.fill_diagonal(m[1:-1, 1:-1], 4.0)
+    m[-1, -2] = 2.0
+
+    u = np.array([2 * (2 * p_points[i] + p_points[i + 1]) for i in range(n)])
+    u[0] = p_points[0] + 2 * p_points[1]
+    u[-1] = 8 * p_points[-2] + p_points[-1]
+
+    return np.linalg.solve(m, u)
+
+
+def reference_update_airfoil(a_points: np.ndarray, p_points: np.ndarray):
+    """
+    Method responsible for updating the spline of one air-
+    foil, one segment and one point at a time, as it was
+    first implemented.
+
+    :param a_points: A points, of shape (2, n)
+    :param p_points: P points, of shape (2, n + 1)
+    ...
+    :return: airfoil spline, or None if auto intersected
+    """
+    n = len(p_points[0]) - 1
+    splines = list()
+
+    for j in range(2):
+        a, p = a_points[j], p_points[j]
+
+        new_p = [p[0], (2 * a[0] + a[1] - p[0]) / 2]
+        for i in range(1, n - 2):
+            new_p.append((a[i - 1] + 4 * a[i] + a[i + 1]) / 2 - 2 * new_p[i])
+        new_p += [(2 * a[-2] + 7 * a[-1] - p[-1]) / 8, p[-1]]
+
+        b = [2 * new_p[i + 1] - a[i + 1] for i in range(n - 1)]
+        b.append((a[n - 1] + new_p[n]) / 2)
+
+        splines.append(
+            [
+                (1 - t) ** 3 * new_p[i]
+                + 3 * t * (1 - t) ** 2 * a[i]
+                + 3 * t**2 * (1 - t) * b[i]
+                + t**3 * new_p[i + 1]
+                for i in range(n)
+                for t in np.linspace(0, 1, num=POINTS_BETWEEN_POINTS_P)
+            ]
+        )
+
+    x_coordinates, y_coordinates = list(), list()
+    for x, y in zip(*splines):
+        if x not in x_coordinates:
+            x_coordinates.append(x)
+            y_coordinates.append(y)
+    spline = np.array((x_coordinates + [1], y_coordinates + [0]))
+
+    return spline if reference_intersections(spline) <= 1 else None
+
+
+def reference_intersections(spline: np.ndarray) -> int:
+    """
+    Method responsible for counting the pairs of non adja-
+    cent segments of a spline which intersect, one pair at
+    a time.
+
+    :param spline: spline points, of shape (2, points)
+    ...
+    :return: quantity of intersecting segment pairs
+    """
+    count = 0
+    for i in range(spline.shape[1] - 1):
+        for j in range(i - 1):
+            x1, x2, x3, x4 = spline[0, [i, i + 1, j, j + 1]]
+            y1, y2, y3, y4 = spline[1, [i, i + 1, j, j + 1]]
+
+            d = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+            if not d:
+                continue
+
+            xs = (
+                (x1 * y2 - y1 * x2) * (x3 - x4) - (x1 - x2) * (x3 * y4 - y3 * x4)
+            ) / d
+            if min(x1, x2) <= xs <= max(x1, x2) and min(x3, x4) <= xs <= max(x3, x4):
+                count += 1
+
+    return count
+
+
+@pytest.fixture
+def base_airfoil(monkeypatch, tmp_path) -> tuple:
+    """
+    Method responsible for creating the bezier points of
+    the base airfoil, with the cache in the temporary di-
+    rectory.
+
+    :return: geometry management, A and P points
+    """
+    monkeypatch.chdir(tmp_path)
+
+    geometry_management = GeometryManagement()
+    p_points = geometry_management.create_base_airfoil("naca 4412")
+
+    return geometry_management, geometry_management.generate_bezier_points(), p_points
+
+
+def test_a_points_match_the_dense_system(base_airfoil):
+    _, a_points, p_points = base_airfoil
+    rng = np.random.default_rng(0)
+    batch = p_points + rng.normal(scale=0.01, size=(6, 3) + p_points.shape)
+
+    for coordinate in range(2):
+        np.testing.assert_allclose(
+            a_points[coordinate], reference_a_points(p_points[coordinate]), atol=1e-12
+        )
+
+    solved = solve_a_points(batch)
+    for index in np.ndindex(batch.shape[:-1]):
+        np.testing.assert_allclose(
+            solved[index], reference_a_points(batch[index]), atol=1e-12
+        )
+
+
+def test_batched_splines_match_the_reference(base_airfoil):
+    geometry_management, a_points, p_points = base_airfoil
+    rng = np.random.default_rng(1)
+
+    batch = np.repeat(a_points[None, None], 24, axis=0).repeat(7, axis=1)
+    batch[:, :, 1, 3] += rng.uniform(-0.3, 0.3, size=(24, 7))
+    batch[12:] += rng.normal(scale=0.02, size=batch[12:].shape)
+
+    splines, valid = geometry_management.update_airfoils(batch, p_points)
+
+    assert 0 < np.count_nonzero(valid) < valid.size
+    for particle, section in np.ndindex(valid.shape):
+        expected = reference_update_airfoil(batch[particle, section], p_points)
+
+        assert valid[particle, section] == (expected is not None)
+        if expected is None:
+            assert splines[particle][section] is None
+        else:
+            np.testing.assert_allclose(
+                splines[particle][section], expected, atol=1e-12
+            )
+
+
+def test_intersections_are_counted_in_chunks(base_airfoil):
+    geometry_management, a_points, p_points = base_airfoil
+    rng = np.random.default_rng(2)
+
+    spline = geometry_management.update_airfoil(a_points, p_points)
+    batch = spline + rng.normal(scale=0.02, size=(5,) + spline.shape)
+    counts = count_self_intersections(batch)
+
+    assert count_self_intersections(spline) == reference_intersections(spline)
+    np.testing.assert_array_equal(
+        counts, [reference_intersections(item) for item in batch]
+    )
+    np.testing.assert_array_equal(count_self_intersections(batch, chunk_size=7), counts)
@@ -0,0 +1,110 @@
+import time
+from queue import Queue
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.data_modules.data_structures import Particle
+from src.island_model import IslandModel, Migration
+
+ISLANDS = 4
+
+
+def create_migrations(topology: str) -> list:
+    """
+    Method responsible for connecting the migration chan-
+    nels of the islands with in-process queues, according
+    to the migration topology.
+
+    :param topology: migration topology
+    ...
+    :return: migration channel of each island
+    """
+    island_model = IslandModel(
+        SimpleNamespace(
+            optimization_data={"islands": ISLANDS, "migrationTopology": topology}
+        ),
+        "test",
+        "",
+    )
+    inboxes = [Queue() for _ in range(ISLANDS)]
+
+    return [
+        Migration(
+            5,
+            inboxes[island],
+            [inboxes[n] for n in island_model._IslandModel__neighbours(island)],
+        )
+        for island in range(ISLANDS)
+    ]
+
+
+def create_emigrant(island: int) -> Particle:
+    """
+    Method responsible for creating the best particle of
+    an island, identified by its objective function.
+
+    :param island: island number
+    ...
+    :return: particle of the island
+    """
+    return Particle(
+        objective_function=float(island),
+        variables=np.full(7, island, dtype=float),
+        velocity=np.zeros(7),
+        points_p=np.array([]),
+        points_a=np.array([]),
+        splines=list(),
+        results=dict(),
+    )
+
+
+def exchange_all(migrations: list) -> list:
+    """
+    Method responsible for sending the emigrant of every
+    island, one after the other, and then collecting the
+    immigrants left in the inbox of each one.
+
+    :param migrations: migration channel of each island
+    ...
+    :return: islands of the immigrants received by each
+        island
+    """
+    immigrants = [
+        migration.exchange(create_emigrant(island))
+        for island, migration in enumerate(migrations)
+    ]
+
+    return [
+        sorted(
+            int(p.objective_function)
+            for p in immigrants[island] + migration.exchange(None)
+        )
+        for island, migration in enumerate(migrations)
+    ]
+
+
+def test_ring_sends_to_the_next_island():
+    received = exchange_all(create_migrations("ring"))
+
+    assert received == [[3], [0], [1], [2]]
+
+
+def test_fully_connected_sends_to_every_other_island():
+    received = exchange_all(create_migrations("fullyConnected"))
+
+    assert received == [
+        [n for n in range(ISLANDS) if n != island] for island in range(ISLANDS)
+    ]
+
+
+def test_exchange_does_not_wait_for_an_empty_inbox():
+    migrations = create_migrations("ring")
+
+    start = time.perf_counter()
+    assert migrations[0].exchange(None) == []
+    assert migrations[0].exchange(create_emigrant(0)) == []
+    assert time.perf_counter() - start < 0.5
+
+    assert [p.objective_function for p in migrations[1].exchange(None)] == [0.0]
+    assert migrations[1].exchange(None) == []
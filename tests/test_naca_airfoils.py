@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+import pytest
+
+import src.utilities.airfoil_creation as airfoil_creation
+from src.utilities.airfoil_creation import AirfoilCreation
+from src.utilities.naca_airfoils import naca_coordinates, naca_designation
+
+
+def mean_line(coordinates: np.ndarray) -> tuple:
+    """
+    Method responsible for obtaining the mean line of the
+    airfoil coordinates, averaging the points of the upper
+    and lower surfaces at the same station.
+
+    :param coordinates: airfoil coordinates, of shape (2,
+        points), from the upper trailing edge to the lower
+    ...
+    :return: abscissas and ordinates of the mean line
+    """
+    points = (coordinates.shape[1] + 1) // 2
+    upper, lower = coordinates[:, :points][:, ::-1], coordinates[:, points - 1 :]
+
+    return (upper[0] + lower[0]) / 2, (upper[1] + lower[1]) / 2
+
+
+@pytest.mark.parametrize(
+    "airfoil_name, designation",
+    [
+        ("naca 0012", "0012"),
+        ("NACA4412", "4412"),
+        (" naca 23012 ", "23012"),
+        ("naca 24112", "24112"),
+        ("naca 26012", None),
+        ("naca 23612", None),
+        ("naca 123", None),
+        ("naca 123456", None),
+        ("clark y", None),
+    ],
+)
+def test_designation_parses_the_supported_airfoils(airfoil_name, designation):
+    assert naca_designation(airfoil_name) == designation
+
+
+def test_coordinates_match_the_published_ordinates():
+    symmetric = naca_coordinates("0012")
+    x, camber = mean_line(naca_coordinates("23012"))
+
+    assert symmetric.shape[0] == 2 and symmetric.shape[1] % 2
+    np.testing.assert_allclose(symmetric[:, [0, -1]], [[1, 1], [0, 0]], atol=1e-12)
+    assert np.ptp(symmetric[1]) == pytest.approx(0.12, abs=1e-3)
+    np.testing.assert_allclose(mean_line(symmetric)[1], 0, atol=1e-12)
+
+    assert x[np.argmax(camber)] == pytest.approx(0.15, abs=0.01)
+    assert camber.max() == pytest.approx(0.0183, abs=5e-4)
+
+
+def test_points_are_cached_per_panelling(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    cache_directory = os.path.join("processing", "airfoil_cache")
+
+    p_points, a_points = AirfoilCreation().obtain_naca_points("naca 4412")
+    cache_files = os.listdir(cache_directory)
+
+    monkeypatch.setattr(airfoil_creation, "NACA_PANEL_NODES", 7)
+    refined_p_points, _ = AirfoilCreation().obtain_naca_points("naca 4412")
+
+    assert len(cache_files) == 1
+    assert len(os.listdir(cache_directory)) == 2
+    assert p_points.shape == (2, 5) and refined_p_points.shape == (2, 7)
+
+    monkeypatch.setattr(airfoil_creation, "NACA_PANEL_NODES", 5)
+    monkeypatch.setattr(airfoil_creation, "naca_coordinates", None)
+    cached_p_points, cached_a_points = AirfoilCreation().obtain_naca_points(
+        "naca 4412"
+    )
+
+    np.testing.assert_array_equal(cached_p_points, p_points)
+    np.testing.assert_array_equal(cached_a_points, a_points)
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.optimizer import PSO
+from src.optimizer_backends import CMAES, DifferentialEvolution
+from src.surrogate_optimizer import SurrogateOptimizer
+
+@pytest.mark.parametrize(
+    "optimizer_class", [PSO, CMAES, DifferentialEvolution, SurrogateOptimizer]
+)
+def test_backend_improves_a_quadratic(
+    quadratic_objective_function, tmp_path, optimizer_class
+):
+    data_reader = SimpleNamespace(
+        optimization_data={
+            "quantityOfParticles": 12,
+            "maximumIterations": 20,
+            "tolerance": 1e-9,
+            "xfoilInstances": 2,
+            "surrogateCandidates": 200,
+            "polarDatabase": "",
+            "scratchDirectory": str(tmp_path / "scratch"),
+        },
+        propeller_geometric_conditions=dict(),
+        flight_conditions=dict(),
+        airfoil_geometry=None,
+    )
+    np.random.seed(0)
+
+    optimizer = optimizer_class(data_reader, "test", str(tmp_path))
+    optimizer.set_initial_conditions()
+    initial = optimizer.fo_per_time[1]
+    optimizer.iterate()
+
+    final = optimizer.fo_per_time[max(optimizer.fo_per_time)]
+    g_best = list(optimizer.best.get("g_best").values())[0]
+
+    assert final > initial
+    assert np.isclose(g_best.objective_function, final)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from src.utilities.naca_airfoils import naca_coordinates
+from src.utilities.panel_method import panel_coefficients, panel_polar
+
+REYNOLDS = 3.3e6
+
+
+def test_panel_method_matches_the_naca_references():
+    cl, cd = panel_coefficients(
+        [
+            naca_coordinates("0012"),
+            naca_coordinates("0012"),
+            naca_coordinates("4412"),
+            naca_coordinates("4412"),
+        ],
+        alpha=[0.0, 5.0, 0.0, 5.0],
+        reynolds=REYNOLDS,
+    )
+
+    np.testing.assert_allclose(cl[:3], [0.0, 0.600, 0.516], atol=5e-3)
+    assert cl[3] > cl[2]
+    assert np.all((cd >= 0.006) & (cd <= 0.008))
+
+
+def test_panel_method_solves_the_chunks_as_single_airfoils():
+    splines = [naca_coordinates(naca) for naca in ("0012", "2412", "4412")]
+    alpha = np.array([2.0, 4.0, -1.0])
+
+    cl, cd = panel_coefficients(splines, alpha=alpha, reynolds=REYNOLDS, chunk_size=2)
+
+    for airfoil, spline in enumerate(splines):
+        cl_single, cd_single = panel_coefficients(
+            [spline], alpha=alpha[airfoil], reynolds=REYNOLDS
+        )
+
+        np.testing.assert_allclose(cl[airfoil], cl_single[0], rtol=1e-10)
+        np.testing.assert_allclose(cd[airfoil], cd_single[0], rtol=1e-10)
+
+
+def test_panel_polar_falls_back_without_a_valid_airfoil():
+    points = np.array([[5.0, REYNOLDS, 0.0], [0.0, REYNOLDS, 0.0]])
+
+    polar = panel_polar(naca_coordinates("0012"), points)
+    np.testing.assert_allclose(polar[:, 3], [0.600, 0.0], atol=5e-3)
+    assert np.all(polar[:, 5] == 1)
+
+    for spline in (None, np.zeros((2, 50))):
+        polar = panel_polar(spline, points)
+        assert np.all(polar[:, 3:] == (0, 1, 0))
@@ -0,0 +1,116 @@
+import random
+import time
+from collections import Counter
+from threading import Lock, Thread
+
+import pytest
+
+import src.blade_element_theory as blade_element_theory
+from src.blade_element_theory import schedule_xfoil
+
+
+class FakeWorkerPool:
+    def __init__(self, seed: int = 0) -> None:
+        """
+        Worker pool which executes each task in a new thread
+        after a random delay, so the tasks end out of order.
+
+        :param seed: seed of the delays
+        """
+        self.random = random.Random(seed)
+        self.threads = list()
+
+    def submit(self, function, arguments: tuple, callback, threads=False) -> None:
+        """
+        Method responsible for executing a function in a new
+        thread, giving its result or exception to the call-
+        back.
+
+        :param function: function executed
+        :param arguments: arguments tuple
+        :param callback: function called with the result
+        :param threads: unused, as every task runs in a thread
+        """
+        delay = self.random.uniform(0, 0.01)
+
+        def run() -> None:
+            time.sleep(delay)
+            try:
+                result = function(*arguments)
+            except Exception as exception:
+                result = exception
+
+            callback(result)
+
+        thread = Thread(target=run)
+        self.threads.append(thread)
+        thread.start()
+
+
+@pytest.fixture
+def fake_xfoil(monkeypatch) -> dict:
+    """
+    Method responsible for replacing the xfoil runs by a
+    function which records the sections executed by each
+    xfoil instance and their overlaps.
+
+    :return: record of the executed sections and overlaps
+    """
+    record = {"sections": Counter(), "running": set(), "overlaps": 0}
+    lock = Lock()
+
+    def execute_xfoil(spline, xfoil_instance, section, alpha, *arguments):
+        with lock:
+            record["overlaps"] += xfoil_instance in record["running"]
+            record["running"].add(xfoil_instance)
+            record["sections"][spline, section] += 1
+
+        time.sleep(0.002)
+        if spline == "broken":
+            raise RuntimeError("xfoil crashed")
+
+        with lock:
+            record["running"].discard(xfoil_instance)
+
+        return section, alpha + section, 0.01, {"instance": xfoil_instance}
+
+    monkeypatch.setattr(blade_element_theory, "execute_xfoil", execute_xfoil)
+
+    return record
+
+
+@pytest.mark.parametrize("instances", [1, 3, 8, 40])
+def test_each_section_runs_once_per_free_instance(fake_xfoil, instances):
+    worker_pool = FakeWorkerPool(seed=instances)
+    tasks = [
+        ((particle, section), f"particle_{particle}", section)
+        for particle in range(6)
+        for section in range(5)
+    ]
+
+    results = dict(
+        schedule_xfoil(
+            worker_pool, tasks, list(range(instances)), (2.0, 1e6, 0.0), True
+        )
+    )
+    for thread in worker_pool.threads:
+        thread.join()
+
+    assert fake_xfoil["overlaps"] == 0
+    assert len(worker_pool.threads) == len(tasks)
+    assert set(fake_xfoil["sections"].values()) == {1}
+    assert results.keys() == {key for key, _, _ in tasks}
+
+    for (particle, section), result in results.items():
+        assert result[:3] == (section, 2.0 + section, 0.01)
+        assert result[3]["instance"] in range(instances)
+
+    used_instances = {result[3]["instance"] for result in results.values()}
+    assert len(used_instances) == min(instances, len(tasks))
+
+
+def test_failed_section_is_raised(fake_xfoil):
+    tasks = [(0, "particle_0", 0), (1, "broken", 1), (2, "particle_2", 2)]
+
+    with pytest.raises(RuntimeError, match="xfoil crashed"):
+        list(schedule_xfoil(FakeWorkerPool(), tasks, [0], (2.0, 1e6, 0.0)))
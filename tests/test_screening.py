@@ -0,0 +1,61 @@
+import numpy as np
+
+from src.data_modules.data_structures import Particle
+from src.objective_function import ObjectiveFunction
+from src.utilities.constants import SCREENED_OBJECTIVE_FUNCTION
+from src.utilities.naca_airfoils import naca_coordinates
+
+
+def create_particle(splines: list, variables: list) -> Particle:
+    """
+    Method responsible for creating a particle with the
+    given sections and variables.
+
+    :param splines: spline of each section
+    :param variables: variables of the particle
+    ...
+    :return: particle not evaluated
+    """
+    return Particle(
+        objective_function=0.0,
+        variables=np.array(variables, dtype=float),
+        velocity=np.zeros(len(variables)),
+        points_p=np.array([]),
+        points_a=np.array([]),
+        splines=splines,
+        results=dict(),
+    )
+
+
+def test_screen_rejects_only_the_degenerate_particles(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    airfoil = naca_coordinates("4412")
+    open_trailing_edge = airfoil.copy()
+    open_trailing_edge[1, 0] += 0.01
+    flat = np.array([airfoil[0], np.zeros(airfoil.shape[1])])
+
+    particles = {
+        0: create_particle([airfoil] * 7, [0.0] * 7),
+        1: create_particle([open_trailing_edge] * 7, [0.0, 0.01] + [0.02] * 5),
+        2: create_particle([airfoil] * 6 + [flat], [0.0] * 7),
+        3: create_particle([airfoil] * 6 + [None], [0.0] * 7),
+        4: create_particle([airfoil] * 7, [0.02, 0.0] + [0.02] * 5),
+    }
+
+    objective_function = ObjectiveFunction(
+        airfoil_name="naca 4412",
+        particles=particles,
+        flight_conditions=dict(),
+        propeller_geometry=dict(),
+        uuid="test",
+    )
+    feasible = objective_function._ObjectiveFunction__screen_particles()
+
+    assert feasible == [0, 1]
+    for particle_id in (2, 3, 4):
+        assert (
+            objective_function.particles[particle_id].objective_function
+            == SCREENED_OBJECTIVE_FUNCTION
+        )
+    assert objective_function.particles[0].objective_function == 0.0
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.surrogate_optimizer import GaussianProcess, SurrogateOptimizer
+
+
+def toy_function(x: np.ndarray) -> np.ndarray:
+    """
+    Method responsible for evaluating a 2-D toy function,
+    with its maximum at (0.3, 0.6).
+
+    :param x: array of shape (points, 2)
+    ...
+    :return: value of each point
+    """
+    return -((x[:, 0] - 0.3) ** 2) - 2 * (x[:, 1] - 0.6) ** 2
+
+
+def test_gaussian_process_interpolates_a_1d_function():
+    x = np.linspace(0, 1, 8)[:, None]
+    y = np.sin(6 * x[:, 0])
+
+    gaussian_process = GaussianProcess(np.zeros(1), np.ones(1))
+    gaussian_process.fit(x, y)
+
+    mean, std = gaussian_process.predict(x)
+    np.testing.assert_allclose(mean, y, atol=1e-2)
+    assert np.all(std < 0.05)
+
+    x_test = np.array([[0.2], [0.55], [0.9]])
+    mean, std = gaussian_process.predict(x_test)
+    np.testing.assert_allclose(mean, np.sin(6 * x_test[:, 0]), atol=0.1)
+    assert np.all(std > 0)
+
+
+def test_expected_improvement_picks_a_point_near_the_optimum():
+    grid = np.linspace(0, 1, 5)
+    x = np.array([[a, b] for a in grid for b in grid])
+    y = toy_function(x)
+
+    surrogate = SurrogateOptimizer.__new__(SurrogateOptimizer)
+    surrogate.lower, surrogate.upper = np.zeros(2), np.ones(2)
+    surrogate.quantity_of_candidates = 2000
+    surrogate.gaussian_process = GaussianProcess(surrogate.lower, surrogate.upper)
+    surrogate.gaussian_process.fit(x, y)
+
+    np.random.seed(0)
+    candidate, expected_improvement = (
+        surrogate._SurrogateOptimizer__maximize_expected_improvement(x, y)
+    )
+
+    assert np.linalg.norm(candidate - [0.3, 0.6]) < 0.1
+    assert expected_improvement > 0
+
+
+def test_surrogate_tolerance_stops_the_iterations(
+    quadratic_objective_function, tmp_path
+):
+    iterations = list()
+
+    for surrogate_tolerance in (1e9, 0.0):
+        data_reader = SimpleNamespace(
+            optimization_data={
+                "quantityOfParticles": 8,
+                "maximumIterations": 4,
+                "xfoilInstances": 2,
+                "surrogateCandidates": 200,
+                "surrogateTolerance": surrogate_tolerance,
+                "polarDatabase": "",
+                "scratchDirectory": str(tmp_path / "scratch"),
+            },
+            propeller_geometric_conditions=dict(),
+            flight_conditions=dict(),
+            airfoil_geometry=None,
+        )
+        np.random.seed(0)
+
+        optimizer = SurrogateOptimizer(data_reader, "test", str(tmp_path))
+        optimizer.set_initial_conditions()
+        optimizer.iterate()
+
+        iterations.append(sorted(optimizer.fo_per_time))
+
+    assert iterations == [[1, 2], [1, 2, 3, 4]]
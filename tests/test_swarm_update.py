@@ -0,0 +1,153 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.optimizer import PSO, penalize_constraints
+
+MAXIMUM_ITERATIONS = 10
+
+
+def create_swarm(tmp_path, constant_hyperparameters: bool) -> PSO:
+    """
+    Method responsible for creating an optimizer with a
+    seeded swarm, whose g_best is one of its particles.
+
+    :param tmp_path: temporary directory of the test
+    :param constant_hyperparameters: if the hyperparame-
+        ters are constant along the iterations
+    ...
+    :return: optimizer with the swarm arrays filled
+    """
+    data_reader = SimpleNamespace(
+        optimization_data={
+            "quantityOfParticles": 8,
+            "maximumIterations": MAXIMUM_ITERATIONS,
+            "constantHyperParameters": constant_hyperparameters,
+            "polarDatabase": "",
+            "scratchDirectory": str(tmp_path / "scratch"),
+        }
+    )
+    optimizer = PSO(data_reader, "test", str(tmp_path))
+
+    rng = np.random.default_rng(0)
+    swarm = optimizer.swarm
+    swarm.positions[:] = rng.uniform(-0.05, 0.05, swarm.positions.shape)
+    swarm.velocities[:] = rng.uniform(-0.01, 0.01, swarm.velocities.shape)
+    swarm.p_best[:] = rng.uniform(-0.05, 0.05, swarm.p_best.shape)
+    swarm.g_best_id = 5
+    swarm.g_best[:] = swarm.p_best[5]
+
+    return optimizer
+
+
+def reference_update(optimizer: PSO, t: int, ids: list) -> tuple:
+    """
+    Method responsible for updating the velocity and the
+    position of the particles one at a time, as the PSO
+    was first implemented, without inertia for the g_best.
+
+    :param optimizer: optimizer with the swarm arrays
+    :param t: the step iteration
+    :param ids: ids of the particles to be updated
+    ...
+    :return: velocities and positions of all the particles
+    """
+    swarm = optimizer.swarm
+    hyperparameters = optimizer.hyperparameters
+    velocities = swarm.velocities.copy()
+    positions = swarm.positions.copy()
+
+    for id_part in ids:
+        new_velocity = (
+            hyperparameters.get("c1")(t)
+            * hyperparameters.get("r")[0]
+            * (swarm.p_best[id_part] - positions[id_part])
+        ) + (
+            hyperparameters.get("c2")(t)
+            * hyperparameters.get("r")[1]
+            * (swarm.g_best - positions[id_part])
+        )
+
+        if id_part != swarm.g_best_id:
+            new_velocity += hyperparameters.get("w")(t) * velocities[id_part]
+
+        velocities[id_part] = new_velocity
+        positions[id_part] = positions[id_part] + new_velocity
+
+    return velocities, positions
+
+
+def reference_penalize(fo: float, x: np.ndarray) -> float:
+    """
+    Method responsible for penalizing the objective func-
+    tion of a single particle, as the constraints were
+    first implemented.
+
+    :param fo: objective function value
+    :param x: variables of the particle
+    ...
+    :return: new FO, penalized if needed
+    """
+    if (fo < 1) & (fo >= 0) and not any(x[0] > x_i for x_i in x):
+        return fo
+
+    if fo > 1:
+        penalty = np.random.uniform(1, fo)
+    elif fo < 0:
+        penalty = np.random.uniform(fo, 0)
+    else:
+        penalty = np.random.uniform(0, fo)
+
+    return fo - penalty
+
+
+def test_velocity_and_position_match_the_reference(tmp_path):
+    for constant_hyperparameters in (True, False):
+        for t in (1, 4, MAXIMUM_ITERATIONS):
+            for ids in (None, np.array([5]), np.array([0, 5, 7])):
+                optimizer = create_swarm(tmp_path, constant_hyperparameters)
+                reference_ids = range(8) if ids is None else ids
+                velocities, positions = reference_update(optimizer, t, reference_ids)
+
+                optimizer._PSO__update_velocity(t, ids)
+                optimizer._PSO__update_variables(ids)
+
+                np.testing.assert_allclose(
+                    optimizer.swarm.velocities, velocities, rtol=1e-12
+                )
+                np.testing.assert_allclose(
+                    optimizer.swarm.positions, positions, rtol=1e-12
+                )
+
+
+def test_g_best_moves_without_inertia(tmp_path):
+    optimizer = create_swarm(tmp_path, constant_hyperparameters=True)
+    swarm = optimizer.swarm
+    swarm.positions[5] = swarm.g_best
+    swarm.p_best[5] = swarm.g_best
+
+    optimizer._PSO__update_velocity(3)
+
+    np.testing.assert_array_equal(swarm.velocities[5], 0.0)
+    assert np.all(swarm.velocities[:5] != 0.0)
+
+
+def test_penalty_matches_the_reference():
+    rng = np.random.default_rng(1)
+    fo = np.array([0.5, 0.7, 1.0, 1.8, -0.4, 0.3, 0.0, 0.95])
+    x = rng.uniform(0.0, 0.05, size=(len(fo), 7))
+    x[[0, 3, 7], 0] = -0.01
+    x[5, 0] = 0.1
+
+    np.random.seed(2)
+    penalized = penalize_constraints(fo, x)
+
+    np.random.seed(2)
+    expected = [reference_penalize(fo_i, x_i) for fo_i, x_i in zip(fo, x)]
+
+    np.testing.assert_allclose(penalized, expected, rtol=1e-12)
+    assert penalized[0] == fo[0] and penalized[7] == fo[7]
+    assert 0.0 <= penalized[3] <= fo[3] - 1.0
+    assert fo[4] <= penalized[4] <= 0.0
+    violated = [1, 2, 5, 6]
+    assert np.all((penalized[violated] >= 0) & (penalized[violated] <= fo[violated]))
@@ -0,0 +1,90 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.utilities.timeout_policy import TimeoutPolicy
+
+
+def record_runs(policy: TimeoutPolicy, configuration: tuple, run_times) -> None:
+    """
+    Method responsible for recording completed runs of a
+    configuration, none of them falling back.
+
+    :param policy: timeout policy
+    :param configuration: configuration key
+    :param run_times: run times of the runs, in seconds
+    """
+    for run_time in run_times:
+        policy.record(
+            configuration,
+            {"runTime": run_time, "timedOut": False, "killed": False},
+            fallback=False,
+        )
+
+
+def test_initial_deadline_is_used_until_the_warm_up():
+    policy = TimeoutPolicy.from_optimization_data({"timeoutInitial": 3.0})
+    configuration = TimeoutPolicy.configuration(200, 200, 123456.0)
+
+    assert configuration == (200, 200, 123000.0)
+    assert policy.timeout(configuration) == 3.0
+
+    record_runs(policy, configuration, [0.5] * 19)
+    for _ in range(5):
+        policy.record(
+            configuration, {"runTime": 3.0, "timedOut": True, "killed": True}, True
+        )
+
+    assert policy.timeout(configuration) == 3.0
+    assert policy.timeout(TimeoutPolicy.configuration(200, 200, 2e6)) == 3.0
+
+    record_runs(policy, configuration, [0.5])
+
+    assert policy.timeout(configuration) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("scale, deadline", [(1.0, None), (0.01, 0.25), (10.0, 5.0)])
+def test_deadline_is_the_clamped_percentile(scale, deadline):
+    policy = TimeoutPolicy(percentile=90.0, factor=1.5, minimum=0.25, maximum=5.0)
+    run_times = scale * np.linspace(0.5, 1.5, 40)
+
+    record_runs(policy, (200, 200, 1e6), run_times)
+
+    if deadline is None:
+        deadline = 1.5 * np.percentile(run_times, 90.0)
+        assert 0.25 < deadline < 5.0
+
+    assert policy.timeout((200, 200, 1e6)) == pytest.approx(deadline)
+
+
+def test_deadline_follows_the_latest_runs():
+    policy = TimeoutPolicy(factor=1.0, warm_up=5, window=10)
+
+    record_runs(policy, (200, 200, 1e6), [4.0] * 10 + [0.5] * 10)
+
+    assert policy.timeout((200, 200, 1e6)) == pytest.approx(0.5)
+
+
+def test_counters_add_up():
+    policy = TimeoutPolicy()
+    runs = [
+        ({"runTime": 0.1, "timedOut": False, "killed": False}, False),
+        ({"runTime": 0.2, "timedOut": False, "killed": False}, True),
+        ({"runTime": 1.0, "timedOut": True, "killed": False}, False),
+        ({"runTime": 1.0, "timedOut": True, "killed": True}, True),
+        ({"runTime": 1.0, "timedOut": True, "killed": True}, True),
+    ]
+
+    for run, fallback in runs:
+        policy.record((200, 200, 1e6), run, fallback)
+
+    policy = pickle.loads(pickle.dumps(policy))
+
+    assert (policy.runs, policy.timeouts, policy.kills) == (5, 3, 2)
+    assert (policy.fallbacks, policy.timeout_fallbacks) == (3, 2)
+    assert policy.timeouts <= policy.runs and policy.kills <= policy.timeouts
+    assert policy.timeout_fallbacks <= min(policy.timeouts, policy.fallbacks)
+    assert "5 runs, 3 timeouts, 2 kills, 3 fallbacks (2 caused by timeouts)" in (
+        policy.report()
+    )
@@ -0,0 +1,108 @@
+import os
+
+import numpy as np
+
+from src.utilities.scratch_workspace import ScratchWorkspace
+from src.utilities.xfoil_management import XfoilManagement
+from src.utilities.xfoil_sandbox import sandbox_directory
+from src.utilities.xfoil_session import XfoilSession
+
+
+def run_polar(monkeypatch, tmp_path, points: list, viscous: bool) -> list:
+    """
+    Method responsible for executing a polar against a
+    session which only keeps the commands it receives.
+
+    :param points: operating points of the polar
+    :param viscous: viscous state of the session
+    ...
+    :return: lines of xfoil commands of the polar
+    """
+    commands = list()
+
+    def run(session, session_commands, *args, **kwargs):
+        commands.extend(session_commands(viscous))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(XfoilSession, "run", run)
+
+    polar = XfoilManagement.execute_xfoil_polar("airfoil.dat", points, 100)
+
+    assert np.all(polar[:, 3:5] == (0, 1))
+
+    return commands
+
+
+def test_polar_sequences_the_angles_of_each_group(monkeypatch, tmp_path):
+    commands = run_polar(
+        monkeypatch,
+        tmp_path,
+        [[2.0, 1e6, 0.0], [0.0, 1e6, 0.0], [1.0, 1e6, 0.0], [4.0, 1e6, 0.0]],
+        viscous=False,
+    )
+
+    assert commands.count("visc 1000000.0") == 1
+    assert "aseq 0.0 2.0 1.0" in commands
+    assert "alfa 4.0" in commands
+    assert commands.index("aseq 0.0 2.0 1.0") < commands.index("G000")
+
+
+def test_polar_toggles_the_viscous_solution_once(monkeypatch, tmp_path):
+    points = [[5.0, 1e6, 0.0], [5.0, 2e6, 0.0]]
+
+    commands = run_polar(monkeypatch, tmp_path, points, viscous=False)
+    assert [line.split()[0] for line in commands if line[:3] in ("re ", "vis")] == [
+        "visc",
+        "re",
+    ]
+
+    commands = run_polar(monkeypatch, tmp_path, points, viscous=True)
+    assert not any(line.startswith("visc") for line in commands)
+
+
+def test_polar_file_reads_the_pacc_file_of_each_group(monkeypatch, tmp_path):
+    runs = list()
+
+    def execute_xfoil_file(xfoil):
+        with open(xfoil.input_filename) as file:
+            commands = file.read().split("\n")
+        runs.append(commands)
+
+        for line, command in enumerate(commands):
+            reynolds = [c for c in commands[:line] if c[:3] in ("re ", "vis")]
+            if command != "pacc" or not commands[line + 1].endswith(".txt"):
+                continue
+            if reynolds[-1] != "visc 1000000.0":
+                continue
+
+            with open(
+                os.path.join(sandbox_directory(0), commands[line + 1]), "w"
+            ) as file:
+                file.write("header\n" * 12)
+                file.write("  0.000  0.4000  0.00800  0.0  0.0  0.5  0.5\n")
+                file.write("  1.000  0.5000 -0.00900  0.0  0.0  0.5  0.5\n")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        XfoilManagement, "_XfoilManagement__execute_xfoil_file", execute_xfoil_file
+    )
+    scratch_workspace = ScratchWorkspace(str(tmp_path / "scratch"))
+
+    polar = XfoilManagement.execute_xfoil_polar(
+        "airfoil.dat",
+        [[1.0, 1e6, 0.0], [0.0, 1e6, 0.0], [2.0, 1e6, 0.0], [5.0, 2e6, 0.0]],
+        100,
+        session=False,
+        scratch_workspace=scratch_workspace,
+    )
+
+    assert len(runs) == 1
+    assert runs[0].count("pacc") == 4
+    assert [line for line in runs[0] if line[:3] in ("re ", "vis")] == [
+        "visc 1000000.0",
+        "re 2000000.0",
+    ]
+    np.testing.assert_array_equal(
+        polar[:, 3:], [[0.5, 0.009, 1], [0.4, 0.008, 1], [0, 1, 0], [0, 1, 0]]
+    )
+    assert not os.listdir(scratch_workspace.directory)
@@ -0,0 +1,80 @@
+import os
+
+import psutil
+import pytest
+
+from src.utilities.xfoil_sandbox import available_cpus
+
+
+def write_cgroup(directory, files: dict) -> str:
+    """
+    Method responsible for writing a fake cgroup hierarchy
+    with the given control files.
+
+    :param directory: temporary directory
+    :param files: content of the control files, by their
+        path relative to the cgroup mount point
+    ...
+    :return: path of the fake cgroup mount point
+    """
+    cgroup_directory = directory / "cgroup"
+
+    for path, content in files.items():
+        (cgroup_directory / path).parent.mkdir(parents=True, exist_ok=True)
+        (cgroup_directory / path).write_text(content)
+
+    return str(cgroup_directory)
+
+
+@pytest.fixture
+def eight_cpus(monkeypatch):
+    """
+    Method responsible for giving the process an affinity
+    mask of eight CPUs.
+    """
+
+    class Process:
+        def cpu_affinity(self) -> list:
+            return list(range(8))
+
+    monkeypatch.setattr(psutil, "Process", Process)
+
+
+@pytest.mark.parametrize(
+    "files, cpus",
+    [
+        ({"cpu.max": "max 100000\n"}, 8),
+        ({"cpu.max": "200000 100000\n"}, 2),
+        ({"cpu.max": "50000 100000\n"}, 1),
+        ({"cpu.max": "1600000 100000\n"}, 8),
+        (
+            {"cpu/cpu.cfs_quota_us": "-1\n", "cpu/cpu.cfs_period_us": "100000\n"},
+            8,
+        ),
+        (
+            {"cpu/cpu.cfs_quota_us": "300000\n", "cpu/cpu.cfs_period_us": "100000\n"},
+            3,
+        ),
+        ({"cpu/cpu.cfs_quota_us": "300000\n"}, 8),
+        ({}, 8),
+    ],
+)
+def test_cgroup_quota_bounds_the_cpus(eight_cpus, tmp_path, files, cpus):
+    assert available_cpus(write_cgroup(tmp_path, files)) == cpus
+
+
+def test_cpu_count_is_used_without_affinity(monkeypatch, tmp_path):
+    class Process:
+        def cpu_affinity(self) -> list:
+            raise psutil.AccessDenied()
+
+    monkeypatch.setattr(psutil, "Process", Process)
+    monkeypatch.setattr(os, "cpu_count", lambda: 6)
+    quota = write_cgroup(tmp_path / "quota", {"cpu.max": "400000 100000"})
+    assert available_cpus(quota) == 4
+
+    monkeypatch.delattr(Process, "cpu_affinity")
+    assert available_cpus(write_cgroup(tmp_path / "empty", {})) == 6
+
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert available_cpus(write_cgroup(tmp_path / "empty", {})) == 1